@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+포트폴리오 문서 생성기 벤치마크
+현재 콘텐츠의 경력/프로젝트 목록을 1배, 10배, 100배, 1000배로 늘린 합성 콘텐츠로
+PDF/DOCX/PPTX 생성기를 실행하고 단계별 시간(폰트 등록, 스타일 생성, 요소/슬라이드 생성,
+레이아웃, 저장)을 측정해 JSON으로 저장합니다.
+결과 파일끼리 비교(--compare)하면 커밋 간 성능 변화를 확인할 수 있습니다.
+--stream both로 기존 방식(전체 객체 트리)과 스트리밍 작성기를 같은 배율에서 나란히 측정합니다.
+
+- 측정마다 새 프로세스에서 실행하므로 폰트 등록 등 프로세스 캐시가 없는 상태의 시간이 기록됩니다.
+  (디스크 캐시 doc/.cache는 그대로 사용)
+- 출력 문서는 임시 디렉토리에 만들고 크기만 기록합니다.
+- 최대 메모리는 워커 프로세스의 최대 RSS입니다 (resource 모듈이 없는 Windows에서는 기록하지 않음).
+- 결과 위치(기본): doc/.cache/benchmarks/benchmark-<시각>.json
+
+사용 방법:
+    python doc/benchmark_portfolio.py                          # 전체 (1000배는 수 분 걸림)
+    python doc/benchmark_portfolio.py --scales 1,10 --formats pdf
+    python doc/benchmark_portfolio.py --repeat 3 --output before.json
+    python doc/benchmark_portfolio.py --scales 1,10 --compare before.json
+    python doc/benchmark_portfolio.py --scales 1,10,100 --formats docx,pptx --stream both
+"""
+
+import argparse
+import contextlib
+import copy
+import importlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# 현재 스크립트의 디렉토리를 기준으로 경로 설정
+SCRIPT_DIR = Path(__file__).parent.absolute()
+DOC_DIR = SCRIPT_DIR
+ROOT_DIR = SCRIPT_DIR.parent
+
+# 워커 프로세스에서도 doc/ 모듈을 import할 수 있도록 경로 추가
+if str(SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_DIR))
+
+from portfolio_content import load_content
+from portfolio_profile import record_phases
+from build_portfolio import RENDERERS
+
+RESULTS_DIR = DOC_DIR / ".cache" / "benchmarks"
+
+# 결과 JSON 형식이 바뀌면 올립니다.
+BENCHMARK_VERSION = 2
+
+DEFAULT_SCALES = (1, 10, 100, 1000)
+
+# --stream 옵션 -> 생성 함수의 stream 인자 목록 (None: 항목 수에 따라 자동)
+STREAM_MODES = {
+    'auto': [None],
+    'off': [False],
+    'on': [True],
+    'both': [False, True],
+}
+
+# 버전을 기록할 라이브러리 (import 이름)
+LIBRARIES = ('reportlab', 'docx', 'pptx', 'fontTools')
+
+
+def scale_content(content, factor):
+    """
+    경력/프로젝트 목록을 factor배로 늘린 합성 콘텐츠
+    복제본은 키와 제목에 번호를 붙여 서로 다른 항목이 되도록 합니다.
+    """
+    scaled = copy.copy(content)
+    scaled.experiences = []
+    scaled.projects = []
+    for copy_index in range(factor):
+        suffix = f" #{copy_index + 1}" if copy_index else ""
+        for exp in content.experiences:
+            item = copy.copy(exp)
+            item.key = f"{exp.key}-{copy_index}"
+            item.company = f"{exp.company}{suffix}"
+            scaled.experiences.append(item)
+        for project in content.projects:
+            item = copy.copy(project)
+            item.key = f"{project.key}-{copy_index}"
+            item.title = f"{project.title}{suffix}"
+            scaled.projects.append(item)
+    return scaled
+
+
+def _peak_rss_mb():
+    """현재 프로세스의 최대 RSS (MB, 측정할 수 없으면 None)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def run_case(fmt, scale, lang='ko', stream=None):
+    """
+    형식 하나 × 배율 하나를 측정 (워커 프로세스에서 실행)
+    반환값: {'format', 'scale', 'stream', 'experiences', 'projects', 'phases', 'total',
+             'output_bytes', 'peak_rss_mb', 'error'}
+    """
+    content = scale_content(load_content(lang), scale)
+    module_name, func_name = RENDERERS[fmt]
+    result = {'format': fmt, 'scale': scale, 'stream': stream, 'experiences': len(content.experiences),
+              'projects': len(content.projects), 'phases': {}, 'total': 0.0,
+              'output_bytes': None, 'peak_rss_mb': None, 'error': None}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output = Path(tmp_dir) / f"benchmark.{fmt}"
+        started = time.perf_counter()
+        try:
+            # 생성기의 진행 메시지는 숨김
+            with record_phases() as recorder, contextlib.redirect_stdout(io.StringIO()):
+                module = importlib.import_module(module_name)
+                getattr(module, func_name)(lang=lang, filename=output, content=content, stream=stream)
+            result['output_bytes'] = output.stat().st_size
+        except Exception as e:
+            result['error'] = f"{type(e).__name__}: {e}"
+        result['total'] = round(time.perf_counter() - started, 6)
+        result['phases'] = recorder.as_dict()
+    result['peak_rss_mb'] = _peak_rss_mb()
+    return result
+
+
+def measure(fmt, scale, lang='ko', repeat=1, stream=None):
+    """새 프로세스에서 repeat번 측정하고 전체 시간이 가장 짧은 결과를 반환"""
+    best = None
+    for _ in range(repeat):
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            result = executor.submit(run_case, fmt, scale, lang, stream).result()
+        if result['error']:
+            return result
+        if best is None or result['total'] < best['total']:
+            best = result
+    best['repeat'] = repeat
+    return best
+
+
+def _git_commit():
+    """현재 git 커밋 (git이 없으면 None)"""
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR,
+                             capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _library_versions():
+    """측정 환경의 라이브러리 버전"""
+    versions = {}
+    for name in LIBRARIES:
+        try:
+            module = importlib.import_module(name)
+            versions[name] = getattr(module, 'Version', None) or getattr(module, '__version__', None)
+        except ImportError:
+            versions[name] = None
+    return versions
+
+
+def run_benchmark(formats=None, scales=DEFAULT_SCALES, lang='ko', repeat=1, streams=(None,)):
+    """전체 벤치마크 실행, 결과 딕셔너리 반환 (streams: 측정할 stream 인자 목록)"""
+    formats = list(formats or RENDERERS)
+    # 워커들이 파싱 없이 디스크 캐시를 읽도록 콘텐츠 모델을 먼저 준비
+    load_content(lang)
+
+    report = {
+        'version': BENCHMARK_VERSION,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'libraries': _library_versions(),
+        'lang': lang,
+        'results': [],
+    }
+    for scale in scales:
+        for fmt in formats:
+            for stream in streams:
+                result = measure(fmt, scale, lang, repeat, stream)
+                report['results'].append(result)
+                print_result(result)
+    return report
+
+
+def print_result(result):
+    """측정 결과 한 줄 출력"""
+    label = f"{result['format']:<5} x{result['scale']:<5}{_stream_label(result):<7}"
+    if result['error']:
+        print(f"   ❌ {label} {result['error']}")
+        return
+    phases = ' '.join(f"{name}={seconds:.3f}" for name, seconds in result['phases'].items())
+    size_kb = (result['output_bytes'] or 0) / 1024
+    rss = f"{result['peak_rss_mb']:7.1f}MB" if result.get('peak_rss_mb') is not None else ''
+    print(f"   ✅ {label} {result['total']:8.3f}s  {size_kb:9.1f}KB {rss}  {phases}")
+
+
+def _stream_label(result):
+    """결과의 stream 인자 표시 (자동이면 빈 문자열)"""
+    stream = result.get('stream')
+    return '' if stream is None else ' stream' if stream else ' tree'
+
+
+def compare(report, baseline):
+    """두 결과의 형식 × 배율(× stream)별 전체 시간 비교 출력"""
+    before = {(r['format'], r['scale'], r.get('stream')): r
+              for r in baseline.get('results', []) if not r.get('error')}
+    print(f"\n📈 비교: {baseline.get('commit') or '-'} → {report.get('commit') or '-'}")
+    for result in report['results']:
+        old = before.get((result['format'], result['scale'], result.get('stream')))
+        if result['error'] or old is None:
+            continue
+        ratio = result['total'] / old['total'] if old['total'] else float('inf')
+        mark = '🔺' if ratio > 1.1 else '🔻' if ratio < 0.9 else '  '
+        print(f"   {mark} {result['format']:<5} x{result['scale']:<5}{_stream_label(result):<7} "
+              f"{old['total']:8.3f}s → {result['total']:8.3f}s  ({ratio:.2f}x)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="포트폴리오 문서 생성기 벤치마크")
+    parser.add_argument('--formats', default=','.join(RENDERERS),
+                        help="측정할 형식 (쉼표 구분, 기본: pdf,docx,pptx)")
+    parser.add_argument('--scales', default=','.join(str(s) for s in DEFAULT_SCALES),
+                        help="경력/프로젝트 배율 (쉼표 구분, 기본: 1,10,100,1000)")
+    parser.add_argument('--lang', default='ko', help="콘텐츠 언어 (기본: ko)")
+    parser.add_argument('--repeat', type=int, default=1, help="측정 반복 횟수 (가장 빠른 결과 사용)")
+    parser.add_argument('--output', default=None, help="결과 JSON 경로 (기본: doc/.cache/benchmarks/)")
+    parser.add_argument('--compare', default=None, help="비교할 이전 결과 JSON")
+    parser.add_argument('--stream', default='auto', choices=list(STREAM_MODES),
+                        help="스트리밍 작성기 사용 (auto: 항목 수에 따라, both: 기존 방식과 나란히 측정)")
+    args = parser.parse_args(argv)
+
+    formats = [fmt.strip() for fmt in args.formats.split(',') if fmt.strip()]
+    unknown = [fmt for fmt in formats if fmt not in RENDERERS]
+    if unknown:
+        print(f"❌ 지원하지 않는 형식입니다: {', '.join(unknown)} (지원: {', '.join(RENDERERS)})")
+        return 2
+    scales = [int(scale) for scale in args.scales.split(',') if scale.strip()]
+
+    print(f"⏱️  벤치마크: {', '.join(formats)} × {', '.join(f'x{s}' for s in scales)} (반복 {args.repeat}회)")
+    report = run_benchmark(formats, scales, lang=args.lang, repeat=max(1, args.repeat),
+                           streams=STREAM_MODES[args.stream])
+
+    if args.output:
+        output = Path(args.output)
+    else:
+        output = RESULTS_DIR / f"benchmark-{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+    print(f"\n📁 결과 저장: {output}")
+
+    if args.compare:
+        compare(report, json.loads(Path(args.compare).read_text(encoding='utf-8')))
+    return 1 if any(r['error'] for r in report['results']) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
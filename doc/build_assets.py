@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+웹사이트 정적 자산 최적화 빌드
+index.html, css/style.css, js/app.js를 압축(minify)하고, CSS/JS 파일명에 내용 해시를 넣어
+(css/style.<hash>.css) index.html의 참조를 바꾼 배포용 사이트를 dist/에 만듭니다.
+파일명이 내용에 따라 바뀌므로 CSS/JS는 브라우저/CDN에 오래 캐시해도 됩니다.
+텍스트 자산에는 미리 압축한 .gz / .br 파일을 옆에 함께 저장합니다 (정적 서버의 gzip_static 등에서 사용).
+
+- 압축: 외부 라이브러리 없이 주석/공백만 안전하게 줄입니다.
+  문자열/템플릿 리터럴/정규식 안은 건드리지 않고, JS 줄바꿈은 자동 세미콜론 삽입(ASI) 때문에 남겨 둡니다.
+- brotli: pip install brotli (없으면 .br 없이 .gz만 만듭니다)
+- index.html이 참조하는 그 밖의 로컬 파일과 img/, locales/는 그대로 복사합니다 (바뀐 파일만).
+- 언어별 사전 렌더링 페이지(ko.html, en.html, doc/build_pages.py)도 같이 처리하고,
+  기본 언어 페이지(ENTRY_PAGE)를 dist/index.html로 내보내 / 로 들어온 방문자가 번역이 끝난 페이지를 바로 받습니다.
+  원본 index.html은 PDF/DOCX/PPTX 생성과 빌드 스크립트가 읽는 원본으로만 쓰고 배포하지 않습니다.
+- GitHub Pages에는 저장소 루트가 아니라 이 dist/를 배포합니다 (.github/workflows/pages.yml).
+  (저장소 루트를 그대로 열면 index.html의 <head> 스크립트가 저장/브라우저 언어의 페이지로 한 번 더 이동합니다.)
+- 첫 화면(네비게이션/히어로)에 필요한 규칙은 doc/critical_css.py로 골라 <head>에 <style>로 넣고,
+  전체 스타일시트는 <link rel="preload">로 비동기로 불러옵니다 (JS가 꺼져 있으면 <noscript>의 <link>).
+
+사용 방법:
+    python doc/build_assets.py            # dist/ 생성, 크기 비교 출력
+    python doc/build_assets.py --no-critical   # critical CSS 인라인 없이 (스타일시트를 기다림)
+    python -m http.server -d dist         # 결과 확인
+"""
+
+import argparse
+import gzip
+import hashlib
+import re
+import shutil
+import sys
+from pathlib import Path
+
+# 현재 스크립트의 디렉토리를 기준으로 경로 설정
+SCRIPT_DIR = Path(__file__).parent.absolute()
+DOC_DIR = SCRIPT_DIR
+ROOT_DIR = SCRIPT_DIR.parent
+
+DIST_DIR = ROOT_DIR / "dist"
+INDEX_HTML = ROOT_DIR / "index.html"
+
+# 함께 압축하는 언어별 사전 렌더링 페이지 (doc/build_pages.py, 있을 때만)
+PRERENDERED_HTML = ('ko.html', 'en.html')
+
+# dist/index.html로 내보내는 사전 렌더링 페이지 (기본 언어, js/app.js의 기본값 'ko'와 같음)
+ENTRY_PAGE = 'ko.html'
+
+# 내용 해시를 파일명에 넣는 자산 (사이트 루트 기준 경로)
+FINGERPRINTED = ('css/style.css', 'js/app.js')
+
+# 통째로 복사하는 디렉토리 (app.js가 실행 중에 경로를 만들어 참조,
+# projects/는 doc/build_pages.py의 카드 조각, search/는 doc/build_search.py의 검색 색인)
+COPY_DIRS = ('img', 'locales', 'projects', 'search')
+
+# 파일명에 넣는 내용 해시 길이
+HASH_LENGTH = 10
+
+# 미리 압축해 둘 텍스트 자산 확장자
+COMPRESSIBLE = ('.html', '.css', '.js', '.json', '.svg')
+
+# 이 크기보다 작은 파일은 압축하지 않음 (헤더 때문에 오히려 커짐)
+MIN_COMPRESS_BYTES = 512
+
+# 압축 라이브러리가 없다는 경고는 한 번만 출력
+_warned = set()
+
+
+def _warn_once(key, message):
+    if key not in _warned:
+        _warned.add(key)
+        print(message)
+
+
+# --- CSS ---
+
+_CSS_TOKENS = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|/\*.*?\*/', re.S)
+
+
+def minify_css(source):
+    """CSS 주석/공백 제거 (문자열 안은 그대로, calc()의 +/- 주변 공백과 선택자 앞 공백은 유지)"""
+    strings = []
+
+    def protect(match):
+        if match.group(1) is None:
+            return ''
+        strings.append(match.group(1))
+        return f"\0{len(strings) - 1}\0"
+
+    css = _CSS_TOKENS.sub(protect, source)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    css = css.replace(';}', '}')
+    css = re.sub(r'\0(\d+)\0', lambda m: strings[int(m.group(1))], css)
+    return css.strip()
+
+
+# --- JavaScript ---
+
+# 이 문자 다음의 /는 나눗셈이 아니라 정규식 시작
+_REGEX_PREFIX_CHARS = set('(,=:[!&|?{};+-*%<>~^')
+_REGEX_PREFIX_WORDS = {'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete',
+                       'void', 'throw', 'instanceof', 'yield', 'await'}
+
+# 이 문자 주변의 공백은 지워도 의미가 바뀌지 않음
+_JS_PUNCTUATION = set('{}()[];,:=<>?!&|+-*/%')
+
+# 공백을 지우면 다른 연산자/주석이 되는 조합 (a - -b, a + +b, a / /re/)
+_JS_KEEP_PAIRS = {'++', '--', '+-', '-+', '//', '/*', '*/'}
+
+
+def _js_tokens(source):
+    """JS 소스를 ('code'|'literal', 텍스트) 조각으로 나눔 (주석은 버리고, 주석이 줄을 나누면 줄바꿈 유지)"""
+    tokens = []
+    code = []
+    i, n = 0, len(source)
+
+    def previous_significant():
+        text = ''.join(code).rstrip()
+        if text:
+            return text
+        for kind, value in reversed(tokens):
+            if value.strip():
+                return value if kind == 'code' else 'x'
+        return ''
+
+    def flush():
+        if code:
+            tokens.append(('code', ''.join(code)))
+            code.clear()
+
+    while i < n:
+        char = source[i]
+        nxt = source[i + 1] if i + 1 < n else ''
+        if char == '/' and nxt == '/':
+            end = source.find('\n', i)
+            i = n if end == -1 else end
+        elif char == '/' and nxt == '*':
+            end = source.find('*/', i + 2)
+            comment = source[i:n if end == -1 else end + 2]
+            code.append('\n' if '\n' in comment else ' ')
+            i += len(comment)
+        elif char in '\'"`':
+            j = i + 1
+            while j < n and source[j] != char:
+                if source[j] == '\\':
+                    j += 1
+                elif char != '`' and source[j] == '\n':
+                    break
+                j += 1
+            flush()
+            tokens.append(('literal', source[i:j + 1]))
+            i = j + 1
+        elif char == '/':
+            before = previous_significant()
+            word = re.search(r'[A-Za-z_$][\w$]*$', before)
+            if not before or before[-1] in _REGEX_PREFIX_CHARS or (word and word.group() in _REGEX_PREFIX_WORDS):
+                j, in_class = i + 1, False
+                while j < n and source[j] != '\n':
+                    if source[j] == '\\':
+                        j += 1
+                    elif source[j] == '[':
+                        in_class = True
+                    elif source[j] == ']':
+                        in_class = False
+                    elif source[j] == '/' and not in_class:
+                        break
+                    j += 1
+                j += 1
+                while j < n and (source[j].isalnum() or source[j] == '_'):
+                    j += 1
+                flush()
+                tokens.append(('literal', source[i:j]))
+                i = j
+            else:
+                code.append(char)
+                i += 1
+        else:
+            code.append(char)
+            i += 1
+    flush()
+    return tokens
+
+
+def _squeeze_js_code(text, before='', after=''):
+    """
+    코드 조각의 들여쓰기/빈 줄/연산자 주변 공백 제거 (줄바꿈은 유지)
+    before/after: 앞뒤 리터럴의 맞닿은 글자 (조각 끝의 공백도 지울 수 있는지 판단)
+    """
+    text = before + text + after
+    text = re.sub(r'[ \t]*\n\s*', '\n', text)
+    text = re.sub(r'[ \t]+', ' ', text)
+
+    def space(match):
+        left, right = match.groups()
+        if (left in _JS_PUNCTUATION or right in _JS_PUNCTUATION) and left + right not in _JS_KEEP_PAIRS:
+            return ''
+        return ' '
+
+    text = re.sub(r'(?<=(.)) (?=(.))', space, text)
+    return text[len(before):len(text) - len(after)]
+
+
+def minify_js(source):
+    """JS 주석/들여쓰기/불필요한 공백 제거 (문자열/템플릿/정규식은 그대로, 줄바꿈 유지)"""
+    tokens = _js_tokens(source)
+    pieces = []
+    for index, (kind, text) in enumerate(tokens):
+        if kind == 'code':
+            before = tokens[index - 1][1][-1:] if index > 0 else ''
+            after = tokens[index + 1][1][:1] if index + 1 < len(tokens) else ''
+            text = _squeeze_js_code(text, before, after)
+        pieces.append(text)
+    js = ''.join(pieces)
+    return re.sub(r'\n+', '\n', js).strip() + '\n'
+
+
+# --- HTML ---
+
+_HTML_BLOCKS = re.compile(r'<!--(?!\[if).*?-->|<(script|style|pre|textarea)\b[^>]*>.*?</\1\s*>', re.S | re.I)
+
+
+def _minify_html_block(block):
+    """<script>/<style> 안의 코드 압축, <pre>/<textarea>는 그대로"""
+    match = re.match(r'<(script|style)\b([^>]*)>(.*)</\1\s*>$', block, re.S | re.I)
+    if not match or not match.group(3).strip():
+        return block
+    tag, attrs, body = match.groups()
+    if tag.lower() == 'style':
+        return f"<{tag}{attrs}>{minify_css(body)}</{tag}>"
+    script_type = re.search(r'type\s*=\s*["\']?([^"\'\s>]+)', attrs)
+    if script_type and 'javascript' not in script_type.group(1) and script_type.group(1) != 'module':
+        return block
+    return f"<{tag}{attrs}>{minify_js(body).strip()}</{tag}>"
+
+
+def minify_html(source):
+    """HTML 주석 제거, 연속 공백을 하나로 (pre/textarea는 그대로, script/style은 안의 코드 압축)"""
+    out = []
+    last = 0
+    for match in _HTML_BLOCKS.finditer(source):
+        out.append(re.sub(r'\s+', ' ', source[last:match.start()]))
+        if not match.group(0).startswith('<!--'):
+            out.append(_minify_html_block(match.group(0)))
+        last = match.end()
+    out.append(re.sub(r'\s+', ' ', source[last:]))
+    return ''.join(out).strip() + '\n'
+
+
+MINIFIERS = {
+    '.css': minify_css,
+    '.js': minify_js,
+    '.html': minify_html,
+}
+
+
+# --- 압축/파일명 ---
+
+def compress(path, data):
+    """path 옆에 .gz / .br 저장 (작아질 때만), 반환값: {'gz': 크기, 'br': 크기}"""
+    sizes = {}
+    if path.suffix not in COMPRESSIBLE or len(data) < MIN_COMPRESS_BYTES:
+        return sizes
+    variants = {'gz': gzip.compress(data, compresslevel=9, mtime=0)}
+    try:
+        import brotli
+        variants['br'] = brotli.compress(data, quality=11)
+    except ImportError:
+        _warn_once('brotli', "⚠️ brotli가 설치되지 않아 .br 파일은 만들지 않습니다. (pip install brotli)")
+    for suffix, compressed in variants.items():
+        target = path.with_name(f"{path.name}.{suffix}")
+        if len(compressed) < len(data):
+            _write_if_changed(target, compressed)
+            sizes[suffix] = len(compressed)
+        elif target.exists():
+            target.unlink()
+    return sizes
+
+
+def fingerprint_name(relative, data):
+    """내용 해시를 넣은 파일명 (css/style.css -> css/style.<hash>.css)"""
+    path = Path(relative)
+    digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+    return (path.parent / f"{path.stem}.{digest}{path.suffix}").as_posix()
+
+
+def _write_if_changed(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists() and path.read_bytes() == data:
+        return False
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(data)
+    tmp_path.replace(path)
+    return True
+
+
+def _copy_if_changed(source, target):
+    if target.exists():
+        src, dst = source.stat(), target.stat()
+        if src.st_size == dst.st_size and src.st_mtime_ns == dst.st_mtime_ns:
+            return False
+    target.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copy2(source, target)
+    return True
+
+
+def rewrite_references(html, renames):
+    """index.html의 href/src 참조를 해시 파일명으로 교체 (?v= 같은 쿼리는 버림)"""
+    for original, renamed in renames.items():
+        pattern = re.compile(r'((?:href|src)\s*=\s*["\']?)(?:\./|/)?' + re.escape(original) + r'(?:\?[^"\'\s>]*)?')
+        html = pattern.sub(lambda m: m.group(1) + renamed, html)
+    return html
+
+
+def local_references(html):
+    """index.html이 참조하는 로컬 파일 (외부 URL, 앵커, data: 제외)"""
+    refs = []
+    for ref in re.findall(r'(?:href|src)\s*=\s*["\']([^"\']+)["\']', html):
+        if re.match(r'^(?:[a-z]+:|//|#)', ref, re.I):
+            continue
+        ref = ref.split('?')[0].split('#')[0].lstrip('./')
+        if ref and ref not in refs:
+            refs.append(ref)
+    return refs
+
+
+def inline_critical_css(html, stylesheet, critical):
+    """
+    stylesheet를 불러오는 <link>를 critical CSS <style> + 비동기 <link rel="preload">로 교체
+    (전체 스타일시트를 그대로 불러오므로 규칙 순서/우선순위는 원래와 같음)
+    """
+    pattern = re.compile(r'<link\b[^>]*\bhref\s*=\s*["\']?' + re.escape(stylesheet) + r'["\'\s>][^>]*>')
+    match = pattern.search(html)
+    if not match or 'stylesheet' not in match.group(0):
+        print(f"⚠️ index.html에서 {stylesheet} <link>를 찾지 못해 critical CSS를 넣지 않습니다.")
+        return html
+    replacement = (f'<style>{critical}</style>'
+                   f'<link rel="preload" href="{stylesheet}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">'
+                   f'<noscript><link rel="stylesheet" href="{stylesheet}"></noscript>')
+    return html[:match.start()] + replacement + html[match.end():]
+
+
+def _is_paginated(html):
+    """사전 렌더링 페이지가 프로젝트 카드를 나눴는지 (나머지 카드를 불러오는 표시가 있는지, 카드가 적으면 True)"""
+    from build_pages import PROJECTS_MORE_CLASS, PROJECTS_PER_PAGE
+    if f'class="{PROJECTS_MORE_CLASS}"' in html:
+        return True
+    return len(re.findall(r'class="project-card[\s"]', html)) <= PROJECTS_PER_PAGE
+
+
+def build_assets(dist_dir=DIST_DIR, critical=True):
+    """
+    dist/에 배포용 사이트 생성
+    반환값: 보고서 행 목록 [{'name', 'source', 'minified', 'gz', 'br'}]
+    """
+    dist_dir = Path(dist_dir)
+    report = []
+    renames = {}
+
+    for relative in FINGERPRINTED:
+        source = ROOT_DIR / relative
+        raw = source.read_bytes()
+        data = MINIFIERS[source.suffix](raw.decode('utf-8')).encode('utf-8')
+        renamed = fingerprint_name(relative, data)
+        renames[relative] = renamed
+        target = dist_dir / renamed
+        _write_if_changed(target, data)
+        # 이전 빌드의 해시 파일 정리
+        stem, suffix = Path(relative).stem, Path(relative).suffix
+        for stale in target.parent.glob(f"{stem}.*{suffix}*"):
+            if not stale.name.startswith(target.name):
+                stale.unlink()
+        report.append({'name': renamed, 'source': len(raw), 'minified': len(data), **compress(target, data)})
+
+    critical_css = None
+    if critical:
+        from critical_css import CRITICAL_STYLESHEET, load_critical_css
+        critical_css = minify_css(load_critical_css())
+        print(f"🎨 critical CSS {len(critical_css.encode('utf-8')) / 1024:.1f}KB 인라인, "
+              f"{renames[CRITICAL_STYLESHEET]}는 비동기로 불러옴")
+
+    # 배포 파일명 -> 원본 페이지 (/ 는 기본 언어의 사전 렌더링 페이지)
+    pages = {name: ROOT_DIR / name for name in PRERENDERED_HTML if (ROOT_DIR / name).exists()}
+    if ENTRY_PAGE in pages:
+        pages = {INDEX_HTML.name: pages[ENTRY_PAGE], **pages}
+    else:
+        print(f"⚠️ {ENTRY_PAGE}가 없어 원본 index.html을 그대로 배포합니다. (python doc/build_pages.py)")
+        pages = {INDEX_HTML.name: INDEX_HTML, **pages}
+    for name, page in pages.items():
+        raw = page.read_bytes()
+        if page != INDEX_HTML and not _is_paginated(raw.decode('utf-8')):
+            print(f"⚠️ {page.name}에 프로젝트 카드 나누기가 적용되지 않아 모든 카드를 배포합니다. (python doc/build_pages.py)")
+        html = rewrite_references(minify_html(raw.decode('utf-8')), renames)
+        if critical_css is not None:
+            html = inline_critical_css(html, renames[CRITICAL_STYLESHEET], critical_css)
+        data = html.encode('utf-8')
+        target = dist_dir / name
+        _write_if_changed(target, data)
+        label = name if page.name == name else f"{name} ({page.name})"
+        report.append({'name': label, 'source': len(raw), 'minified': len(data), **compress(target, data)})
+
+    copied = 0
+    for ref in local_references(INDEX_HTML.read_text(encoding='utf-8')):
+        if ref in renames:
+            continue
+        source = ROOT_DIR / ref
+        if not source.is_file():
+            print(f"⚠️ index.html이 참조하는 파일이 없습니다: {ref}")
+            continue
+        copied += _copy_if_changed(source, dist_dir / ref)
+    for directory in COPY_DIRS:
+        for source in sorted((ROOT_DIR / directory).rglob('*')):
+            target = dist_dir / source.relative_to(ROOT_DIR)
+            if source.is_file() and _copy_if_changed(source, target):
+                copied += 1
+                compress(target, source.read_bytes())
+    print(f"📦 그 밖의 파일 복사: {copied}개 갱신")
+    return report
+
+
+def print_report(report):
+    """자산별 원본 → 압축 → gzip/brotli 크기 비교"""
+    def kb(value):
+        return f"{value / 1024:7.1f}KB" if value else f"{'-':>9}"
+
+    print(f"\n📊 {'자산':<28} {'원본':>9} {'minify':>9} {'gzip':>9} {'brotli':>9}")
+    totals = {'source': 0, 'minified': 0, 'gz': 0, 'br': 0}
+    for row in report:
+        print(f"   {row['name']:<28} {kb(row['source'])} {kb(row['minified'])} "
+              f"{kb(row.get('gz'))} {kb(row.get('br'))}")
+        for key in totals:
+            totals[key] += row.get(key) or 0
+    print(f"   {'합계':<28} {kb(totals['source'])} {kb(totals['minified'])} {kb(totals['gz'])} {kb(totals['br'])}")
+    if totals['source']:
+        smallest = totals['br'] or totals['gz'] or totals['minified']
+        print(f"✅ 전송 크기 {totals['source'] / 1024:.1f}KB → {smallest / 1024:.1f}KB "
+              f"({(1 - smallest / totals['source']) * 100:.0f}% 감소)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="웹사이트 정적 자산 minify/압축/내용 해시 파일명")
+    parser.add_argument('--out', default=str(DIST_DIR), help=f"출력 디렉토리 (기본: {DIST_DIR})")
+    parser.add_argument('--no-critical', action='store_true',
+                        help="첫 화면용 critical CSS를 인라인하지 않고 스타일시트를 그대로 불러옴")
+    args = parser.parse_args(argv)
+
+    report = build_assets(args.out, critical=not args.no_critical)
+    print_report(report)
+    print(f"📁 저장 위치: {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+웹사이트 프로젝트 스크린샷 반응형 이미지 빌드
+js/app.js의 projectImageMap에 있는 스크린샷(img/ 원본 PNG/JPG, 최대 수 MB)을
+여러 너비(RESPONSIVE_WIDTHS)의 AVIF / WebP / JPEG로 변환해 img/responsive에 저장하고,
+index.html의 프로젝트 카드(<div class="project-image project-bg-N">)에
+srcset/sizes와 width/height를 지정한 <picture>를 넣습니다.
+브라우저는 화면 크기와 지원 형식에 맞는 파일 하나만 받으므로 원본 대신 수십 KB만 전송됩니다.
+
+- 파일 이름에 원본 내용 해시가 들어가므로 (예: 2_WON_뱅킹-1a2b3c4d5e-800w.avif)
+  이미 만든 파일은 건너뛰고 새로 추가되거나 바뀐 스크린샷만 변환합니다.
+  더 이상 쓰지 않는 변환 파일은 지웁니다.
+- 변환은 스레드 풀에서 동시에 처리합니다 (Pillow는 디코딩/리사이즈/인코딩 중 GIL을 놓음).
+- AVIF: Pillow 11.3 이상 (libavif 포함 빌드), 지원하지 않으면 WebP/JPEG만 만듭니다.
+- index.html을 고친 뒤에는 다시 실행해도 같은 결과가 나옵니다 (이미 넣은 <picture>는 교체).
+
+사용 방법:
+1. Pillow 설치: pip install Pillow
+2. 스크립트 실행: python doc/build_images.py
+   - 변환만 (index.html은 그대로): python doc/build_images.py --no-html
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# 현재 스크립트의 디렉토리를 기준으로 경로 설정
+SCRIPT_DIR = Path(__file__).parent.absolute()
+DOC_DIR = SCRIPT_DIR
+ROOT_DIR = SCRIPT_DIR.parent
+
+from portfolio_content import APP_JS, INDEX_HTML, _parse_app_js
+
+OUTPUT_DIR = ROOT_DIR / "img" / "responsive"
+
+# 만들 이미지 너비 (px, 원본보다 큰 너비는 만들지 않음)
+# 카드 너비는 최대 약 400px이므로 1x/2x/3x 화면에 맞춰 준비
+RESPONSIVE_WIDTHS = (400, 800, 1200)
+
+# <img sizes>: 모바일(768px 이하)에서는 화면 너비, 그 밖에는 카드 너비
+IMAGE_SIZES = "(max-width: 768px) 100vw, 400px"
+
+# 형식 -> (MIME 타입, Pillow 저장 옵션), 앞에 있는 형식을 브라우저가 먼저 고려
+IMAGE_FORMATS = {
+    'avif': ('image/avif', {'format': 'AVIF', 'quality': 55, 'speed': 6}),
+    'webp': ('image/webp', {'format': 'WEBP', 'quality': 78, 'method': 6}),
+    'jpg': ('image/jpeg', {'format': 'JPEG', 'quality': 80, 'optimize': True, 'progressive': True}),
+}
+
+# <img src>와 구형 브라우저용 형식
+FALLBACK_FORMAT = 'jpg'
+
+# 파일명에 넣는 원본 해시 길이
+HASH_LENGTH = 10
+
+# index.html 프로젝트 카드 이미지 영역 (이미 넣은 <picture>가 있으면 함께 찾아 교체)
+_CARD_IMAGE = re.compile(
+    r'(?P<indent>[ \t]*)(?P<div><div class="project-image (?P<cls>project-bg-\d+)"[^>]*>)'
+    r'(?:\s*<picture class="project-picture">.*?</picture>)?', re.S)
+
+
+def available_formats():
+    """이 Pillow에서 저장할 수 있는 형식 (AVIF는 빌드에 따라 없을 수 있음)"""
+    from PIL import features
+    formats = [fmt for fmt in IMAGE_FORMATS if fmt != 'avif' or features.check('avif')]
+    if 'avif' not in formats:
+        print("⚠️ 이 Pillow는 AVIF를 지원하지 않아 WebP/JPEG만 만듭니다. (Pillow 11.3 이상)")
+    return formats
+
+
+def _digest(path):
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:HASH_LENGTH]
+
+
+def plan_variants(source, formats):
+    """
+    원본 하나의 변환 목록
+    반환값: (원본 크기, [(너비, 형식, 출력 경로), ...])
+    """
+    from PIL import Image
+
+    with Image.open(source) as image:
+        size = image.size
+    digest = _digest(source)
+    widths = [width for width in RESPONSIVE_WIDTHS if width <= size[0]] or [size[0]]
+    if size[0] < RESPONSIVE_WIDTHS[-1] and size[0] not in widths:
+        widths.append(size[0])
+    variants = [(width, fmt, OUTPUT_DIR / f"{source.stem}-{digest}-{width}w.{fmt}")
+                for width in widths for fmt in formats]
+    return size, variants
+
+
+def render_variant(source, width, fmt, target):
+    """원본을 width 너비로 줄여 fmt로 저장 (이미 있으면 건너뜀), 새로 만들었으면 True"""
+    if target.exists():
+        return False
+    from PIL import Image
+
+    with Image.open(source) as image:
+        height = round(image.height * width / image.width)
+        image.draft('RGB', (width, height))
+        resized = image.resize((width, height), Image.LANCZOS) if image.width != width else image.copy()
+    if fmt == 'jpg' and resized.mode != 'RGB':
+        # 투명 배경은 흰색으로 합성 (JPEG는 알파 채널이 없음)
+        rgba = resized.convert('RGBA')
+        resized = Image.new('RGB', rgba.size, (255, 255, 255))
+        resized.paste(rgba, mask=rgba.split()[-1])
+    elif resized.mode not in ('RGB', 'RGBA'):
+        resized = resized.convert('RGBA')
+    options = dict(IMAGE_FORMATS[fmt][1])
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = target.with_name(target.name + '.tmp')
+    resized.save(tmp_file, **options)
+    tmp_file.replace(target)
+    return True
+
+
+def _srcset(variants, fmt):
+    return ', '.join(f"{path.relative_to(ROOT_DIR).as_posix()} {width}w"
+                     for width, variant_fmt, path in variants if variant_fmt == fmt)
+
+
+def picture_markup(size, variants, formats, indent, newline='\n'):
+    """프로젝트 카드에 넣을 <picture> (형식별 <source> + JPEG <img>)"""
+    fallback = [v for v in variants if v[1] == FALLBACK_FORMAT]
+    largest = max(fallback)
+    width = largest[0]
+    height = round(size[1] * width / size[0])
+    inner = indent + '    '
+    lines = [f'{indent}<picture class="project-picture">']
+    for fmt in formats:
+        if fmt != FALLBACK_FORMAT:
+            lines.append(f'{inner}<source type="{IMAGE_FORMATS[fmt][0]}" srcset="{_srcset(variants, fmt)}" '
+                         f'sizes="{IMAGE_SIZES}">')
+    lines.append(f'{inner}<img src="{min(fallback)[2].relative_to(ROOT_DIR).as_posix()}" '
+                 f'srcset="{_srcset(variants, FALLBACK_FORMAT)}" sizes="{IMAGE_SIZES}" '
+                 f'width="{width}" height="{height}" alt="" loading="lazy" decoding="async">')
+    lines.append(f'{indent}</picture>')
+    return newline.join(lines)
+
+
+def rewrite_index(plans, formats):
+    """index.html 프로젝트 카드에 <picture> 넣기/교체, 바뀐 카드 수 반환"""
+    # 줄바꿈(CRLF)을 그대로 유지하도록 newline='' 로 읽고 씀
+    with open(INDEX_HTML, encoding='utf-8', newline='') as f:
+        html = f.read()
+    newline = '\r\n' if '\r\n' in html else '\n'
+    changed = 0
+
+    def replace(match):
+        nonlocal changed
+        plan = plans.get(match.group('cls'))
+        if plan is None:
+            return match.group(0)
+        size, variants = plan[:2]
+        indent = match.group('indent')
+        picture = picture_markup(size, variants, formats, indent + '    ', newline)
+        replacement = f"{indent}{match.group('div')}{newline}{picture}"
+        if replacement != match.group(0):
+            changed += 1
+        return replacement
+
+    updated = _CARD_IMAGE.sub(replace, html)
+    if updated != html:
+        tmp_file = INDEX_HTML.with_name(INDEX_HTML.name + '.tmp')
+        with open(tmp_file, 'w', encoding='utf-8', newline='') as f:
+            f.write(updated)
+        tmp_file.replace(INDEX_HTML)
+    return changed
+
+
+def build_images(jobs=None, update_html=True):
+    """
+    projectImageMap의 스크린샷을 반응형 이미지로 변환하고 index.html 갱신
+    반환값: (새로 만든 파일 수, 건너뛴 파일 수, 바뀐 카드 수)
+    """
+    _, images = _parse_app_js(APP_JS.read_text(encoding='utf-8'))
+    formats = available_formats()
+
+    plans = {}
+    for cls, relative in images.items():
+        source = ROOT_DIR / relative
+        if not source.exists():
+            print(f"⚠️ 이미지가 없습니다 ({cls}): {relative}")
+            continue
+        plans[cls] = plan_variants(source, formats) + (source,)
+
+    tasks = [(source, width, fmt, path) for _, variants, source in plans.values() for width, fmt, path in variants]
+
+    def work(task):
+        try:
+            return render_variant(*task)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ 이미지를 변환할 수 없습니다 ({task[0].name}, {task[1]}w {task[2]}): {e}")
+            return None
+
+    workers = min(jobs or os.cpu_count() or 1, max(len(tasks), 1))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(work, tasks))
+    created = sum(1 for result in results if result)
+
+    # 더 이상 쓰지 않는 변환 파일 정리
+    current = {path for _, _, _, path in tasks}
+    for stale in OUTPUT_DIR.glob('*'):
+        if stale not in current:
+            stale.unlink()
+
+    changed = rewrite_index(plans, formats) if update_html else 0
+    return created, len(tasks) - created, changed
+
+
+def print_report():
+    """원본 스크린샷과 형식별 변환 파일 크기 비교 (가장 작은 너비 = 카드 1x 화면에서 받는 크기)"""
+    _, images = _parse_app_js(APP_JS.read_text(encoding='utf-8'))
+    sources = [ROOT_DIR / relative for relative in images.values() if (ROOT_DIR / relative).exists()]
+    original = sum(path.stat().st_size for path in sources)
+    print(f"\n📊 원본 스크린샷 {len(sources)}개: {original / 1024:.1f}KB")
+    smallest = f"-{RESPONSIVE_WIDTHS[0]}w."
+    for fmt in IMAGE_FORMATS:
+        files = list(OUTPUT_DIR.glob(f"*.{fmt}"))
+        if files:
+            total = sum(path.stat().st_size for path in files)
+            card = sum(path.stat().st_size for path in files if smallest in path.name)
+            print(f"   {fmt:<5} {len(files):3d}개 {total / 1024:8.1f}KB (카드 {RESPONSIVE_WIDTHS[0]}w 합계 {card / 1024:.1f}KB)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="프로젝트 스크린샷 반응형 이미지(AVIF/WebP/JPEG) 빌드")
+    parser.add_argument('--jobs', type=int, default=None, help="동시에 변환할 스레드 수 (기본: CPU 수)")
+    parser.add_argument('--no-html', action='store_true', help="이미지만 변환하고 index.html은 고치지 않음")
+    args = parser.parse_args(argv)
+
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        print("❌ Pillow 라이브러리가 설치되지 않았습니다.")
+        print("📦 설치 방법: pip install Pillow")
+        return 1
+
+    started = time.perf_counter()
+    created, skipped, changed = build_images(args.jobs, update_html=not args.no_html)
+    print(f"✅ 반응형 이미지: 새로 만듦 {created}개, 캐시 사용 {skipped}개 "
+          f"({time.perf_counter() - started:.2f}s)")
+    if not args.no_html:
+        print(f"📝 index.html 프로젝트 카드 {changed}개 갱신")
+    print_report()
+    print(f"📁 저장 위치: {OUTPUT_DIR}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+웹사이트 locale 번들 컴파일러
+locales/<lang>.json(중첩 JSON)을 페이지 섹션별 평탄한 'section.key' -> 문자열 맵으로 나누고,
+내용 해시를 넣은 파일명(locales/dist/<lang>.<section>.<hash>.json)과 매니페스트로 저장합니다.
+
+js/app.js의 loadLocale()은 매니페스트(locales/dist/manifest.json)만 매번 확인하고,
+섹션 번들은 파일명이 내용에 따라 바뀌므로 브라우저 캐시를 그대로 사용합니다 (force-cache).
+또 페이지에 실제로 쓰이는 섹션(data-i18n 키의 첫 부분)만 받아오고,
+경로를 따라 객체를 내려가는 대신 평탄한 키로 바로 조회합니다.
+매니페스트가 없으면 예전처럼 locales/<lang>.json 전체를 받아옵니다.
+
+- 섹션: locale JSON의 최상위 키 (nav_extra처럼 _extra로 끝나는 키는 nav 섹션에 합침)
+- 번들 내용이 같으면 파일을 다시 쓰지 않고, 매니페스트에 없는 오래된 번들은 지웁니다.
+- 키 사용 색인: index.html의 data-i18n / data-i18n-html / data-i18n-attr 키와
+  js/app.js의 문자열 리터럴('modal.detail' 등, '.'으로 끝나면 그 접두사의 모든 키)을 모아
+  어디서도 쓰지 않는 키는 번들에서 뺍니다 (locales/*.json 원본과 PDF/DOCX/PPTX 생성에는 영향 없음).
+  참조하지만 locale에 없는 키는 경고로 알려 줍니다.
+- locales/*.json을 고친 뒤에는 이 스크립트를 실행해 locales/dist를 함께 커밋합니다.
+
+사용 방법:
+    python doc/build_locales.py           # locales/dist 갱신
+    python doc/build_locales.py --check   # 번들이 locales/*.json과 맞지 않으면 종료 코드 1
+    python doc/build_locales.py --unused  # 번들에서 뺀 키 목록 출력
+    python doc/build_locales.py --no-prune   # 쓰지 않는 키도 모두 번들에 넣음
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+# 현재 스크립트의 디렉토리를 기준으로 경로 설정
+SCRIPT_DIR = Path(__file__).parent.absolute()
+DOC_DIR = SCRIPT_DIR
+ROOT_DIR = SCRIPT_DIR.parent
+
+from portfolio_content import APP_JS, INDEX_HTML, LOCALES_DIR, SUPPORTED_LANGS, _flatten
+
+DIST_DIR = LOCALES_DIR / "dist"
+MANIFEST_PATH = DIST_DIR / "manifest.json"
+
+# 매니페스트/번들 형식이 바뀌면 올립니다 (js/app.js가 모르는 버전이면 전체 JSON을 받음).
+LOCALE_BUNDLE_VERSION = 1
+
+# 파일명에 넣는 내용 해시 길이
+HASH_LENGTH = 10
+
+# 이 접미사로 끝나는 최상위 키는 앞부분 이름의 섹션에 합침 (nav_extra -> nav)
+EXTRA_SUFFIX = '_extra'
+
+# locale 키를 참조하는 파일
+_HTML_KEY_ATTRS = re.compile(r'data-i18n(?:-html)?\s*=\s*["\']([^"\']+)["\']')
+_HTML_ATTR_MAPS = re.compile(r'data-i18n-attr\s*=\s*["\']([^"\']+)["\']')
+_JS_STRINGS = re.compile(r'\'([^\'\\\n]*)\'|"([^"\\\n]*)"')
+_KEY_LIKE = re.compile(r'^[A-Za-z_][\w-]*(?:\.[\w-]+)*\.?$')
+
+
+def section_of(top_key):
+    """최상위 locale 키가 들어갈 섹션 이름"""
+    if top_key.endswith(EXTRA_SUFFIX):
+        return top_key[:-len(EXTRA_SUFFIX)]
+    return top_key
+
+
+def split_sections(tree):
+    """중첩 locale JSON -> {섹션: {'section.key': 값}} (최상위 키 순서 유지)"""
+    sections = {}
+    for top_key, value in tree.items():
+        flat = _flatten({top_key: value})
+        sections.setdefault(section_of(top_key), {}).update(flat)
+    return sections
+
+
+def key_usage(html=None, js=None):
+    """
+    키 사용 색인: {참조한 키 또는 '접두사.': [참조한 파일]}
+    html/js를 주지 않으면 index.html, js/app.js를 읽음
+    """
+    if html is None:
+        html = INDEX_HTML.read_text(encoding='utf-8')
+    if js is None:
+        js = APP_JS.read_text(encoding='utf-8')
+    usage = {}
+
+    def add(key, source):
+        key = key.strip()
+        if key and source not in usage.setdefault(key, []):
+            usage[key].append(source)
+
+    for key in _HTML_KEY_ATTRS.findall(html):
+        add(key, INDEX_HTML.name)
+    for mapping in _HTML_ATTR_MAPS.findall(html):
+        for pair in mapping.split(';'):
+            add(pair.partition(':')[2], INDEX_HTML.name)
+    for single, double in _JS_STRINGS.findall(js):
+        literal = single or double
+        if _KEY_LIKE.match(literal):
+            add(literal, 'js/' + APP_JS.name)
+    return usage
+
+
+def is_referenced(key, usage):
+    """평탄한 키가 색인에 있는지 ('접두사.' 참조는 그 아래 모든 키)"""
+    if key in usage:
+        return True
+    return any(ref.endswith('.') and key.startswith(ref) for ref in usage)
+
+
+def encode_bundle(strings):
+    """번들 JSON 바이트 (키 정렬, 공백 없음 → 같은 내용이면 같은 해시)"""
+    return json.dumps(strings, ensure_ascii=False, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+def compile_locales(langs=SUPPORTED_LANGS, usage=None):
+    """
+    locale 번들과 매니페스트 내용 생성 (파일은 쓰지 않음)
+    usage: key_usage() 색인, 주면 참조하지 않는 키를 번들에서 뺌 (None이면 모든 키)
+    반환값: (매니페스트 dict, {파일명: 번들 바이트}, {언어: 뺀 키 목록})
+    """
+    manifest = {'version': LOCALE_BUNDLE_VERSION, 'prefixes': {}, 'langs': {}}
+    bundles = {}
+    unused = {}
+    for lang in langs:
+        source = LOCALES_DIR / f"{lang}.json"
+        with open(source, encoding='utf-8') as f:
+            tree = json.load(f)
+        for top_key in tree:
+            manifest['prefixes'][top_key] = section_of(top_key)
+        entries = {}
+        unused[lang] = []
+        full_bytes = 0
+        for section, strings in split_sections(tree).items():
+            full_bytes += len(encode_bundle(strings))
+            if usage is not None:
+                unused[lang] += [key for key in strings if not is_referenced(key, usage)]
+                strings = {key: value for key, value in strings.items() if is_referenced(key, usage)}
+                if not strings:
+                    continue
+            data = encode_bundle(strings)
+            name = f"{lang}.{section}.{hashlib.sha256(data).hexdigest()[:HASH_LENGTH]}.json"
+            bundles[name] = data
+            entries[section] = {'file': name, 'keys': len(strings), 'bytes': len(data)}
+        shipped = sum(entry['bytes'] for entry in entries.values())
+        manifest['langs'][lang] = {'source_bytes': source.stat().st_size, 'sections': entries,
+                                   'pruned_keys': len(unused[lang]), 'pruned_bytes': full_bytes - shipped}
+    return manifest, bundles, unused
+
+
+def missing_keys(usage, langs=SUPPORTED_LANGS):
+    """참조하지만 locale에 없는 키 {언어: [키]} (JS의 '접두사.'와 키처럼 보이는 일반 문자열은 제외)"""
+    missing = {}
+    for lang in langs:
+        with open(LOCALES_DIR / f"{lang}.json", encoding='utf-8') as f:
+            flat = _flatten(json.load(f))
+        missing[lang] = [key for key, sources in usage.items()
+                         if INDEX_HTML.name in sources and key not in flat]
+    return missing
+
+
+def encode_manifest(manifest):
+    return (json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True) + '\n').encode('utf-8')
+
+
+def write_locales(manifest, bundles):
+    """번들/매니페스트 저장 (바뀐 파일만 씀), 반환값: (새로 쓴 파일 목록, 지운 파일 목록)"""
+    DIST_DIR.mkdir(parents=True, exist_ok=True)
+    written = []
+    for name, data in bundles.items():
+        path = DIST_DIR / name
+        if path.exists() and path.read_bytes() == data:
+            continue
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+        written.append(name)
+
+    data = encode_manifest(manifest)
+    if not MANIFEST_PATH.exists() or MANIFEST_PATH.read_bytes() != data:
+        tmp_path = MANIFEST_PATH.with_suffix('.tmp')
+        tmp_path.write_bytes(data)
+        tmp_path.replace(MANIFEST_PATH)
+        written.append(MANIFEST_PATH.name)
+
+    removed = []
+    for path in DIST_DIR.glob('*.json'):
+        if path != MANIFEST_PATH and path.name not in bundles:
+            path.unlink()
+            removed.append(path.name)
+    return written, removed
+
+
+def is_current(manifest, bundles):
+    """locales/dist가 지금 locale 원본으로 만든 결과와 같은지 확인"""
+    if not MANIFEST_PATH.exists() or MANIFEST_PATH.read_bytes() != encode_manifest(manifest):
+        return False
+    return all((DIST_DIR / name).exists() for name in bundles)
+
+
+def print_report(manifest):
+    """언어별 섹션 번들 크기와 쓰지 않는 키를 뺀 절약량 출력"""
+    for lang, info in manifest['langs'].items():
+        sections = info['sections']
+        total = sum(entry['bytes'] for entry in sections.values())
+        print(f"🌐 {lang}: 원본 {info['source_bytes'] / 1024:.1f}KB → 섹션 {len(sections)}개, "
+              f"합계 {total / 1024:.1f}KB (쓰지 않는 키 {info.get('pruned_keys', 0)}개, "
+              f"{info.get('pruned_bytes', 0) / 1024:.1f}KB 절약)")
+        for section, entry in sections.items():
+            print(f"   {section:<14} {entry['keys']:4d}개 키  {entry['bytes'] / 1024:6.1f}KB  {entry['file']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="locales/*.json을 섹션별 해시 번들로 컴파일")
+    parser.add_argument('--check', action='store_true',
+                        help="파일을 쓰지 않고 locales/dist가 최신인지만 확인 (최신이 아니면 종료 코드 1)")
+    parser.add_argument('--unused', action='store_true', help="번들에서 뺀 (어디서도 참조하지 않는) 키 목록 출력")
+    parser.add_argument('--no-prune', action='store_true', help="참조하지 않는 키도 모두 번들에 넣음")
+    args = parser.parse_args(argv)
+
+    usage = None if args.no_prune else key_usage()
+    manifest, bundles, unused = compile_locales(usage=usage)
+    if args.check:
+        if is_current(manifest, bundles):
+            print(f"✅ locale 번들이 최신입니다: {DIST_DIR}")
+            return 0
+        print("❌ locale 번들이 locales/*.json과 다릅니다. python doc/build_locales.py를 실행해주세요.")
+        return 1
+
+    written, removed = write_locales(manifest, bundles)
+    print_report(manifest)
+    if usage is not None:
+        for lang, keys in missing_keys(usage).items():
+            if keys:
+                print(f"⚠️ {lang}: index.html이 참조하지만 locale에 없는 키 {len(keys)}개: {', '.join(keys)}")
+    if args.unused:
+        for lang, keys in unused.items():
+            print(f"\n🗑️ {lang}: 번들에서 뺀 키 {len(keys)}개")
+            for key in keys:
+                print(f"   {key}")
+    print(f"\n📁 저장 위치: {DIST_DIR} (새로 씀 {len(written)}개, 지움 {len(removed)}개)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
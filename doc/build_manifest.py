@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+포트폴리오 문서 증분 빌드 매니페스트
+출력 파일(PDF/DOCX/PPTX)마다 입력(콘텐츠 원본, 폰트, 이미지, 생성 스크립트)의
+해시를 기록해 두고, 입력이 바뀌지 않은 출력은 다시 만들지 않도록 합니다.
+
+- 텍스트 원본(index.html, locales, 스크립트)은 내용 해시를 사용합니다.
+- 폰트/이미지 같은 큰 바이너리는 (경로, 크기, 수정 시각)으로 지문을 만듭니다.
+- 매니페스트 위치: doc/.cache/build_manifest.json
+
+사용 방법:
+    python doc/build_portfolio.py          # 변경된 출력만 빌드
+    python doc/build_portfolio.py --force  # 매니페스트 무시하고 전체 빌드
+    python doc/build_manifest.py           # 매니페스트 내용 확인
+"""
+
+import hashlib
+import json
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# 현재 스크립트의 디렉토리를 기준으로 경로 설정
+SCRIPT_DIR = Path(__file__).parent.absolute()
+DOC_DIR = SCRIPT_DIR
+ROOT_DIR = SCRIPT_DIR.parent
+
+from portfolio_content import load_content, source_files
+from portfolio_fonts import discover_korean_fonts
+
+MANIFEST_PATH = DOC_DIR / ".cache" / "build_manifest.json"
+
+# 매니페스트 형식/해시 규칙이 바뀌면 올려서 모든 출력을 다시 빌드합니다.
+MANIFEST_VERSION = 1
+
+# 형식 -> 생성 스크립트 (스크립트 내용이 '생성기 버전' 역할을 함)
+GENERATOR_SCRIPTS = {
+    'pdf': 'generate_portfolio_pdf.py',
+    'docx': 'generate_portfolio_doc.py',
+    'pptx': 'generate_portfolio_ppt.py',
+}
+
+# 모든 형식이 공유하는 모듈
+SHARED_SCRIPTS = ['portfolio_content.py', 'portfolio_fonts.py', 'portfolio_icons.py', 'portfolio_images.py',
+                  'portfolio_profile.py']
+
+# 특정 형식에서만 쓰는 모듈
+FORMAT_SCRIPTS = {
+    'docx': ['portfolio_ooxml.py'],
+    'pptx': ['portfolio_ooxml.py', 'portfolio_textfit.py', 'portfolio_theme.py'],
+}
+
+# 이 크기 이상의 파일은 내용 대신 stat 정보로 지문 생성
+LARGE_FILE_BYTES = 1024 * 1024
+
+
+def _font_files(fmt):
+    """형식별로 사용되는 폰트 파일 후보 (PDF만 폰트 파일을 직접 임베드)"""
+    if fmt != 'pdf':
+        return []
+    return discover_korean_fonts()
+
+
+def _image_files(lang):
+    """콘텐츠 모델이 참조하는 프로젝트 이미지"""
+    content = load_content(lang)
+    return [ROOT_DIR / p.image for p in content.projects if p.image]
+
+
+def _icon_files():
+    """핵심 역량 아이콘 SVG"""
+    from portfolio_icons import COMPETENCY_ICONS, ICON_DIR
+    return [ICON_DIR / name for name in COMPETENCY_ICONS.values()]
+
+
+def input_files(fmt, lang):
+    """출력 하나를 만드는 데 관여하는 입력 파일 목록"""
+    files = list(source_files(lang))
+    files += [DOC_DIR / name for name in SHARED_SCRIPTS]
+    files.append(DOC_DIR / GENERATOR_SCRIPTS[fmt])
+    files += [DOC_DIR / name for name in FORMAT_SCRIPTS.get(fmt, [])]
+    files += _font_files(fmt)
+    files += _image_files(lang)
+    files += _icon_files()
+    return files
+
+
+def _fingerprint(path):
+    """파일 하나의 지문 (없는 파일도 '없음' 상태로 기록)"""
+    path = Path(path)
+    try:
+        stat = path.stat()
+    except OSError:
+        return f"{path}:missing"
+    if stat.st_size >= LARGE_FILE_BYTES:
+        return f"{path}:{stat.st_size}:{stat.st_mtime_ns}"
+    return f"{path}:{hashlib.sha256(path.read_bytes()).hexdigest()}"
+
+
+def inputs_hash(fmt, lang, extra=None):
+    """출력 하나의 입력 해시"""
+    digest = hashlib.sha256(f"manifest-v{MANIFEST_VERSION}:{fmt}:{lang}".encode())
+    for path in input_files(fmt, lang):
+        digest.update(_fingerprint(path).encode('utf-8'))
+        digest.update(b"\0")
+    if extra:
+        digest.update(json.dumps(extra, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class BuildManifest:
+    """출력 파일별 입력 해시 기록"""
+
+    def __init__(self, path=MANIFEST_PATH):
+        self.path = Path(path)
+        self.outputs = {}
+        self.hits = []
+        self.misses = []
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding='utf-8'))
+                if data.get('version') == MANIFEST_VERSION:
+                    self.outputs = data.get('outputs', {})
+            except (OSError, ValueError) as e:
+                print(f"⚠️ 빌드 매니페스트를 읽을 수 없어 새로 만듭니다: {e}")
+
+    def is_fresh(self, output, digest, force=False):
+        """
+        출력이 존재하고, 기록된 입력 해시/출력 상태가 일치하면 True (hit/miss 집계)
+        force: 기록과 관계없이 다시 빌드 (항상 False, miss로 집계)
+        """
+        output = Path(output)
+        entry = self.outputs.get(output.name)
+        fresh = False
+        if not force and entry and entry.get('inputs_hash') == digest and output.exists():
+            stat = output.stat()
+            fresh = entry.get('size') == stat.st_size and entry.get('mtime_ns') == stat.st_mtime_ns
+        (self.hits if fresh else self.misses).append(output.name)
+        return fresh
+
+    def record(self, output, digest, **info):
+        """빌드된 출력의 입력 해시와 출력 상태 기록"""
+        output = Path(output)
+        stat = output.stat()
+        entry = {
+            'inputs_hash': digest,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'built_at': datetime.now().isoformat(timespec='seconds'),
+        }
+        entry.update(info)
+        self.outputs[output.name] = entry
+
+    def save(self):
+        """매니페스트 저장 (임시 파일에 쓴 뒤 교체)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # build_portfolio/tailor_portfolio/watch가 동시에 저장할 수 있으므로 임시 파일 이름에 pid를 붙임
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        data = {'version': MANIFEST_VERSION, 'outputs': self.outputs}
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding='utf-8')
+        os.replace(tmp_path, self.path)
+
+
+if __name__ == "__main__":
+    manifest = BuildManifest()
+    if not manifest.outputs:
+        print(f"📭 기록된 출력이 없습니다: {MANIFEST_PATH}")
+        sys.exit(0)
+    print(f"📋 빌드 매니페스트: {MANIFEST_PATH}")
+    for name, entry in sorted(manifest.outputs.items()):
+        print(f"   {name:<40} {entry.get('built_at', '-')}  {entry['inputs_hash'][:12]}")
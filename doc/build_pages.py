@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+웹사이트 언어별 정적 페이지 사전 렌더링
+index.html에 locales/<lang>.json을 미리 적용해 번역이 끝난 페이지(ko.html, en.html)를 만듭니다.
+js/app.js의 applyLocaleTranslations()가 브라우저에서 하던 일(data-i18n 텍스트, data-i18n-html,
+data-i18n-attr 속성)을 빌드할 때 똑같이 하므로, 첫 화면이 locale JSON fetch와 약 280개 노드 교체를
+기다리지 않고 글자가 바뀌는 깜빡임도 없습니다.
+
+- 페이지의 <html>에는 lang과 data-prerendered="<lang>"을 넣습니다.
+  app.js는 이 표시가 있으면 번역을 다시 적용하지 않고, 언어 버튼(switchLanguage)은 다른 언어 페이지로 이동합니다.
+- 방문자는 항상 이 페이지에서 시작합니다. 사이트는 dist/를 배포하고(.github/workflows/pages.yml)
+  doc/build_assets.py가 기본 언어 페이지(ko.html)를 dist/index.html로 내보내므로 / 는 리다이렉트 없이 ko.html입니다.
+  <head> 스크립트는 저장된 언어(없으면 브라우저 언어)가 기본 언어가 아닐 때만 그 언어의 페이지로 이동시킵니다.
+- data-i18n* 속성은 그대로 남겨 두므로 index.html(번역 전 원본)도 예전처럼 동작합니다.
+- 원본의 줄바꿈/들여쓰기는 그대로 두고 번역할 부분만 바꿉니다.
+- 프로젝트 카드는 처음 PROJECTS_PER_PAGE개만 페이지에 남기고, 나머지는 projects/에
+  페이지 단위 HTML 조각(<lang>.<n>.<hash>.html)과 작은 JSON 색인(<lang>.index.<hash>.json)으로 나눕니다.
+  app.js의 lazyLoadProjectPages()가 프로젝트 목록 끝이 화면에 가까워지면 다음 조각을 불러옵니다
+  (lazyLoadProjectImages와 같은 IntersectionObserver 방식). 방문자가 받는 페이지는 이 두 페이지뿐이므로
+  (/ 는 dist/index.html = ko.html, 원본 index.html은 배포하지 않음) 전송 크기와 첫 DOM 크기가 함께 줄어듭니다.
+  index.html은 PDF/DOCX/PPTX 생성이 모든 카드를 읽는 원본이므로 나누지 않습니다.
+- index.html이나 locales/*.json을 고친 뒤에는 이 스크립트를 실행해 페이지와 projects/를 함께 커밋합니다.
+
+사용 방법:
+    python doc/build_pages.py           # ko.html, en.html, projects/ 갱신
+    python doc/build_pages.py --check   # 페이지가 index.html/locales와 맞지 않으면 종료 코드 1
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import re
+import sys
+from html.parser import HTMLParser
+from pathlib import Path
+
+# 현재 스크립트의 디렉토리를 기준으로 경로 설정
+SCRIPT_DIR = Path(__file__).parent.absolute()
+DOC_DIR = SCRIPT_DIR
+ROOT_DIR = SCRIPT_DIR.parent
+
+from portfolio_content import INDEX_HTML, LOCALES_DIR, SUPPORTED_LANGS, VOID_TAGS, _collapse, _flatten
+
+# 언어 -> 사전 렌더링 페이지 (사이트 루트 기준, js/app.js의 PRERENDERED_PAGES, index.html <head> 스크립트의 pages와 같아야 함)
+PAGES = {lang: f"{lang}.html" for lang in SUPPORTED_LANGS}
+
+# 언어 버튼에 표시하는 '다른 언어' 이름 (switchLanguage와 같은 규칙)
+LANG_BUTTON_TEXT = {'ko': 'EN', 'en': 'KO'}
+
+# 페이지에 바로 넣어 두는 프로젝트 카드 수 (데스크톱 그리드 한 줄), 나머지도 이 수만큼씩 조각으로 나눔
+PROJECTS_PER_PAGE = 3
+
+# 나머지 카드를 불러오는 표시 (doc/build_assets.py가 배포 페이지에 있는지 확인)
+PROJECTS_MORE_CLASS = 'projects-more'
+
+# 프로젝트 카드 조각/색인 저장 위치 (사이트 루트 기준으로 페이지에서 참조)
+PROJECTS_DIR = ROOT_DIR / "projects"
+
+# 조각/색인 파일명에 넣는 내용 해시 길이
+HASH_LENGTH = 10
+
+
+def _is_i18n(tag, attrs):
+    return tag == 'title' or any(name.startswith('data-i18n') for name in attrs)
+
+
+def _is_project_element(tag, attrs):
+    classes = (attrs.get('class') or '').split()
+    return 'projects-grid' in classes or 'project-card' in classes or 'project-title' in classes \
+        or 'tag' in classes
+
+
+class _ElementParser(HTMLParser):
+    """
+    wanted(태그, 속성 dict)가 참인 요소의 위치 수집
+    elements: [(태그, 속성 dict, 시작 태그 시작, 시작 태그 끝, 닫는 태그 시작)] (문서 순서)
+    """
+
+    def __init__(self, source, wanted=_is_i18n):
+        super().__init__(convert_charrefs=True)
+        self.line_starts = [0] + [m.end() for m in re.finditer('\n', source)]
+        self.wanted = wanted
+        self.elements = []
+        self.stack = []
+
+    def _offset(self):
+        line, column = self.getpos()
+        return self.line_starts[line - 1] + column
+
+    def handle_starttag(self, tag, attrs):
+        start = self._offset()
+        end = start + len(self.get_starttag_text())
+        record = [tag, dict(attrs), start, end, None]
+        if self.wanted(tag, record[1]):
+            self.elements.append(record)
+        if tag not in VOID_TAGS:
+            self.stack.append(record)
+
+    def handle_startendtag(self, tag, attrs):
+        start = self._offset()
+        record = [tag, dict(attrs), start, start + len(self.get_starttag_text()), None]
+        if tag != 'title' and self.wanted(tag, record[1]):
+            self.elements.append(record)
+
+    def handle_endtag(self, tag):
+        for index in range(len(self.stack) - 1, -1, -1):
+            if self.stack[index][0] == tag:
+                self.stack[index][4] = self._offset()
+                del self.stack[index:]
+                break
+
+
+def _set_attribute(start_tag, name, value):
+    """시작 태그 텍스트에서 속성 값 교체 (없으면 추가)"""
+    escaped = html.escape(value, quote=True)
+    pattern = re.compile(r'(\s' + re.escape(name) + r')(\s*=\s*("[^"]*"|\'[^\']*\'|[^\s>]+))?(?=[\s/>])', re.I)
+    if pattern.search(start_tag):
+        return pattern.sub(lambda m: f'{m.group(1)}="{escaped}"', start_tag, count=1)
+    closing = '/>' if start_tag.endswith('/>') else '>'
+    return f'{start_tag[:-len(closing)].rstrip()} {name}="{escaped}"{closing}'
+
+
+def _text(value):
+    """locale 값 -> 문자열 (문자열/숫자/불리언만 적용, 없으면 None)"""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (str, int, float)):
+        return str(value)
+    return None
+
+
+def render_page(source, strings, lang):
+    """
+    index.html 원본에 평탄한 locale 맵을 적용한 페이지 HTML
+    반환값: (HTML, 적용한 노드 수)
+    """
+    parser = _ElementParser(source)
+    parser.feed(source)
+    parser.close()
+
+    edits = []  # (시작, 끝, 새 텍스트)
+    applied = 0
+    newline = '\r\n' if '\r\n' in source else '\n'
+    for tag, attrs, start, tag_end, close in parser.elements:
+        start_tag = source[start:tag_end]
+        new_tag = start_tag
+        inner = None
+        if tag == 'title':
+            title = _text(strings.get('pageTitle'))
+            if title is not None and close is not None:
+                inner = html.escape(title, quote=False)
+        if 'data-i18n' in attrs:
+            value = _text(strings.get(attrs['data-i18n']))
+            if value is not None:
+                if tag in ('input', 'textarea') and 'placeholder' in attrs:
+                    new_tag = _set_attribute(new_tag, 'placeholder', value)
+                elif tag == 'input':
+                    new_tag = _set_attribute(new_tag, 'value', value)
+                elif close is not None:
+                    inner = html.escape(value, quote=False)
+                applied += 1
+        if 'data-i18n-html' in attrs:
+            value = _text(strings.get(attrs['data-i18n-html']))
+            if value is not None and close is not None:
+                inner = value
+                applied += 1
+        for pair in (attrs.get('data-i18n-attr') or '').split(';'):
+            name, _, key = pair.partition(':')
+            value = _text(strings.get(key.strip()))
+            if name.strip() and value is not None:
+                new_tag = _set_attribute(new_tag, name.strip(), value)
+                applied += 1
+        if new_tag != start_tag:
+            edits.append((start, tag_end, new_tag))
+        if inner is not None:
+            edits.append((tag_end, close, re.sub(r'\r?\n', newline, inner)))
+
+    # <html lang>, 사전 렌더링 표시, 언어 버튼 글자
+    html_tag = re.search(r'<html\b[^>]*>', source, re.I)
+    if html_tag:
+        new_tag = _set_attribute(_set_attribute(html_tag.group(0), 'lang', lang), 'data-prerendered', lang)
+        edits.append((html_tag.start(), html_tag.end(), new_tag))
+    lang_text = re.search(r'(<span class="lang-text">)[^<]*(</span>)', source)
+    if lang_text:
+        edits.append((lang_text.start(), lang_text.end(),
+                      lang_text.group(1) + LANG_BUTTON_TEXT.get(lang, lang.upper()) + lang_text.group(2)))
+
+    # 다른 언어 페이지 안내 (<link rel="alternate" hreflang>)
+    head_end = source.find('</head>')
+    if head_end != -1:
+        links = ''.join(f'    <link rel="alternate" hreflang="{other}" href="{page}">{newline}'
+                        for other, page in PAGES.items())
+        edits.append((head_end, head_end, links))
+
+    # 바깥 요소의 내용을 바꾸면 그 안의 요소 편집은 버림 (브라우저에서 textContent를 덮어쓴 것과 같음)
+    output = []
+    position = 0
+    for begin, end, text in sorted(edits, key=lambda edit: (edit[0], -edit[1])):
+        if begin < position:
+            continue
+        output.append(source[position:begin])
+        output.append(text)
+        position = end
+    output.append(source[position:])
+    return ''.join(output), applied
+
+
+def _line_start(source, offset):
+    return source.rfind('\n', 0, offset) + 1
+
+
+def _plain_text(fragment):
+    return _collapse(html.unescape(re.sub(r'<[^>]+>', ' ', fragment)))
+
+
+def _hashed_name(prefix, data, suffix):
+    return f"{prefix}.{hashlib.sha256(data.encode('utf-8')).hexdigest()[:HASH_LENGTH]}{suffix}"
+
+
+def paginate_projects(page, lang, per_page=PROJECTS_PER_PAGE):
+    """
+    프로젝트 카드를 처음 per_page개만 페이지에 남기고 나머지를 조각으로 나눔
+    반환값: (페이지 HTML, {파일명: 내용}, 전체 카드 수)
+    """
+    parser = _ElementParser(page, _is_project_element)
+    parser.feed(page)
+    parser.close()
+
+    grid = next((e for e in parser.elements if 'projects-grid' in (e[1].get('class') or '').split()), None)
+    if grid is None or grid[4] is None:
+        return page, {}, 0
+    grid_start, grid_close = grid[2], grid[4]
+    cards = [e for e in parser.elements
+             if 'project-card' in (e[1].get('class') or '').split() and grid_start < e[2] < grid_close
+             and e[4] is not None]
+    # 중첩된 카드는 없다고 보고, 바깥 카드만 사용
+    cards = [card for card in cards if not any(o[2] < card[2] < o[4] for o in cards if o is not card)]
+    if len(cards) <= per_page:
+        return page, {}, len(cards)
+
+    newline = '\r\n' if '\r\n' in page else '\n'
+    spans = [(_line_start(page, card[2]), page.index('>', card[4]) + 1) for card in cards]
+
+    files = {}
+    pages = []
+    for first in range(per_page, len(cards), per_page):
+        chunk = spans[first:first + per_page]
+        fragment = newline.join(page[begin:end] for begin, end in chunk) + newline
+        name = _hashed_name(f"{lang}.{first // per_page + 1}", fragment, '.html')
+        files[name] = fragment
+        pages.append(name)
+
+    index = {'version': 1, 'lang': lang, 'total': len(cards), 'inline': per_page, 'pages': pages, 'cards': []}
+    for number, card in enumerate(cards):
+        inner = [e for e in parser.elements if card[2] < e[2] < card[4]]
+        title = next((e for e in inner if 'project-title' in (e[1].get('class') or '').split()), None)
+        tags = [e for e in inner if 'tag' in (e[1].get('class') or '').split() and e[4] is not None]
+        index['cards'].append({
+            'title': _plain_text(page[title[3]:title[4]]) if title and title[4] is not None else '',
+            'tags': [_plain_text(page[tag[3]:tag[4]]) for tag in tags],
+            'page': number // per_page,
+        })
+    index_data = json.dumps(index, ensure_ascii=False, separators=(',', ':')) + '\n'
+    index_name = _hashed_name(f"{lang}.index", index_data, '.json')
+    files[index_name] = index_data
+
+    # 첫 페이지 다음 카드부터 마지막 카드까지 빼고, 목록 끝에 불러오기 표시(sentinel)를 둠
+    grid_end = page.index('>', grid_close) + 1
+    indent = page[_line_start(page, grid_start):grid_start]
+    relative = f"{PROJECTS_DIR.name}/{index_name}"
+    sentinel = (f'{newline}{indent}<div class="{PROJECTS_MORE_CLASS}" data-projects-index="{relative}" '
+                f'aria-hidden="true"></div>')
+    page = (page[:spans[per_page - 1][1]] + page[spans[-1][1]:grid_end] + sentinel + page[grid_end:])
+    return page, files, len(cards)
+
+
+def load_strings(lang):
+    """locales/<lang>.json -> 평탄한 'section.key' 맵"""
+    with open(LOCALES_DIR / f"{lang}.json", encoding='utf-8') as f:
+        return _flatten(json.load(f))
+
+
+def build_pages(langs=SUPPORTED_LANGS, per_page=PROJECTS_PER_PAGE):
+    """
+    언어별 페이지와 프로젝트 카드 조각 생성 (파일은 쓰지 않음)
+    per_page: 페이지에 남길 카드 수 (0이면 나누지 않음)
+    반환값: ({경로: 내용}, 보고서 행 목록)
+    """
+    # 줄바꿈(CRLF)을 그대로 유지하도록 newline='' 로 읽음
+    with open(INDEX_HTML, encoding='utf-8', newline='') as f:
+        source = f.read()
+    files = {}
+    report = []
+    for lang in langs:
+        translated, applied = render_page(source, load_strings(lang), lang)
+        page, fragments, cards = paginate_projects(translated, lang, per_page) if per_page else (translated, {}, 0)
+        files[ROOT_DIR / PAGES[lang]] = page
+        files.update({PROJECTS_DIR / name: data for name, data in fragments.items()})
+        report.append({'page': PAGES[lang], 'applied': applied, 'cards': cards,
+                       'inline': min(cards, per_page) if fragments else cards,
+                       'full_bytes': len(translated.encode('utf-8')), 'bytes': len(page.encode('utf-8')),
+                       'full_elements': _count_elements(translated), 'elements': _count_elements(page)})
+    return files, report
+
+
+def _count_elements(page):
+    """페이지를 불러올 때 만들어지는 요소 수 (시작 태그 수)"""
+    return len(re.findall(r'<[a-zA-Z]', re.sub(r'<!--.*?-->', '', page, flags=re.S)))
+
+
+def _read(path):
+    if not path.exists():
+        return None
+    with open(path, encoding='utf-8', newline='') as f:
+        return f.read()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="index.html + locales/*.json -> 언어별 사전 렌더링 페이지")
+    parser.add_argument('--check', action='store_true',
+                        help="파일을 쓰지 않고 페이지가 최신인지만 확인 (최신이 아니면 종료 코드 1)")
+    parser.add_argument('--per-page', type=int, default=PROJECTS_PER_PAGE,
+                        help=f"페이지에 남길 프로젝트 카드 수 (기본: {PROJECTS_PER_PAGE}, 0이면 나누지 않음)")
+    args = parser.parse_args(argv)
+
+    files, report = build_pages(per_page=args.per_page)
+    stale = [path for path, data in files.items() if _read(path) != data]
+    orphaned = [path for path in PROJECTS_DIR.glob('*') if path not in files] if PROJECTS_DIR.exists() else []
+    if args.check:
+        if stale or orphaned:
+            names = [path.relative_to(ROOT_DIR).as_posix() for path in stale + orphaned]
+            print(f"❌ 페이지가 index.html/locales와 다릅니다: {', '.join(names)}")
+            print("   python doc/build_pages.py를 실행해주세요.")
+            return 1
+        print("✅ 언어별 페이지가 최신입니다.")
+        return 0
+
+    for path in stale:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+            f.write(files[path])
+        tmp_path.replace(path)
+    for path in orphaned:
+        path.unlink()
+
+    for row in report:
+        print(f"🌐 {row['page']}: 번역 {row['applied']}곳 적용, "
+              f"{row['full_bytes'] / 1024:.1f}KB → {row['bytes'] / 1024:.1f}KB, "
+              f"요소 {row['full_elements']}개 → {row['elements']}개 "
+              f"(프로젝트 카드 {row['cards']}개 중 {row['inline']}개만 페이지에)")
+    source_bytes = INDEX_HTML.stat().st_size
+    print(f"📉 방문자가 받는 페이지: 원본 index.html {source_bytes / 1024:.1f}KB 대신 "
+          + ', '.join(f"{row['page']} {row['bytes'] / 1024:.1f}KB" for row in report))
+    print(f"📁 새로 씀 {len(stale)}개, 지움 {len(orphaned)}개 (조각: {PROJECTS_DIR})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
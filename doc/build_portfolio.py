@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+포트폴리오 문서 통합 빌드 스크립트
+PDF, DOCX, PPTX 생성 스크립트를 프로세스 풀에서 동시에 실행하고
+결과와 소요 시간을 모아서 보여줍니다.
+전체 소요 시간은 세 스크립트의 합이 아니라 가장 느린 스크립트 수준이 됩니다.
+입력이 바뀌지 않은 출력은 빌드 매니페스트(build_manifest.py)를 보고 건너뜁니다.
+
+언어 × 용지 크기 × 형식 조합(변형)을 한 번에 빌드할 수 있습니다.
+워커 프로세스는 여러 변형을 차례로 처리하면서 콘텐츠 모델, 등록된 폰트,
+스타일을 프로세스 안에서 재사용합니다. PPTX는 용지 크기와 무관하므로 언어별로 하나만 만듭니다.
+
+사용 방법:
+1. 필요 라이브러리 설치: pip install reportlab python-docx python-pptx Pillow
+2. 스크립트 실행: python doc/build_portfolio.py
+   - 특정 형식만: python doc/build_portfolio.py --formats pdf,pptx
+   - 순차 실행(디버깅용): python doc/build_portfolio.py --serial
+   - 변경 여부와 관계없이 전체 빌드: python doc/build_portfolio.py --force
+   - 변형 조합: python doc/build_portfolio.py --langs ko,en --pagesizes A4,letter
+   - 모든 조합: python doc/build_portfolio.py --matrix
+   - 파일이 바뀔 때마다 다시 빌드: python doc/build_portfolio.py --watch (watch_portfolio.py)
+   - 기술 태그별 맞춤 포트폴리오: python doc/build_portfolio.py --tailor android=Android,Kotlin --tailor Flutter
+     (tailor_portfolio.py, 결과는 doc/tailored/)
+3. 생성된 파일: doc/PORTFOLIO_PRESENTATION.pdf / .docx / .pptx (ko, A4)
+   그 밖의 변형: doc/PORTFOLIO_PRESENTATION_en_letter.pdf, doc/PORTFOLIO_PRESENTATION_en.pptx 등
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+# 현재 스크립트의 디렉토리를 기준으로 경로 설정
+SCRIPT_DIR = Path(__file__).parent.absolute()
+DOC_DIR = SCRIPT_DIR
+ROOT_DIR = SCRIPT_DIR.parent
+
+# 워커 프로세스에서도 doc/ 모듈을 import할 수 있도록 경로 추가
+if str(SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_DIR))
+
+from portfolio_content import SUPPORTED_LANGS, load_content
+from build_manifest import BuildManifest, inputs_hash
+
+# 형식 -> (모듈, 생성 함수)
+RENDERERS = {
+    'pdf': ('generate_portfolio_pdf', 'create_portfolio_pdf'),
+    'docx': ('generate_portfolio_doc', 'create_portfolio_doc'),
+    'pptx': ('generate_portfolio_ppt', 'create_portfolio_ppt'),
+}
+
+# 용지 크기 옵션이 있는 형식과 지원 용지 크기
+PAGED_FORMATS = ('pdf', 'docx')
+PAGE_SIZES = ('A4', 'letter')
+
+OUTPUT_NAME = "PORTFOLIO_PRESENTATION"
+DEFAULT_LANG = 'ko'
+DEFAULT_PAGESIZE = 'A4'
+
+
+def variants(formats=None, langs=None, pagesizes=None):
+    """
+    형식 × 언어 × 용지 크기 조합 목록 [(fmt, lang, pagesize), ...]
+    용지 크기가 없는 형식(PPTX)은 pagesize=None으로 언어별 하나만 포함합니다.
+    """
+    formats = list(formats or RENDERERS)
+    langs = list(langs or [DEFAULT_LANG])
+    pagesizes = list(pagesizes or [DEFAULT_PAGESIZE])
+    unknown = [fmt for fmt in formats if fmt not in RENDERERS]
+    if unknown:
+        raise ValueError(f"지원하지 않는 형식입니다: {', '.join(unknown)} (지원: {', '.join(RENDERERS)})")
+    unknown = [lang for lang in langs if lang not in SUPPORTED_LANGS]
+    if unknown:
+        raise ValueError(f"지원하지 않는 언어입니다: {', '.join(unknown)} (지원: {', '.join(SUPPORTED_LANGS)})")
+    unknown = [size for size in pagesizes if size not in PAGE_SIZES]
+    if unknown:
+        raise ValueError(f"지원하지 않는 용지 크기입니다: {', '.join(unknown)} (지원: {', '.join(PAGE_SIZES)})")
+
+    result = []
+    for lang in langs:
+        for pagesize in pagesizes:
+            for fmt in formats:
+                variant = (fmt, lang, pagesize if fmt in PAGED_FORMATS else None)
+                if variant not in result:
+                    result.append(variant)
+    return result
+
+
+def variant_label(fmt, lang, pagesize=None):
+    """결과 출력용 변형 이름 (예: pdf/en/letter)"""
+    return '/'.join(part for part in (fmt, lang, pagesize) if part)
+
+
+def output_path(fmt, lang=DEFAULT_LANG, pagesize=DEFAULT_PAGESIZE):
+    """
+    변형별 출력 파일 경로
+    기본 변형(ko, A4)은 doc/PORTFOLIO_PRESENTATION.<fmt>, 그 밖에는 언어/용지 크기를 붙입니다.
+    """
+    if fmt not in PAGED_FORMATS:
+        pagesize = None
+    if lang == DEFAULT_LANG and pagesize in (DEFAULT_PAGESIZE, None):
+        return DOC_DIR / f"{OUTPUT_NAME}.{fmt}"
+    suffix = f"_{lang}_{pagesize}" if pagesize else f"_{lang}"
+    return DOC_DIR / f"{OUTPUT_NAME}{suffix}.{fmt}"
+
+
+def _warm_worker(langs):
+    """워커 프로세스 시작 시 콘텐츠 모델을 미리 로드 (변형 간 공유)"""
+    for lang in langs:
+        load_content(lang)
+
+
+def warm_up(formats, langs):
+    """
+    생성기 모듈 import, 콘텐츠 모델 로드, 한글 폰트 등록, 스타일/템플릿 준비
+    (한 프로세스에서 계속 빌드하는 watch 모드/렌더 서버가 첫 요청 전에 한 번 실행)
+    """
+    _warm_worker(langs)
+    for fmt in formats:
+        module = importlib.import_module(RENDERERS[fmt][0])
+        if fmt == 'pdf':
+            module.create_styles(module.register_korean_fonts())
+        elif fmt == 'pptx':
+            from portfolio_textfit import default_metrics
+            from portfolio_theme import body_frame
+            body_frame('content')
+            default_metrics()
+
+
+def render_format(fmt, lang='ko', pagesize=None, filename=None, content=None):
+    """
+    한 변형을 렌더링 (워커 프로세스에서 실행)
+    filename: 저장 경로 (기본: output_path(), 렌더 서버는 임시 디렉토리에 저장)
+    content: 미리 준비한 콘텐츠 모델 (태그별 맞춤 포트폴리오 등, 기본: load_content(lang))
+    반환값: {'format', 'lang', 'pagesize', 'path', 'seconds', 'pid', 'error', 'skipped'}
+    """
+    module_name, func_name = RENDERERS[fmt]
+    started = time.perf_counter()
+    result = {'format': fmt, 'lang': lang, 'pagesize': pagesize, 'path': None, 'seconds': 0.0,
+              'pid': os.getpid(), 'error': None, 'skipped': False}
+    try:
+        module = importlib.import_module(module_name)
+        kwargs = {'lang': lang, 'filename': filename or output_path(fmt, lang, pagesize or DEFAULT_PAGESIZE)}
+        if fmt in PAGED_FORMATS:
+            kwargs['pagesize'] = pagesize or DEFAULT_PAGESIZE
+        if content is not None:
+            kwargs['content'] = content
+        path = getattr(module, func_name)(**kwargs)
+        result['path'] = str(path) if path else None
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+        result['traceback'] = traceback.format_exc()
+    result['seconds'] = time.perf_counter() - started
+    return result
+
+
+def build_all(formats=None, langs=None, pagesizes=None, jobs=None, serial=False, force=False, matrix=None):
+    """
+    여러 변형(형식 × 언어 × 용지 크기)을 동시에 빌드 (입력이 바뀌지 않은 출력은 건너뜀)
+    matrix: 빌드할 변형 목록을 직접 지정 (watch 모드에서 바뀐 파일에 영향받는 변형만 빌드할 때)
+    반환값: (결과 리스트, 전체 소요 시간, 매니페스트)
+    """
+    matrix = list(matrix) if matrix is not None else variants(formats, langs, pagesizes)
+    langs = sorted({lang for _, lang, _ in matrix})
+
+    # 워커들이 파싱 없이 디스크 캐시를 읽도록 콘텐츠 모델을 먼저 준비
+    _warm_worker(langs)
+
+    started = time.perf_counter()
+    manifest = BuildManifest()
+    digests = {}
+    results = []
+    pending = []
+    for variant in matrix:
+        fmt, lang, pagesize = variant
+        digests[variant] = inputs_hash(fmt, lang, extra={'pagesize': pagesize} if pagesize else None)
+        output = output_path(fmt, lang, pagesize)
+        if manifest.is_fresh(output, digests[variant], force=force):
+            results.append({'format': fmt, 'lang': lang, 'pagesize': pagesize, 'path': str(output),
+                            'seconds': 0.0, 'pid': os.getpid(), 'error': None, 'skipped': True})
+        else:
+            pending.append(variant)
+
+    if serial or len(pending) <= 1:
+        for variant in pending:
+            results.append(render_format(*variant))
+    else:
+        # 워커 수가 변형 수보다 적으면 각 워커가 여러 변형을 처리하며 폰트/스타일을 재사용
+        workers = min(jobs or os.cpu_count() or 1, len(pending))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker, initargs=(langs,)) as executor:
+            futures = [executor.submit(render_format, *variant) for variant in pending]
+            for future in as_completed(futures):
+                results.append(future.result())
+    wall_seconds = time.perf_counter() - started
+
+    # 변형별 경로에 정상적으로 생성된 출력만 매니페스트에 기록
+    for result in results:
+        if result['skipped'] or result['error'] or not result['path']:
+            continue
+        variant = (result['format'], result['lang'], result['pagesize'])
+        if Path(result['path']) == output_path(*variant):
+            manifest.record(result['path'], digests[variant], format=result['format'],
+                            lang=result['lang'], pagesize=result['pagesize'])
+    manifest.save()
+
+    results.sort(key=lambda r: matrix.index((r['format'], r['lang'], r['pagesize'])))
+    return results, wall_seconds, manifest
+
+
+def print_report(results, wall_seconds, manifest=None):
+    """빌드 결과 및 소요 시간 출력"""
+    print("\n📊 빌드 결과")
+    for result in results:
+        label = variant_label(result['format'], result['lang'], result['pagesize'])
+        if result['skipped']:
+            print(f"   ⏭️  {label:<15} {'-':>6}   변경 없음: {result['path']}")
+        elif result['error']:
+            print(f"   ❌ {label:<15} {result['seconds']:6.2f}s  {result['error']}")
+        else:
+            print(f"   ✅ {label:<15} {result['seconds']:6.2f}s  {result['path']}")
+    total = sum(r['seconds'] for r in results)
+    print(f"\n⏱️  전체 소요 시간: {wall_seconds:.2f}s (변형별 합계 {total:.2f}s, {len(results)}개 변형)")
+    if manifest is not None:
+        print(f"📋 매니페스트: hit {len(manifest.hits)}개, miss {len(manifest.misses)}개")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="포트폴리오 PDF/DOCX/PPTX 통합 빌드")
+    parser.add_argument('--formats', default=','.join(RENDERERS),
+                        help="빌드할 형식 (쉼표 구분, 기본: pdf,docx,pptx)")
+    parser.add_argument('--langs', '--lang', dest='langs', default=DEFAULT_LANG,
+                        help="콘텐츠 언어 (쉼표 구분, 기본: ko)")
+    parser.add_argument('--pagesizes', default=DEFAULT_PAGESIZE,
+                        help="PDF/DOCX 용지 크기 (쉼표 구분, 기본: A4, 지원: A4,letter)")
+    parser.add_argument('--matrix', action='store_true', help="모든 언어 × 모든 용지 크기 조합 빌드")
+    parser.add_argument('--jobs', type=int, default=None, help="워커 프로세스 수 (기본: 변형 수, 최대 CPU 수)")
+    parser.add_argument('--serial', action='store_true', help="프로세스 풀 없이 순차 실행")
+    parser.add_argument('--force', action='store_true', help="빌드 매니페스트를 무시하고 전체 빌드")
+    parser.add_argument('--watch', action='store_true',
+                        help="입력 파일을 감시하다가 바뀌면 영향받는 출력만 다시 빌드 (watch_portfolio.py)")
+    parser.add_argument('--tailor', action='append', metavar='[NAME=]TAG,...',
+                        help="기술 태그로 경력/프로젝트/기술을 걸러낸 맞춤 포트폴리오를 일괄 생성 (여러 번 지정 가능, "
+                             "tailor_portfolio.py)")
+    args = parser.parse_args(argv)
+
+    formats = [fmt.strip() for fmt in args.formats.split(',') if fmt.strip()]
+    langs = [lang.strip() for lang in args.langs.split(',') if lang.strip()]
+    pagesizes = [size.strip() for size in args.pagesizes.split(',') if size.strip()]
+    if args.matrix:
+        langs, pagesizes = list(SUPPORTED_LANGS), list(PAGE_SIZES)
+    if args.watch:
+        from watch_portfolio import watch
+        return watch(formats, langs, pagesizes, force=args.force)
+    if args.tailor:
+        from tailor_portfolio import run_tailor
+        return run_tailor(args.tailor, formats, langs, pagesizes, jobs=args.jobs,
+                          serial=args.serial, force=args.force)
+    try:
+        results, wall_seconds, manifest = build_all(formats, langs, pagesizes, jobs=args.jobs,
+                                                    serial=args.serial, force=args.force)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 2
+    print_report(results, wall_seconds, manifest)
+
+    failed = [r for r in results if r['error']]
+    for result in failed:
+        print(f"\n❌ {variant_label(result['format'], result['lang'], result['pagesize'])} 빌드 오류:")
+        print(result.get('traceback', result['error']))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+웹사이트 검색 색인 빌드
+포트폴리오 콘텐츠 모델(portfolio_content.load_content)의 프로젝트, 경력, 기술 텍스트로
+언어별 역색인(inverted index)을 만들어 search/<lang>.<hash>.json과 매니페스트로 저장합니다.
+js/app.js의 사이트 검색은 DOM을 훑지 않고 이 색인만 한 번 받아 바로 조회합니다.
+
+- 토큰: NFKC 정규화 + 소문자, 영문/숫자는 단어 단위(검색어는 앞부분 일치),
+  한글은 띄어쓰기/조사와 상관없이 찾도록 음절 n-gram(NGRAM_SIZE)으로 나눕니다 ('리딩시스템' → 리딩, 딩시, 시스, 스템).
+  한 음절짜리 한글 단어는 그 음절 하나를 토큰으로 씁니다.
+  js/app.js의 tokenizeSearchText()와 같은 규칙이어야 합니다 (SEARCH_INDEX_VERSION을 함께 올림).
+- 가중치: 제목 > 태그/기술 이름 > 본문 (FIELD_WEIGHTS), 점수는 브라우저에서 idf와 곱해 계산합니다.
+- 크기를 줄이려고 문서 번호는 앞 번호와의 차이로, 게시 목록은 [번호 차이, 가중치, ...] 평탄한 배열로 저장합니다.
+- 내용이 같으면 파일을 다시 쓰지 않고, 오래된 색인 파일은 지웁니다.
+  index.html이나 locales/*.json을 고친 뒤에는 이 스크립트를 실행해 search/를 함께 커밋합니다.
+
+사용 방법:
+    python doc/build_search.py                  # search/ 갱신
+    python doc/build_search.py --check          # 색인이 최신이 아니면 종료 코드 1
+    python doc/build_search.py --query "리딩"    # 색인으로 검색해 보기
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import re
+import sys
+import unicodedata
+from pathlib import Path
+
+# 현재 스크립트의 디렉토리를 기준으로 경로 설정
+SCRIPT_DIR = Path(__file__).parent.absolute()
+DOC_DIR = SCRIPT_DIR
+ROOT_DIR = SCRIPT_DIR.parent
+
+from portfolio_content import SUPPORTED_LANGS, load_content
+
+SEARCH_DIR = ROOT_DIR / "search"
+MANIFEST_PATH = SEARCH_DIR / "manifest.json"
+
+# 색인 형식이나 토큰 규칙이 바뀌면 올립니다 (js/app.js가 모르는 버전이면 검색을 끔).
+SEARCH_INDEX_VERSION = 1
+
+# 파일명에 넣는 내용 해시 길이
+HASH_LENGTH = 10
+
+# 한글 음절 n-gram 길이
+NGRAM_SIZE = 2
+
+# 필드별 가중치
+FIELD_WEIGHTS = {'title': 3, 'tags': 2, 'body': 1}
+
+# 문서 종류 -> (짧은 코드, 이동할 섹션, 종류 이름 locale 키)
+DOC_TYPES = {
+    'project': ('p', '#projects', 'nav.projects'),
+    'experience': ('e', '#experience', 'nav.experience'),
+    'skill': ('s', '#skills', 'nav.skills'),
+}
+
+_TOKEN_RUNS = re.compile(r'[가-힣]+|[a-z0-9]+')
+_HANGUL = re.compile(r'[가-힣]')
+
+
+def _run_tokens(run):
+    if not _HANGUL.match(run):
+        return [run]
+    if len(run) < NGRAM_SIZE:
+        return [run]
+    return [run[i:i + NGRAM_SIZE] for i in range(len(run) - NGRAM_SIZE + 1)]
+
+
+def query_words(text):
+    """검색어를 단어(한글 덩어리/영문·숫자 단어)별 토큰 목록으로 나눔"""
+    return [_run_tokens(run) for run in _TOKEN_RUNS.findall(unicodedata.normalize('NFKC', text or '').lower())]
+
+
+def tokenize(text):
+    """검색 토큰 목록 (한글은 음절 n-gram, 영문/숫자는 단어)"""
+    return [token for tokens in query_words(text) for token in tokens]
+
+
+def collect_documents(content):
+    """
+    검색 대상 문서 목록
+    반환값: [(종류, 제목, 부제목, {필드: 텍스트})]
+    """
+    docs = []
+    for project in content.projects:
+        subtitle = ' · '.join(part for part in (project.client, project.period) if part)
+        docs.append(('project', project.title, subtitle, {
+            'title': project.title,
+            'tags': ' '.join(project.tags or []),
+            'body': ' '.join([project.client or '', project.env or '', project.intro or '']
+                             + list(project.roles or [])),
+        }))
+    for experience in content.experiences:
+        subtitle = ' · '.join(part for part in (experience.company, experience.period) if part)
+        docs.append(('experience', experience.title, subtitle, {
+            'title': experience.title,
+            'tags': experience.company or '',
+            'body': experience.description or '',
+        }))
+    for group in content.skill_groups:
+        for skill in group.skills:
+            docs.append(('skill', skill.name, group.title, {
+                'title': skill.name,
+                'tags': group.title,
+                'body': skill.description or '',
+            }))
+    return docs
+
+
+def build_index(content):
+    """한 언어의 검색 색인 dict"""
+    docs = collect_documents(content)
+    postings = {}
+    for doc_id, (_, _, _, fields) in enumerate(docs):
+        weights = {}
+        for field, text in fields.items():
+            for token in tokenize(text):
+                weights[token] = weights.get(token, 0) + FIELD_WEIGHTS[field]
+        for token, weight in weights.items():
+            postings.setdefault(token, []).append((doc_id, weight))
+
+    terms = {}
+    for token in sorted(postings):
+        flat, previous = [], 0
+        for doc_id, weight in postings[token]:
+            flat += [doc_id - previous, weight]
+            previous = doc_id
+        terms[token] = flat
+    return {
+        'version': SEARCH_INDEX_VERSION,
+        'lang': content.lang,
+        'ngram': NGRAM_SIZE,
+        'types': {code: content.text(label_key, section[1:])
+                  for code, section, label_key in DOC_TYPES.values()},
+        'docs': [[DOC_TYPES[kind][0], title, subtitle, DOC_TYPES[kind][1]]
+                 for kind, title, subtitle, _ in docs],
+        'terms': terms,
+    }
+
+
+def encode_index(index):
+    """색인 JSON 바이트 (공백 없음 → 같은 내용이면 같은 해시)"""
+    return json.dumps(index, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def decode_postings(flat):
+    """[번호 차이, 가중치, ...] -> [(문서 번호, 가중치)]"""
+    result, doc_id = [], 0
+    for i in range(0, len(flat), 2):
+        doc_id += flat[i]
+        result.append((doc_id, flat[i + 1]))
+    return result
+
+
+def _token_scores(index, token):
+    """검색어 토큰 하나에 걸리는 문서 점수 (영문은 앞부분 일치, 한 음절 한글은 포함 일치)"""
+    if _HANGUL.match(token) and len(token) >= NGRAM_SIZE:
+        matches = [token] if token in index['terms'] else []
+    elif _HANGUL.match(token):
+        matches = [term for term in index['terms'] if token in term]
+    else:
+        matches = [term for term in index['terms'] if term.startswith(token)]
+    total = len(index['docs'])
+    scores = {}
+    for term in matches:
+        postings = decode_postings(index['terms'][term])
+        idf = math.log(1 + total / len(postings))
+        for doc_id, weight in postings:
+            scores[doc_id] = max(scores.get(doc_id, 0), idf * weight)
+    return scores
+
+
+def search(index, query, limit=8):
+    """
+    브라우저 검색(js/app.js searchPortfolio)과 같은 방식으로 색인 조회 (확인용)
+    한 단어 안의 토큰(n-gram)은 모두 걸려야 하고, 여러 단어는 더 많이 걸린 문서를 먼저,
+    같으면 idf × 가중치 합이 큰 순서로 정렬
+    """
+    results = {}  # 문서 번호 -> [걸린 단어 수, 점수]
+    for tokens in query_words(query):
+        word_scores = None
+        for token in dict.fromkeys(tokens):
+            scores = _token_scores(index, token)
+            word_scores = scores if word_scores is None else \
+                {doc_id: score + scores[doc_id] for doc_id, score in word_scores.items() if doc_id in scores}
+        for doc_id, score in (word_scores or {}).items():
+            entry = results.setdefault(doc_id, [0, 0.0])
+            entry[0] += 1
+            entry[1] += score
+    ranked = sorted(results.items(), key=lambda item: (-item[1][0], -item[1][1], item[0]))[:limit]
+    return [(index['docs'][doc_id], round(score, 2)) for doc_id, (_, score) in ranked]
+
+
+def compile_search(langs=SUPPORTED_LANGS):
+    """
+    색인 파일과 매니페스트 내용 생성 (파일은 쓰지 않음)
+    반환값: (매니페스트 dict, {파일명: 색인 바이트}, {언어: 색인 dict})
+    """
+    manifest = {'version': SEARCH_INDEX_VERSION, 'langs': {}}
+    files = {}
+    indexes = {}
+    for lang in langs:
+        index = build_index(load_content(lang))
+        data = encode_index(index)
+        name = f"{lang}.{hashlib.sha256(data).hexdigest()[:HASH_LENGTH]}.json"
+        files[name] = data
+        indexes[lang] = index
+        manifest['langs'][lang] = {'file': name, 'docs': len(index['docs']),
+                                   'terms': len(index['terms']), 'bytes': len(data)}
+    return manifest, files, indexes
+
+
+def encode_manifest(manifest):
+    return (json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True) + '\n').encode('utf-8')
+
+
+def write_search(manifest, files):
+    """색인/매니페스트 저장 (바뀐 파일만 씀), 반환값: (새로 쓴 파일 목록, 지운 파일 목록)"""
+    SEARCH_DIR.mkdir(parents=True, exist_ok=True)
+    outputs = dict(files)
+    outputs[MANIFEST_PATH.name] = encode_manifest(manifest)
+    written = []
+    for name, data in outputs.items():
+        path = SEARCH_DIR / name
+        if path.exists() and path.read_bytes() == data:
+            continue
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+        written.append(name)
+
+    removed = []
+    for path in SEARCH_DIR.glob('*.json'):
+        if path.name not in outputs:
+            path.unlink()
+            removed.append(path.name)
+    return written, removed
+
+
+def is_current(manifest, files):
+    """search/가 지금 콘텐츠로 만든 결과와 같은지 확인"""
+    if not MANIFEST_PATH.exists() or MANIFEST_PATH.read_bytes() != encode_manifest(manifest):
+        return False
+    return all((SEARCH_DIR / name).exists() for name in files)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="프로젝트/경력/기술 검색 색인(search/) 빌드")
+    parser.add_argument('--check', action='store_true',
+                        help="파일을 쓰지 않고 search/가 최신인지만 확인 (최신이 아니면 종료 코드 1)")
+    parser.add_argument('--query', help="만든 색인으로 검색해 결과 출력")
+    parser.add_argument('--lang', default=SUPPORTED_LANGS[0], help="--query에 쓸 언어 (기본: ko)")
+    args = parser.parse_args(argv)
+
+    manifest, files, indexes = compile_search()
+    if args.query is not None:
+        for (code, title, subtitle, _), score in search(indexes[args.lang], args.query):
+            print(f"{score:7.2f}  [{indexes[args.lang]['types'][code]}] {title} — {subtitle}")
+        return 0
+    if args.check:
+        if is_current(manifest, files):
+            print(f"✅ 검색 색인이 최신입니다: {SEARCH_DIR}")
+            return 0
+        print("❌ 검색 색인이 콘텐츠와 다릅니다. python doc/build_search.py를 실행해주세요.")
+        return 1
+
+    written, removed = write_search(manifest, files)
+    for lang, info in manifest['langs'].items():
+        print(f"🔎 {lang}: 문서 {info['docs']}개, 토큰 {info['terms']}개, {info['bytes'] / 1024:.1f}KB  {info['file']}")
+    print(f"📁 저장 위치: {SEARCH_DIR} (새로 씀 {len(written)}개, 지움 {len(removed)}개)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
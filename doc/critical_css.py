@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+웹사이트 첫 화면(above-the-fold)용 critical CSS 추출
+index.html에서 첫 화면에 보이는 요소(CRITICAL_ROOTS: 네비게이션, #home 히어로, 떠 있는 프로필 이미지)만
+골라 간단한 DOM을 만들고, css/style.css에서 그 요소에 적용될 수 있는 규칙만 남깁니다.
+doc/build_assets.py가 이 결과를 dist/index.html의 <head>에 <style>로 넣고
+전체 스타일시트는 비동기로 불러오므로, 첫 화면은 50KB 스타일시트를 기다리지 않고 그려집니다.
+
+- 선택자는 태그/#id/.class/[속성]과 자손·자식·형제 결합자로 맞춰 보고,
+  :hover, ::before 같은 가상 클래스/요소는 떼고 비교합니다 (남는 쪽으로 판단 → 빠뜨리지 않음).
+- js/app.js가 classList.add/toggle로 붙이는 클래스(active, clicked 등)는 어느 요소에나 붙을 수 있다고 봅니다.
+- :root, *, html, body 규칙과 @font-face는 항상 남기고, @media 안의 규칙도 같은 기준으로 고르며,
+  남은 규칙이 쓰는 @keyframes만 함께 남깁니다.
+
+사용 방법:
+    python doc/critical_css.py            # 첫 화면 규칙 수/크기 확인
+    python doc/critical_css.py --print    # 추출한 CSS 출력
+"""
+
+import argparse
+import re
+import sys
+from html.parser import HTMLParser
+from pathlib import Path
+
+# 현재 스크립트의 디렉토리를 기준으로 경로 설정
+SCRIPT_DIR = Path(__file__).parent.absolute()
+DOC_DIR = SCRIPT_DIR
+ROOT_DIR = SCRIPT_DIR.parent
+
+INDEX_HTML = ROOT_DIR / "index.html"
+APP_JS = ROOT_DIR / "js" / "app.js"
+
+# critical CSS를 뽑는 스타일시트 (사이트 루트 기준 경로, doc/build_assets.py가 비동기로 바꿀 <link>)
+CRITICAL_STYLESHEET = 'css/style.css'
+STYLE_CSS = ROOT_DIR / CRITICAL_STYLESHEET
+
+# 첫 화면에 보이는 영역 (이 요소와 그 자손, 조상이 critical CSS 대상)
+CRITICAL_ROOTS = ('.navbar', '#home')
+
+# 끝 태그가 없는 HTML 요소
+_VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta',
+              'source', 'track', 'wbr'}
+
+# 가상 클래스/요소 (:not(...)처럼 괄호 한 단계 중첩까지)
+_PSEUDO = re.compile(r'::?[\w-]+(?:\((?:[^()]|\([^()]*\))*\))?')
+_COMPOUND_PART = re.compile(r'([#.])([\w-]+)|\[\s*([\w-]+)[^\]]*\]|(\*|[a-zA-Z][\w-]*)')
+_STATE_CLASS = re.compile(r"classList\.(?:add|toggle)\(\s*['\"]([\w-]+)['\"]")
+_ANIMATION = re.compile(r'animation(?:-name)?\s*:([^;}]*)', re.I)
+
+
+class _Node:
+    __slots__ = ('tag', 'id', 'classes', 'attrs', 'parent', 'children')
+
+    def __init__(self, tag, attrs, parent):
+        self.tag = tag
+        attrs = dict(attrs)
+        self.id = attrs.get('id')
+        self.classes = set((attrs.get('class') or '').split())
+        self.attrs = set(attrs)
+        self.parent = parent
+        self.children = []
+
+
+class _TreeBuilder(HTMLParser):
+    """index.html -> _Node 트리 (닫는 태그가 빠져도 가장 가까운 같은 태그까지 닫음)"""
+
+    def __init__(self):
+        super().__init__()
+        self.root = _Node('#document', [], None)
+        self.stack = [self.root]
+
+    def handle_starttag(self, tag, attrs):
+        node = _Node(tag, attrs, self.stack[-1])
+        self.stack[-1].children.append(node)
+        if tag not in _VOID_TAGS:
+            self.stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        self.stack[-1].children.append(_Node(tag, attrs, self.stack[-1]))
+
+    def handle_endtag(self, tag):
+        for index in range(len(self.stack) - 1, 0, -1):
+            if self.stack[index].tag == tag:
+                del self.stack[index:]
+                break
+
+
+def _walk(node):
+    yield node
+    for child in node.children:
+        yield from _walk(child)
+
+
+def _parse_compound(text):
+    """'a.btn#x[href]' -> (태그, id, 클래스 집합, 속성 집합), 형식이 다르면 None"""
+    tag, node_id, classes, attrs = None, None, set(), set()
+    pos = 0
+    for match in _COMPOUND_PART.finditer(text):
+        if match.start() != pos:
+            return None
+        prefix, name, attr, element = match.groups()
+        if prefix == '#':
+            node_id = name
+        elif prefix == '.':
+            classes.add(name)
+        elif attr:
+            attrs.add(attr.lower())
+        elif element != '*':
+            tag = element.lower()
+        pos = match.end()
+    return (tag, node_id, classes, attrs) if pos == len(text) else None
+
+
+def split_selectors(prelude):
+    """쉼표로 나뉜 선택자 목록 (괄호 안의 쉼표는 무시)"""
+    selectors, depth, current = [], 0, []
+    for char in prelude:
+        if char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        if char == ',' and depth == 0:
+            selectors.append(''.join(current).strip())
+            current = []
+        else:
+            current.append(char)
+    selectors.append(''.join(current).strip())
+    return [selector for selector in selectors if selector]
+
+
+class FoldMatcher:
+    """첫 화면 요소에 선택자가 맞는지 판단"""
+
+    def __init__(self, html, roots=CRITICAL_ROOTS, state_classes=()):
+        builder = _TreeBuilder()
+        builder.feed(html)
+        builder.close()
+        self.state_classes = set(state_classes)
+        self.nodes = []
+        for root in roots:
+            compound = _parse_compound(root)
+            for node in _walk(builder.root):
+                if compound and self._matches_compound(node, compound):
+                    self.nodes.extend(n for n in _walk(node) if n not in self.nodes)
+                    ancestor = node.parent
+                    while ancestor is not builder.root and ancestor not in self.nodes:
+                        self.nodes.append(ancestor)
+                        ancestor = ancestor.parent
+
+    def _matches_compound(self, node, compound):
+        tag, node_id, classes, attrs = compound
+        return ((tag is None or node.tag == tag)
+                and (node_id is None or node.id == node_id)
+                and classes <= (node.classes | self.state_classes)
+                and attrs <= node.attrs)
+
+    def _matches_from(self, node, parts, index):
+        """parts[index]가 node에 맞고, 그 왼쪽 결합자/선택자도 맞는지"""
+        if not self._matches_compound(node, parts[index]):
+            return False
+        if index == 0:
+            return True
+        combinator, left = parts[index - 1], index - 2
+        if combinator == '>':
+            return node.parent is not None and self._matches_from(node.parent, parts, left)
+        if combinator in '+~':
+            siblings = node.parent.children if node.parent else []
+            previous = siblings[:siblings.index(node)]
+            if combinator == '+':
+                previous = previous[-1:]
+            return any(self._matches_from(sibling, parts, left) for sibling in previous)
+        ancestor = node.parent
+        while ancestor is not None:
+            if self._matches_from(ancestor, parts, left):
+                return True
+            ancestor = ancestor.parent
+        return False
+
+    def matches(self, selector):
+        """선택자가 첫 화면 요소 중 하나에 맞으면 True (해석할 수 없는 선택자도 True)"""
+        text = _PSEUDO.sub('', selector)
+        text = re.sub(r'\s*([>+~])\s*', r' \1 ', text).split()
+        parts = []
+        for token in text:
+            if token in ('>', '+', '~'):
+                parts.append(token)
+                continue
+            if parts and parts[-1] not in ('>', '+', '~'):
+                parts.append(' ')
+            compound = _parse_compound(token)
+            if compound is None:
+                return True
+            parts.append(compound)
+        if not parts or isinstance(parts[0], str) or isinstance(parts[-1], str):
+            # 가상 요소만 있는 선택자 (::selection 등) → 모든 요소
+            return True
+        return any(self._matches_from(node, parts, len(parts) - 1) for node in self.nodes)
+
+
+def _css_blocks(css):
+    """CSS -> [(prelude, body 또는 None)] (최상위 규칙/at-rule, 주석 제거)"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    blocks = []
+    i, n = 0, len(css)
+    while i < n:
+        brace = css.find('{', i)
+        semicolon = css.find(';', i)
+        if brace == -1 and semicolon == -1:
+            break
+        if semicolon != -1 and (brace == -1 or semicolon < brace):
+            # @charset / @import 같은 블록 없는 at-rule
+            blocks.append((css[i:semicolon].strip(), None))
+            i = semicolon + 1
+            continue
+        depth, j, quote = 0, brace, None
+        while j < n:
+            char = css[j]
+            if quote:
+                if char == '\\':
+                    j += 1
+                elif char == quote:
+                    quote = None
+            elif char in '\'"':
+                quote = char
+            elif char == '{':
+                depth += 1
+            elif char == '}':
+                depth -= 1
+                if depth == 0:
+                    break
+            j += 1
+        blocks.append((css[i:brace].strip(), css[brace + 1:j]))
+        i = j + 1
+    return blocks
+
+
+def _select_rules(blocks, matcher, keyframes):
+    """첫 화면에 필요한 규칙만 골라 CSS 텍스트 조각 목록으로 반환 (@keyframes는 keyframes에 모음)"""
+    kept = []
+    for prelude, body in blocks:
+        lowered = prelude.lower()
+        if body is None:
+            # <style> 안에서는 @charset이 의미 없으므로 @import만 유지
+            if lowered.startswith('@import'):
+                kept.append(prelude + ';')
+        elif lowered.startswith(('@media', '@supports')):
+            inner = _select_rules(_css_blocks(body), matcher, keyframes)
+            if inner:
+                kept.append(prelude + '{' + ''.join(inner) + '}')
+        elif re.match(r'@(?:-\w+-)?keyframes\b', lowered):
+            keyframes[prelude.split()[-1]] = prelude + '{' + body + '}'
+        elif lowered.startswith('@font-face'):
+            kept.append(prelude + '{' + body + '}')
+        elif not lowered.startswith('@'):
+            selectors = [s for s in split_selectors(prelude) if matcher.matches(s)]
+            if selectors:
+                kept.append(','.join(selectors) + '{' + body.strip() + '}')
+    return kept
+
+
+def state_classes(js):
+    """js/app.js가 실행 중에 붙이는 클래스 이름"""
+    return set(_STATE_CLASS.findall(js))
+
+
+def extract_critical_css(css, html, js='', roots=CRITICAL_ROOTS):
+    """첫 화면에 필요한 규칙만 남긴 CSS (원래 순서 유지, 압축하지 않음)"""
+    matcher = FoldMatcher(html, roots, state_classes(js))
+    keyframes = {}
+    kept = _select_rules(_css_blocks(css), matcher, keyframes)
+    used = set()
+    for rule in kept:
+        for value in _ANIMATION.findall(rule):
+            used.update(re.findall(r'[\w-]+', value))
+    kept += [rule for name, rule in keyframes.items() if name in used]
+    return '\n'.join(kept) + '\n'
+
+
+def load_critical_css():
+    """저장소의 index.html/css/style.css/js/app.js로 critical CSS 추출"""
+    return extract_critical_css(STYLE_CSS.read_text(encoding='utf-8'),
+                                INDEX_HTML.read_text(encoding='utf-8'),
+                                APP_JS.read_text(encoding='utf-8'))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="첫 화면(네비게이션/히어로)용 critical CSS 추출")
+    parser.add_argument('--print', action='store_true', help="추출한 CSS 출력")
+    args = parser.parse_args(argv)
+
+    critical = load_critical_css()
+    if args.print:
+        print(critical)
+        return 0
+    full = STYLE_CSS.stat().st_size
+    size = len(critical.encode('utf-8'))
+    print(f"✅ critical CSS: {size / 1024:.1f}KB "
+          f"(전체 {full / 1024:.1f}KB의 {size / full * 100:.0f}%)")
+    print(f"   대상: {', '.join(CRITICAL_ROOTS)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
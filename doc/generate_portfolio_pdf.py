@@ -3,16 +3,29 @@
 """
 Portfolio Website PDF 생성 스크립트
 index.html의 내용을 기반으로 모던한 PDF 문서를 생성합니다.
+콘텐츠는 portfolio_content.py의 공유 콘텐츠 모델(index.html + locales)에서 읽어옵니다.
 
 사용 방법:
 1. reportlab 설치: pip install reportlab
+   (선택) 프로젝트 스크린샷 포함: pip install Pillow
+   (선택) 핵심 역량 아이콘 포함: pip install svglib
 2. 스크립트 실행: python doc/generate_portfolio_pdf.py
    또는 doc 폴더에서: python generate_portfolio_pdf.py
+   - 영문/Letter: python doc/generate_portfolio_pdf.py --lang en --pagesize letter (→ PORTFOLIO_PRESENTATION_en_letter.pdf)
+   - 단계별 소요 시간: python doc/generate_portfolio_pdf.py --profile
+   - 단계별 cProfile 저장: python doc/generate_portfolio_pdf.py --profile-dir doc/.cache/profile
 3. 생성된 파일: doc/PORTFOLIO_PRESENTATION.pdf
+
+경력/프로젝트가 수백 개인 통합 포트폴리오는 스트리밍 모드로 생성합니다
+(create_portfolio_pdf(stream=True), 항목 수가 STREAM_THRESHOLD를 넘으면 자동).
+flowable을 제너레이터에서 STREAM_BUFFER_SIZE개씩만 만들어 레이아웃하므로
+스토리 전체를 메모리에 올리지 않습니다. measure_memory=True로 최대 메모리를 확인할 수 있습니다.
 """
 
+import argparse
 import os
 import sys
+import tracemalloc
 from pathlib import Path
 from datetime import datetime
 
@@ -25,42 +38,60 @@ from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib import colors
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle, Image
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
 from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfgen.canvas import Canvas
+from xml.sax.saxutils import escape
+
+from portfolio_content import load_content
+from portfolio_fonts import FONT_ENV_VAR, discover_korean_fonts, load_ttfont
+from portfolio_icons import competency_icons
+from portfolio_images import fit_size, project_images
+from portfolio_profile import add_profile_arguments, phase, profile_phases
+
+# 지원 용지 크기 (이름 -> reportlab pagesize)
+PAGE_SIZES = {
+    'A4': A4,
+    'letter': letter,
+}
+
+# 경력 + 프로젝트 항목 수가 이 값을 넘으면 스트리밍 모드로 생성
+STREAM_THRESHOLD = 200
+
+# 스트리밍 모드에서 미리 만들어 두는 flowable 수 (keepWithNext 등 앞보기에 필요한 여유분)
+STREAM_BUFFER_SIZE = 64
+
+# 스트리밍 모드의 메모리 상한 (MB, tracemalloc 측정값 기준)
+MEMORY_CEILING_MB = 32
+
+# 폰트 이름 -> 스타일 딕셔너리 (같은 프로세스의 여러 변형 빌드에서 재사용)
+_STYLE_CACHE = {}
 
 def register_korean_fonts():
-    """한글 폰트 등록"""
+    """한글 폰트 등록 (Windows/Linux/macOS 폰트 탐색, 파싱 결과 캐시 사용)"""
+    # 같은 프로세스에서 이미 등록했다면 재사용
+    if 'KoreanFont' in pdfmetrics.getRegisteredFontNames():
+        return 'KoreanFont'
+    
     try:
-        # Windows 기본 한글 폰트 경로들
-        font_paths = [
-            'C:/Windows/Fonts/malgun.ttf',  # 맑은 고딕
-            'C:/Windows/Fonts/gulim.ttc',   # 굴림
-            'C:/Windows/Fonts/batang.ttc',  # 바탕
-        ]
-        
         korean_font_name = None
         
         # 사용 가능한 폰트 찾기
-        for font_path in font_paths:
-            if os.path.exists(font_path):
-                try:
-                    if font_path.endswith('.ttc'):
-                        # TTC 파일의 경우 인덱스 지정 필요 (보통 0)
-                        pdfmetrics.registerFont(TTFont('KoreanFont', font_path, subfontIndex=0))
-                    else:
-                        pdfmetrics.registerFont(TTFont('KoreanFont', font_path))
-                    korean_font_name = 'KoreanFont'
-                    print(f"✅ 한글 폰트 등록 성공: {font_path}")
-                    break
-                except Exception as e:
-                    print(f"⚠️ 폰트 등록 실패 ({font_path}): {e}")
-                    continue
+        for font_path in discover_korean_fonts():
+            try:
+                # TTC 파일의 경우 인덱스 지정 필요 (보통 0)
+                pdfmetrics.registerFont(load_ttfont('KoreanFont', font_path, subfont_index=0))
+                korean_font_name = 'KoreanFont'
+                print(f"✅ 한글 폰트 등록 성공: {font_path}")
+                break
+            except Exception as e:
+                print(f"⚠️ 폰트 등록 실패 ({font_path}): {e}")
+                continue
         
         if not korean_font_name:
             print("⚠️ 한글 폰트를 찾을 수 없습니다. 기본 폰트를 사용합니다.")
-            print("💡 한글이 깨질 수 있습니다. Windows 폰트 경로를 확인해주세요.")
+            print(f"💡 한글이 깨질 수 있습니다. {FONT_ENV_VAR} 환경 변수로 폰트 경로를 지정해주세요.")
             return 'Helvetica'  # 기본 폰트
         
         return korean_font_name
@@ -68,32 +99,52 @@ def register_korean_fonts():
         print(f"⚠️ 폰트 등록 중 오류: {e}")
         return 'Helvetica'
 
-def create_portfolio_pdf():
-    """포트폴리오 PDF 생성"""
-    # 한글 폰트 등록
-    korean_font = register_korean_fonts()
-    
-    # PDF 파일 생성 (기존 파일이 열려있으면 타임스탬프 추가)
-    base_filename = DOC_DIR / "PORTFOLIO_PRESENTATION.pdf"
-    filename = base_filename
-    
-    # 기존 파일이 있고 열려있으면 타임스탬프 추가
-    if filename.exists():
-        try:
-            # 파일이 쓰기 가능한지 테스트
-            test_file = open(filename, 'r+b')
-            test_file.close()
-        except (PermissionError, IOError):
-            # 파일이 열려있으면 새 이름으로 저장
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = DOC_DIR / f"PORTFOLIO_PRESENTATION_{timestamp}.pdf"
-            print(f"⚠️  기존 PDF 파일이 열려있어 새 파일명으로 저장합니다: {filename.name}")
-    
-    doc = SimpleDocTemplate(str(filename), pagesize=A4,
-                            rightMargin=72, leftMargin=72,
-                            topMargin=72, bottomMargin=18)
+class FlowableStream(list):
+    """
+    제너레이터에서 flowable을 조금씩 채워 넣는 리스트
+    reportlab의 build()는 리스트 앞에서 flowable을 하나씩 꺼내고(del flowables[0])
+    분할된 조각을 다시 앞에 넣으므로, len()이 호출될 때마다 버퍼를 채워
+    전체 스토리 대신 buffer_size개 정도만 메모리에 유지합니다.
+    """
+
+    def __init__(self, flowables, buffer_size=STREAM_BUFFER_SIZE):
+        super().__init__()
+        self._source = iter(flowables)
+        self._exhausted = False
+        self.buffer_size = buffer_size
+        self.consumed = 0
+        self._fill()
+
+    def _fill(self):
+        while not self._exhausted and list.__len__(self) < self.buffer_size:
+            try:
+                list.append(self, next(self._source))
+                self.consumed += 1
+            except StopIteration:
+                self._exhausted = True
+
+    def __len__(self):
+        self._fill()
+        return list.__len__(self)
+
+    def __bool__(self):
+        return len(self) > 0
+
+class TimedCanvas(Canvas):
+    """save()(PDF 직렬화/압축/쓰기)를 레이아웃과 구분해 'save' 단계로 측정하는 캔버스"""
+
+    def save(self):
+        with phase('save'):
+            super().save()
+
+def create_styles(korean_font):
+    """
+    문서 스타일 생성 (폰트 이름별로 캐시)
+    반환값: (hex 색상 딕셔너리, 스타일 딕셔너리)
+    """
+    if korean_font in _STYLE_CACHE:
+        return _STYLE_CACHE[korean_font]
     
-    # 스타일 정의
     styles = getSampleStyleSheet()
     
     # 모던한 색상 팔레트 (Color 객체와 hex 문자열 모두 저장)
@@ -168,353 +219,253 @@ def create_portfolio_pdf():
         fontName=korean_font
     )
     
-    # 스토리 (문서 내용) 리스트
-    story = []
+    palette = {
+        'primary': primary_color_hex,
+        'secondary': secondary_color_hex,
+        'accent': accent_color_hex,
+        'text': text_color_hex,
+    }
+    custom_styles = {
+        'title': title_style,
+        'heading1': heading1_style,
+        'heading2': heading2_style,
+        'normal': normal_style,
+        'bullet': bullet_style,
+        'subtitle': subtitle_style,
+    }
+    _STYLE_CACHE[korean_font] = (palette, custom_styles)
+    return _STYLE_CACHE[korean_font]
+
+def icon_heading(icon, title_paragraph):
+    """아이콘(Drawing) + 제목 한 줄 (여백 없는 2열 표)"""
+    row = Table([[icon, title_paragraph]], colWidths=[icon.width + 8, 5.5*inch], hAlign='LEFT')
+    row.setStyle(TableStyle([
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('LEFTPADDING', (0, 0), (-1, -1), 0),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+        ('TOPPADDING', (0, 0), (-1, -1), 0),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+    ]))
+    return row
+
+def iter_story(content, korean_font, images=None, icons=None):
+    """
+    문서 내용(flowable)을 순서대로 생성하는 제너레이터
+    공유 콘텐츠 모델(index.html + locales)에서 만들며, 스트리밍 모드에서는
+    전체 리스트를 만들지 않고 레이아웃 엔진이 필요한 만큼만 꺼내 갑니다.
+    images: 프로젝트 key -> (축소본 경로, 픽셀 크기), portfolio_images.project_images() 결과
+    icons: 핵심 역량 key -> Drawing, portfolio_icons.competency_icons() 결과
+    """
+    images = images or {}
+    icons = icons or {}
+    # 스타일 (폰트별로 한 번만 생성)
+    palette, styles = create_styles(korean_font)
+    secondary_color_hex = palette['secondary']
+    accent_color_hex = palette['accent']
+    title_style = styles['title']
+    heading1_style = styles['heading1']
+    heading2_style = styles['heading2']
+    normal_style = styles['normal']
+    bullet_style = styles['bullet']
+    subtitle_style = styles['subtitle']
+    
+    text = content.text
     
     # 1. 타이틀 페이지
-    story.append(Spacer(1, 2*inch))
-    story.append(Paragraph("Portfolio", title_style))
-    story.append(Spacer(1, 0.3*inch))
-    story.append(Paragraph("Full-Stack Developer", subtitle_style))
-    story.append(Paragraph("Java • Spring Framework • Flutter • Mobile Development", subtitle_style))
-    story.append(PageBreak())
+    yield Spacer(1, 2*inch)
+    yield Paragraph(escape(text('nav.logo', 'Portfolio')), title_style)
+    yield Spacer(1, 0.3*inch)
+    yield Paragraph(escape(text('hero.title')), subtitle_style)
+    yield Paragraph(escape(text('hero.subtitle')), subtitle_style)
+    yield PageBreak()
     
     # 2. About Me 섹션
-    story.append(Paragraph("About Me", heading1_style))
-    story.append(Paragraph("<b>Full-Stack 개발자</b>", normal_style))
-    story.append(Spacer(1, 0.2*inch))
-    
-    story.append(Paragraph("<b>전문 분야:</b>", normal_style))
-    story.append(Paragraph("• Java, Spring Framework, Flutter 등 다양한 기술 스택을 활용한 웹 및 모바일 애플리케이션 개발", bullet_style))
-    story.append(Paragraph("• 우리은행, 신한은행, KB국민카드 등 금융권 프로젝트 경험", bullet_style))
-    story.append(Paragraph("• 안드로이드 네이티브 앱 개발부터 백엔드 서버 개발까지 전반적인 개발 역량", bullet_style))
-    
-    story.append(Spacer(1, 0.1*inch))
-    story.append(Paragraph("<b>주요 통계:</b>", normal_style))
-    story.append(Paragraph("✓ 15+ 프로젝트 완료", bullet_style))
-    story.append(Paragraph("✓ 6+ 년 프리랜서 경력", bullet_style))
-    story.append(Paragraph("✓ 4개 자격증 보유", bullet_style))
-    
-    story.append(Spacer(1, 0.1*inch))
-    story.append(Paragraph("지속적인 학습과 성장을 통해 더 나은 개발자가 되기 위해 노력하고 있으며, 최근에는 Spring Framework 기반 Java Full-Stack 개발자 양성과정을 수료하여 최신 기술을 습득했습니다.", normal_style))
-    story.append(PageBreak())
-    
-    # 3. Technical Skills 섹션
-    story.append(Paragraph("Technical Skills", heading1_style))
-    
-    # Backend
-    story.append(Paragraph("Backend", heading2_style))
-    backend_skills = [
-        ('Java', '90%', '객체지향 프로그래밍, 멀티스레딩'),
-        ('Spring Framework', '90%', 'MVC, Security, Data JPA'),
-        ('Spring Boot', '85%', '마이크로서비스 아키텍처'),
-        ('Spring AI', '80%', 'AI 통합 및 LLM 연동'),
-        ('JSP/Servlet', '85%', '웹 애플리케이션 개발'),
-        ('MyBatis', '85%', '데이터베이스 매핑'),
-        ('Python', '80%', '스크립팅 및 자동화')
-    ]
-    
-    for skill, level, desc in backend_skills:
-        story.append(Paragraph(f"• <b>{skill}</b> ({level}) - {desc}", bullet_style))
-    
-    story.append(Spacer(1, 0.1*inch))
-    story.append(Paragraph("<b>주요 경험:</b>", normal_style))
-    story.append(Paragraph("✓ RESTful API 설계 및 구현", bullet_style))
-    story.append(Paragraph("✓ Spring Security 기반 인증/인가 시스템", bullet_style))
-    story.append(Paragraph("✓ OAuth2 소셜 로그인 통합", bullet_style))
-    story.append(Paragraph("✓ Spring AI를 활용한 AI 기능 구현", bullet_style))
-    
-    # Frontend & Mobile
-    story.append(Spacer(1, 0.2*inch))
-    story.append(Paragraph("Frontend & Mobile", heading2_style))
-    frontend_skills = [
-        ('HTML5/CSS3', '90%', '반응형 웹 디자인'),
-        ('Bootstrap', '85%', 'UI 프레임워크'),
-        ('JavaScript/jQuery', '85%', '동적 웹 개발'),
-        ('Flutter/Dart', '85%', '크로스 플랫폼 개발'),
-        ('Android/Java & Kotlin', '90%', '네이티브 앱 개발'),
-        ('iOS/Swift & SwiftUI', '80%', 'iOS 앱 개발'),
-        ('Python', '80%', '모바일 자동화')
-    ]
-    
-    for skill, level, desc in frontend_skills:
-        story.append(Paragraph(f"• <b>{skill}</b> ({level}) - {desc}", bullet_style))
-    
-    story.append(Spacer(1, 0.1*inch))
-    story.append(Paragraph("<b>주요 경험:</b>", normal_style))
-    story.append(Paragraph("✓ Flutter 기반 크로스 플랫폼 앱 개발", bullet_style))
-    story.append(Paragraph("✓ Android 네이티브 앱 개발 (금융권 프로젝트)", bullet_style))
-    story.append(Paragraph("✓ iOS 앱 개발 및 배포", bullet_style))
-    story.append(Paragraph("✓ 반응형 웹 애플리케이션 개발", bullet_style))
-    
-    # Database & Tools
-    story.append(Spacer(1, 0.2*inch))
-    story.append(Paragraph("Database & Tools", heading2_style))
-    db_tools = [
-        ('Oracle', '85%', '엔터프라이즈 데이터베이스'),
-        ('Git/GitHub & GitLab & Bitbucket', '85%', '버전 관리'),
-        ('CI/CD (Jenkins)', '75%', '지속적 통합/배포'),
-        ('Docker', '80%', '컨테이너화'),
-        ('Figma', '80%', 'UI/UX 디자인')
-    ]
-    
-    for tool, level, desc in db_tools:
-        story.append(Paragraph(f"• <b>{tool}</b> ({level}) - {desc}", bullet_style))
-    
-    story.append(Spacer(1, 0.1*inch))
-    story.append(Paragraph("<b>주요 경험:</b>", normal_style))
-    story.append(Paragraph("✓ Oracle 23 AI 데이터베이스 설계 및 최적화", bullet_style))
-    story.append(Paragraph("✓ Git 기반 협업 및 코드 리뷰", bullet_style))
-    story.append(Paragraph("✓ Docker를 활용한 컨테이너화 및 배포", bullet_style))
-    story.append(Paragraph("✓ CI/CD 파이프라인 구축 및 관리", bullet_style))
-    story.append(PageBreak())
-    
-    # 4. Key Experience 섹션
-    story.append(Paragraph("Key Experience", heading1_style))
-    
-    experiences = [
-        {
-            'company': '우리은행',
-            'project': 'WON뱅킹 Re-Modeling',
-            'period': '2022.07 - 2023.07 (12개월)',
-            'description': [
-                '우리은행 개인비대면 채널 Re-Modeling 추진사업',
-                '만보기 기능 추가',
-                '이체기능 네이티브 → 웹 서비스 전환',
-                '로컬 CI/CD 환경 구축'
-            ],
-            'tech': 'Android, Java, Kotlin, WebView, CI/CD'
-        },
-        {
-            'company': '신한은행',
-            'project': '땡겨요 O2O 플랫폼',
-            'period': '2021.10 - 2022.02 (5개월)',
-            'description': [
-                '음식주문중개 O2O 플랫폼 구축',
-                'Pull refresh 확장기능 개발',
-                '땡기기 기능 구현',
-                'WebView 설계 및 구현',
-                'Docker를 이용한 암호화/빌드 시스템 관리'
-            ],
-            'tech': 'Android, Java, Docker, WebView'
-        },
-        {
-            'company': 'KB 국민카드',
-            'project': 'MyData 플랫폼',
-            'period': '2021.04 - 2021.08 (5개월)',
-            'description': [
-                'KB 국민카드 표준API기반 MyData 플랫폼 개편 프로젝트',
-                '표준API기반 MyData 기능 적용',
-                '전체메뉴 > 메뉴검색 기능 추가'
-            ],
-            'tech': 'Android, Java, RESTful API'
-        },
-        {
-            'company': '하나은행',
-            'project': 'Line Bank Indonesia',
-            'period': '2020.08 - 2021.03 (8개월)',
-            'description': [
-                '인도네시아 하나은행 Linebank 앱 개발',
-                'MVVM 패턴 설계 및 구현',
-                '보안 키패드 이슈 해결',
-                'Django & Bootstrap을 활용한 내부용 앱 배포 사이트 구축'
-            ],
-            'tech': 'Android, Java, MVVM, Django, Bootstrap'
-        },
-        {
-            'company': 'KB국민은행',
-            'project': '마이머니 App 고도화',
-            'period': '2019.08 - 2019.11 (4개월)',
-            'description': [
-                'KB국민은행 마이머니 Android App 고도화 작업',
-                '안드로이드 네이티브 앱 개발',
-                '인트로 화면/프로그레스바 고도화',
-                '지문인증 솔루션 업데이트',
-                'androidX 컨버팅'
-            ],
-            'tech': 'Android, Java, AndroidX'
-        },
-        {
-            'company': '키움증권',
-            'project': '영웅문S MTS 개발',
-            'period': '2018.05 - 2018.12 (8개월)',
-            'description': [
-                '키움증권 영웅문S MTS 고도화 프로젝트',
-                '관심종목 C++ 공통 플랫폼 개발',
-                'Javascript를 이용한 MTS 화면개발'
-            ],
-            'tech': 'C++, JavaScript, WebView'
-        }
-    ]
-    
-    for exp in experiences:
-        story.append(Paragraph(f"<b>{exp['company']} - {exp['project']}</b>", heading2_style))
-        period_p = Paragraph(f"<font color='{secondary_color_hex}'><b>{exp['period']}</b></font>", normal_style)
-        story.append(period_p)
-        story.append(Paragraph("<b>프로젝트 내용:</b>", normal_style))
-        for desc in exp['description']:
-            story.append(Paragraph(f"• {desc}", bullet_style))
-        tech_p = Paragraph(f"<i><font color='{accent_color_hex}'>기술 스택: {exp['tech']}</font></i>", normal_style)
-        story.append(tech_p)
-        story.append(Spacer(1, 0.2*inch))
-    
-    story.append(PageBreak())
-    
-    # 5. Featured Projects 섹션
-    story.append(Paragraph("Featured Projects", heading1_style))
-    
-    # Miracle Reading System
-    story.append(Paragraph("Miracle Reading System", heading2_style))
-    story.append(Paragraph("프로젝트 개요: 독서 습관 형성과 도서 관리를 위한 종합적인 웹 애플리케이션", normal_style))
-    story.append(Paragraph("<b>개발 기간:</b> 2025.11.10 - 2025.12.10 (1개월)", normal_style))
-    story.append(Paragraph("개발 형태: 개인 프로젝트 (1인 총괄 개발)", normal_style))
-    
-    story.append(Paragraph("<b>주요 기능:</b>", normal_style))
-    mrs_features = [
-        '사용자 인증 및 관리 (폼 로그인, OAuth2)',
-        '도서 관리 시스템 (알라딘 API 연동)',
-        'AI 기반 도서 요약 (Spring AI + Ollama)',
-        '독서 계획 및 기록 관리',
-        '속독 훈련 기능',
-        '갤러리 및 소셜 기능 (좋아요, 댓글)',
-        '마인드맵 기능',
-        '관리자 콘솔'
-    ]
-    for feature in mrs_features:
-        story.append(Paragraph(f"✓ {feature}", bullet_style))
-    
-    tech_p = Paragraph(f"<i><font color='{accent_color_hex}'>기술 스택: Java 17, Spring Boot 3.3.5, Spring AI, Oracle 23 AI, JSP, Bootstrap 5, jQuery, Docker, Ollama (Qwen3:1.7b)</font></i>", normal_style)
-    story.append(tech_p)
-    
-    story.append(Paragraph("<b>주요 성과:</b>", normal_style))
-    story.append(Paragraph("• AI 통합: Spring AI를 활용한 로컬 LLM 연동", bullet_style))
-    story.append(Paragraph("• 확장 가능한 아키텍처: 계층형 구조 설계", bullet_style))
-    story.append(Paragraph("• 다중 인증 시스템: 폼 로그인 + OAuth2 통합", bullet_style))
-    
-    story.append(Spacer(1, 0.2*inch))
-    
-    # Productivity Hub
-    story.append(Paragraph("Productivity Hub", heading2_style))
-    story.append(Paragraph("프로젝트 개요: Flutter 기반의 통합 생산성 앱", normal_style))
-    story.append(Paragraph("<b>개발 기간:</b> 2025.12.04 오후 (4시간)", normal_style))
-    story.append(Paragraph("개발 형태: 개인 프로젝트 (1인 총괄 개발)", normal_style))
-    
-    story.append(Paragraph("<b>주요 기능:</b>", normal_style))
-    ph_features = [
-        '할 일 관리 (Todo) - 추가/수정/삭제, 완료 상태 토글',
-        '아이디어 기록 - 카테고리별 아이디어 관리',
-        '독서 카드 - 독서 진행 관리, 키워드/요약 기록',
-        '날씨 정보 - 현재 위치 및 도시별 날씨 조회',
-        '뉴스 피드 - AI/양자컴퓨팅 관련 최신 뉴스'
-    ]
-    for feature in ph_features:
-        story.append(Paragraph(f"✓ {feature}", bullet_style))
-    
-    tech_p = Paragraph(f"<i><font color='{accent_color_hex}'>기술 스택: Flutter 3.x, Dart, Provider, SQLite, Open-Meteo API, RSS Feed, Geolocator</font></i>", normal_style)
-    story.append(tech_p)
-    
-    story.append(Paragraph("<b>아키텍처:</b>", normal_style))
-    story.append(Paragraph("• Provider 패턴 (MVVM 기반) 상태 관리", bullet_style))
-    story.append(Paragraph("• SQLite 로컬 데이터 저장", bullet_style))
-    story.append(Paragraph("• RESTful API 연동 (날씨, 뉴스)", bullet_style))
-    story.append(Paragraph("• 반응형 UI 디자인", bullet_style))
-    
-    story.append(PageBreak())
-    
-    # 6. Education & Certifications 섹션
-    story.append(Paragraph("Education & Certifications", heading1_style))
-    
-    # 학사/석사 학위
-    story.append(Paragraph("학위", heading2_style))
-    story.append(Paragraph("• <b>석사</b> - 광주과학기술원 기전공학과 (2005.03 ~ 2007.08)", bullet_style))
-    story.append(Paragraph("• <b>학사</b> - 강원대학교 전기전자공학과 (1995.03 ~ 2004.02)", bullet_style))
-    
-    story.append(Spacer(1, 0.2*inch))
-    story.append(Paragraph("교육 이력", heading2_style))
-    educations = [
-        ('Spring Framework 기반 Java Full-Stack 개발자 양성과정', '쌍용강북교육센터', '2025.05.12 - 2025.11.12', '944시간'),
-        ('소음진동평가모니터링시스템개발 과정', '경영기술개발원교육센터', '2012.06 - 2012.12', '960시간'),
-        ('임베디드 SW 전문가 과정', '한국정보기술연구원', '2007.10 - 2008.03', '960시간')
-    ]
-    
-    for edu, org, period, hours in educations:
-        story.append(Paragraph(f"• <b>{edu}</b>", bullet_style))
-        story.append(Paragraph(f"  {org} ({period}, {hours})", bullet_style))
-    
-    story.append(Spacer(1, 0.2*inch))
-    story.append(Paragraph("자격증", heading2_style))
-    certifications = [
-        ('정보처리기사', '2025.09'),
-        ('RFID-GL', '2013.11'),
-        ('SCJP', '2010.04'),
-        ('전기공사', '2004.08')
-    ]
-    
-    for cert, date in certifications:
-        story.append(Paragraph(f"✓ {cert} ({date})", bullet_style))
-    
-    story.append(Spacer(1, 0.2*inch))
-    story.append(Paragraph("해외 경험", heading2_style))
-    story.append(Paragraph("<b>산업인력공단 월드잡 연수 프로그램</b> (2010.07 ~ 2011.05)", bullet_style))
-    story.append(Paragraph("• Canadagate IT 비즈니스 실무 과정 참여", bullet_style))
-    story.append(Paragraph("• 레벨테스트 후 Advanced 과정(Toefl) 수업 약 4개월 수강", bullet_style))
-    story.append(Paragraph("• 현지영어기술습득과 잠재능력 활용을 위한 자기계발", bullet_style))
-    story.append(Paragraph("• 미국, 캐나다 Brain-based Speed Reading 세미나 참석", bullet_style))
-    
-    story.append(PageBreak())
-    
-    # 7. Core Competencies 섹션
-    story.append(Paragraph("Core Competencies", heading1_style))
-    
-    story.append(Paragraph("기술 역량", heading2_style))
-    story.append(Paragraph("<b>Full-Stack Development:</b>", normal_style))
-    story.append(Paragraph("• Backend: Java, Spring Framework, Spring Boot, Spring AI", bullet_style))
-    story.append(Paragraph("• Frontend: HTML5/CSS3, JavaScript, jQuery, Bootstrap", bullet_style))
-    story.append(Paragraph("• Mobile: Android (Java/Kotlin), iOS (Swift/SwiftUI), Flutter", bullet_style))
-    story.append(Paragraph("• Database: Oracle, SQLite", bullet_style))
-    story.append(Paragraph("• DevOps: Git, Docker, CI/CD (Jenkins)", bullet_style))
-    
-    story.append(Spacer(1, 0.2*inch))
-    story.append(Paragraph("프로젝트 경험", heading2_style))
-    story.append(Paragraph("<b>금융권 프로젝트:</b>", normal_style))
-    story.append(Paragraph("• 우리은행, 신한은행, KB국민카드/은행, 하나은행 등", bullet_style))
-    story.append(Paragraph("• 안드로이드 네이티브 앱 개발", bullet_style))
-    story.append(Paragraph("• 웹 서비스 전환 및 고도화", bullet_style))
-    story.append(Paragraph("• 보안 및 인증 시스템 구현", bullet_style))
-    
-    story.append(Paragraph("<b>기타 프로젝트:</b>", normal_style))
-    story.append(Paragraph("• O2O 플랫폼 개발", bullet_style))
-    story.append(Paragraph("• 증권사 MTS 개발", bullet_style))
-    story.append(Paragraph("• 도시가스 검침 시스템 개발", bullet_style))
-    story.append(Paragraph("• 통합 생산성 앱 개발", bullet_style))
-    
-    story.append(Spacer(1, 0.2*inch))
-    story.append(Paragraph("주요 강점", heading2_style))
-    strengths = [
-        '금융권 프로젝트 다수 경험',
-        '풀스택 개발 역량',
-        '크로스 플랫폼 개발 경험',
-        '최신 기술 학습 및 적용 능력'
-    ]
-    for strength in strengths:
-        story.append(Paragraph(f"✓ {strength}", bullet_style))
+    yield Paragraph(escape(text('about.title')), heading1_style)
+    yield Paragraph(f"<b>{escape(text('about.jobTitle'))}</b>", normal_style)
+    yield Spacer(1, 0.2*inch)
+    yield Paragraph(escape(text('about.p1')), normal_style)
+    yield Paragraph(escape(text('about.p2')), normal_style)
+    
+    yield Spacer(1, 0.1*inch)
+    for stat in content.stats:
+        yield Paragraph(f"✓ {escape(stat.value)} {escape(stat.label)}", bullet_style)
+    
+    for prefix in ('intlExp', 'study'):
+        yield Paragraph(escape(text(f'about.{prefix}Title')), heading2_style)
+        yield Paragraph(escape(text(f'about.{prefix}Desc')), normal_style)
+        for index in range(1, 4):
+            item = text(f'about.{prefix}Item{index}')
+            if item:
+                yield Paragraph(f"• {escape(item)}", bullet_style)
+    yield PageBreak()
+    
+    # 3. Core Competencies 섹션
+    yield Paragraph(escape(text('competencies.title')), heading1_style)
+    for competency in content.competencies:
+        if competency.key in icons:
+            yield Spacer(1, heading2_style.spaceBefore)
+            yield icon_heading(icons[competency.key], Paragraph(escape(competency.title), heading2_style))
+        else:
+            yield Paragraph(escape(competency.title), heading2_style)
+        yield Paragraph(f"<b>{escape(competency.summary)}</b>", normal_style)
+        for detail in competency.details:
+            yield Paragraph(f"• {escape(detail)}", bullet_style)
+    yield PageBreak()
+    
+    # 4. Technical Skills 섹션
+    yield Paragraph(escape(text('skills.title')), heading1_style)
+    for group in content.skill_groups:
+        yield Paragraph(escape(group.title), heading2_style)
+        for skill in group.skills:
+            level = f" ({skill.level}%)" if skill.level else ""
+            desc = f" - {escape(skill.description)}" if skill.description else ""
+            yield Paragraph(f"• <b>{escape(skill.name)}</b>{level}{desc}", bullet_style)
+        yield Spacer(1, 0.1*inch)
+    yield PageBreak()
+    
+    # 5. Key Experience 섹션
+    yield Paragraph(escape(text('experience.title')), heading1_style)
+    for exp in content.experiences:
+        yield Paragraph(f"<b>{escape(exp.company)}</b>", heading2_style)
+        period_p = Paragraph(f"<font color='{secondary_color_hex}'><b>{escape(exp.period)}</b></font> · {escape(exp.title)}", normal_style)
+        yield period_p
+        if exp.description:
+            yield Paragraph(escape(exp.description), normal_style)
+        yield Spacer(1, 0.1*inch)
+    yield PageBreak()
+    
+    # 6. Projects 섹션
+    yield Paragraph(escape(text('projects.title')), heading1_style)
+    for project in content.projects:
+        yield Paragraph(escape(project.title), heading2_style)
+        if project.key in images:
+            image_path, pixel_size = images[project.key]
+            width, height = fit_size(pixel_size, 'pdf')
+            yield Image(str(image_path), width=width*inch, height=height*inch)
+            yield Spacer(1, 0.1*inch)
+        yield Paragraph(f"<b>{escape(text('projects.client'))}</b> {escape(project.client)}", normal_style)
+        yield Paragraph(f"<b>{escape(text('projects.period'))}</b> {escape(project.period)}", normal_style)
+        if project.intro:
+            yield Paragraph(escape(project.intro), normal_style)
+        if project.roles:
+            yield Paragraph(f"<b>{escape(text('projects.role'))}:</b>", normal_style)
+            for role in project.roles:
+                yield Paragraph(f"✓ {escape(role)}", bullet_style)
+        if project.env:
+            tech_p = Paragraph(f"<i><font color='{accent_color_hex}'>{escape(text('projects.env'))} {escape(project.env)}</font></i>", normal_style)
+            yield tech_p
+        yield Spacer(1, 0.2*inch)
+    yield PageBreak()
+    
+    # 7. Education & Certifications 섹션
+    yield Paragraph(f"{escape(text('contact.education_title'))} & {escape(text('contact.cert_title'))}", heading1_style)
+    yield Paragraph(escape(text('contact.education_title')), heading2_style)
+    for education in content.education:
+        yield Paragraph(f"• {escape(education)}", bullet_style)
+    
+    yield Spacer(1, 0.2*inch)
+    yield Paragraph(escape(text('contact.cert_title')), heading2_style)
+    for cert in content.certifications:
+        yield Paragraph(f"✓ {escape(cert)}", bullet_style)
+    
+    yield Spacer(1, 0.2*inch)
+    yield Paragraph(escape(text('contact.exp_title')), heading2_style)
+    for career in content.careers:
+        yield Paragraph(f"• {escape(career)}", bullet_style)
     
     # 8. Contact 섹션
-    story.append(PageBreak())
-    story.append(Spacer(1, 2*inch))
-    story.append(Paragraph("Contact", heading1_style))
-    story.append(Spacer(1, 0.3*inch))
-    story.append(Paragraph("문의사항이 있으시면 언제든지 연락주세요.", normal_style))
-    story.append(Spacer(1, 0.2*inch))
-    story.append(Paragraph("LinkedIn: linkedin.com/in/namil-kim-a59951123", normal_style))
-    story.append(Paragraph("GitHub: github.com/NAM-IL", normal_style))
+    yield PageBreak()
+    yield Spacer(1, 2*inch)
+    yield Paragraph(escape(text('contact.title')), heading1_style)
+    yield Spacer(1, 0.3*inch)
+    yield Paragraph(escape(text('contact.subtitle')), normal_style)
+    yield Paragraph(escape(text('contact.linkedin_desc')), normal_style)
+    yield Spacer(1, 0.2*inch)
+    for label, url in (('LinkedIn', content.links.get('linkedin')), ('GitHub', content.links.get('github'))):
+        if url:
+            yield Paragraph(f"{label}: {escape(url)}", normal_style)
+
+def create_portfolio_pdf(lang='ko', pagesize='A4', filename=None, stream=None, measure_memory=False,
+                         content=None):
+    """
+    포트폴리오 PDF 생성
+    lang: 콘텐츠 언어 (ko/en), pagesize: 용지 크기 (A4/letter),
+    filename: 출력 경로 (기본: doc/PORTFOLIO_PRESENTATION.pdf)
+    stream: 스트리밍 모드 사용 여부 (None이면 경력+프로젝트 수가 STREAM_THRESHOLD를 넘을 때 자동 사용)
+    measure_memory: tracemalloc으로 스토리 생성~레이아웃 단계의 최대 메모리를 측정해 출력
+    content: 미리 준비한 콘텐츠 모델 (벤치마크/일괄 생성용, 기본: load_content(lang))
+    """
+    if pagesize not in PAGE_SIZES:
+        raise ValueError(f"지원하지 않는 용지 크기입니다: {pagesize} (지원: {', '.join(PAGE_SIZES)})")
+    
+    # 공유 콘텐츠 모델 로드 (index.html + locales/<lang>.json)
+    if content is None:
+        with phase('content'):
+            content = load_content(lang)
+    
+    # 한글 폰트 등록
+    with phase('fonts'):
+        korean_font = register_korean_fonts()
+    
+    # 스타일 생성 (폰트별로 캐시되므로 같은 프로세스의 두 번째 빌드부터는 즉시 반환)
+    with phase('styles'):
+        create_styles(korean_font)
+    
+    # PDF 파일 생성 (기존 파일이 열려있으면 타임스탬프 추가)
+    base_filename = Path(filename) if filename else DOC_DIR / "PORTFOLIO_PRESENTATION.pdf"
+    filename = base_filename
+    
+    # 기존 파일이 있고 열려있으면 타임스탬프 추가
+    if filename.exists():
+        try:
+            # 파일이 쓰기 가능한지 테스트
+            test_file = open(filename, 'r+b')
+            test_file.close()
+        except (PermissionError, IOError):
+            # 파일이 열려있으면 새 이름으로 저장
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = base_filename.with_name(f"{base_filename.stem}_{timestamp}.pdf")
+            print(f"⚠️  기존 PDF 파일이 열려있어 새 파일명으로 저장합니다: {filename.name}")
+    
+    doc = SimpleDocTemplate(str(filename), pagesize=PAGE_SIZES[pagesize],
+                            rightMargin=72, leftMargin=72,
+                            topMargin=72, bottomMargin=18)
+    
+    # 프로젝트 스크린샷 축소본과 역량 아이콘 준비 (캐시 사용, 여러 이미지는 동시에 처리)
+    with phase('images'):
+        images = project_images(content, 'pdf')
+        icons = competency_icons(content, 'pdf')
+    
+    # 메모리 측정은 스토리 생성 전부터 시작 (리스트 모드의 스토리도 측정값에 포함)
+    tracing = measure_memory and not tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.start()
+    
+    # 항목이 많으면 스트리밍 모드 (flowable을 제너레이터에서 필요한 만큼만 생성)
+    if stream is None:
+        stream = len(content.experiences) + len(content.projects) > STREAM_THRESHOLD
+    # (스트리밍 모드의 flowable 생성 시간은 레이아웃 단계에 포함됨)
+    with phase('build'):
+        if stream:
+            story = FlowableStream(iter_story(content, korean_font, images, icons))
+        else:
+            story = list(iter_story(content, korean_font, images, icons))
     
     # PDF 생성
     try:
-        doc.build(story)
+        story_count = None if stream else len(story)
+        with phase('layout'):
+            doc.build(story, canvasmaker=TimedCanvas)
+        if stream:
+            story_count = story.consumed
         print(f"✅ 포트폴리오 PDF가 생성되었습니다: {filename}")
-        print(f"📄 총 {len(story)}개의 요소가 포함되어 있습니다.")
-        print(f"\n💡 index.html의 내용을 기반으로 작성되었습니다.")
+        print(f"📄 총 {story_count}개의 요소가 포함되어 있습니다." + (" (스트리밍)" if stream else ""))
+        if measure_memory:
+            peak_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+            print(f"🧠 최대 메모리: {peak_mb:.1f}MB (상한 {MEMORY_CEILING_MB}MB)")
+            if stream and peak_mb > MEMORY_CEILING_MB:
+                print(f"⚠️  메모리 상한을 넘었습니다. 버퍼 크기(STREAM_BUFFER_SIZE)를 줄여보세요.")
+        print(f"\n💡 index.html과 locales/{lang}.json의 내용을 기반으로 작성되었습니다.")
         print(f"📁 저장 위치: {filename}")
     except PermissionError as e:
         print(f"❌ 권한 오류: PDF 파일을 생성할 수 없습니다.")
@@ -526,10 +477,24 @@ def create_portfolio_pdf():
         print(f"      3. 관리자 권한으로 실행해보세요.")
         print(f"   상세 오류: {e}")
         raise
+    finally:
+        if tracing:
+            tracemalloc.stop()
+    
+    return filename
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="포트폴리오 PDF 생성")
+    parser.add_argument('--lang', default='ko', help="콘텐츠 언어 (기본: ko)")
+    parser.add_argument('--pagesize', default='A4', choices=list(PAGE_SIZES), help="용지 크기 (기본: A4)")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    # 기본 변형(ko, A4)이 아니면 build_portfolio.py와 같은 변형 파일명으로 저장
+    from build_portfolio import output_path
     try:
-        create_portfolio_pdf()
+        with profile_phases(args.profile, args.profile_dir, prefix='pdf-'):
+            create_portfolio_pdf(lang=args.lang, pagesize=args.pagesize,
+                                 filename=output_path('pdf', args.lang, args.pagesize))
     except ImportError:
         print("❌ reportlab 라이브러리가 설치되지 않았습니다.")
         print("📦 설치 방법: pip install reportlab")
@@ -3,14 +3,28 @@
 """
 Portfolio Website PPT 생성 스크립트
 index.html의 내용을 기반으로 모던한 PowerPoint 프레젠테이션을 생성합니다.
+콘텐츠는 portfolio_content.py의 공유 콘텐츠 모델(index.html + locales)에서 읽어옵니다.
 
 사용 방법:
 1. python-pptx 설치: pip install python-pptx
+   (선택) 프로젝트 스크린샷 포함: pip install Pillow
+   (선택) 핵심 역량 아이콘 포함: pip install svglib rlPyCairo
 2. 스크립트 실행: python doc/generate_portfolio_ppt.py
    또는 doc 폴더에서: python generate_portfolio_ppt.py
+   - 영문: python doc/generate_portfolio_ppt.py --lang en (→ PORTFOLIO_PRESENTATION_en.pptx)
+   - 단계별 소요 시간: python doc/generate_portfolio_ppt.py --profile
+   - 단계별 cProfile 저장: python doc/generate_portfolio_ppt.py --profile-dir doc/.cache/profile
 3. 생성된 파일: doc/PORTFOLIO_PRESENTATION.pptx
+
+경력/프로젝트가 수백 개인 통합 포트폴리오는 스트리밍 모드로 생성합니다
+(create_portfolio_ppt(stream=True), 항목 수가 STREAM_THRESHOLD를 넘으면 자동).
+python-pptx 객체 트리 대신 portfolio_ooxml.StreamingPresentation이 슬라이드 XML을 하나씩 바로 zip에 씁니다.
+
+본문이 자리 표시자를 넘치면 portfolio_textfit이 글자 폭 표로 텍스트를 측정해
+다음 슬라이드로 나눕니다 (제목에 (1/3)처럼 번호가 붙음).
 """
 
+import argparse
 import os
 import sys
 from pathlib import Path
@@ -20,402 +34,175 @@ SCRIPT_DIR = Path(__file__).parent.absolute()
 DOC_DIR = SCRIPT_DIR
 ROOT_DIR = SCRIPT_DIR.parent
 
-from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
-from pptx.dml.color import RGBColor
-from pptx.enum.shapes import MSO_SHAPE
-
-def create_portfolio_ppt():
-    """포트폴리오 PPT 생성"""
-    prs = Presentation()
-    prs.slide_width = Inches(10)
-    prs.slide_height = Inches(7.5)
-    
-    # 모던한 색상 팔레트
-    primary_color = RGBColor(0, 51, 102)  # 진한 파란색
-    secondary_color = RGBColor(70, 130, 180)  # 스틸 블루
-    accent_color = RGBColor(255, 140, 0)  # 다크 오렌지
-    text_color = RGBColor(51, 51, 51)  # 다크 그레이
-    light_bg = RGBColor(245, 245, 250)  # 연한 배경
-    
-    # 슬라이드 1: 타이틀 슬라이드
-    slide1 = prs.slides.add_slide(prs.slide_layouts[0])
-    title = slide1.shapes.title
-    subtitle = slide1.placeholders[1]
-    
-    title.text = "Portfolio"
-    subtitle.text = "Full-Stack Developer\nJava • Spring Framework • Flutter • Mobile Development"
-    
-    # 타이틀 스타일 설정
-    title.text_frame.paragraphs[0].font.size = Pt(54)
-    title.text_frame.paragraphs[0].font.bold = True
-    title.text_frame.paragraphs[0].font.color.rgb = primary_color
-    subtitle.text_frame.paragraphs[0].font.size = Pt(24)
-    subtitle.text_frame.paragraphs[0].font.color.rgb = text_color
-    
-    # 슬라이드 2: 소개 (About Me)
-    slide2 = prs.slides.add_slide(prs.slide_layouts[1])
-    title2 = slide2.shapes.title
-    content2 = slide2.placeholders[1]
-    
-    title2.text = "About Me"
-    content2.text = """Full-Stack 개발자
-
-전문 분야:
-• Java, Spring Framework, Flutter 등 다양한 기술 스택을 활용한 웹 및 모바일 애플리케이션 개발
-• 우리은행, 신한은행, KB국민카드 등 금융권 프로젝트 경험
-• 안드로이드 네이티브 앱 개발부터 백엔드 서버 개발까지 전반적인 개발 역량
-
-주요 통계:
-✓ 15+ 프로젝트 완료
-✓ 6+ 년 프리랜서 경력
-✓ 4개 자격증 보유
-
-지속적인 학습과 성장을 통해 더 나은 개발자가 되기 위해 노력하고 있으며,
-최근에는 Spring Framework 기반 Java Full-Stack 개발자 양성과정을 수료하여 최신 기술을 습득했습니다."""
-    
-    title2.text_frame.paragraphs[0].font.size = Pt(44)
-    title2.text_frame.paragraphs[0].font.color.rgb = primary_color
-    
-    # 슬라이드 3: 기술 스택 - Backend
-    slide3 = prs.slides.add_slide(prs.slide_layouts[1])
-    title3 = slide3.shapes.title
-    content3 = slide3.placeholders[1]
-    
-    title3.text = "Technical Skills - Backend"
-    content3.text = """Backend Technologies:
-
-• Java (90%) - 객체지향 프로그래밍, 멀티스레딩
-• Spring Framework (90%) - MVC, Security, Data JPA
-• Spring Boot (85%) - 마이크로서비스 아키텍처
-• Spring AI (80%) - AI 통합 및 LLM 연동
-• JSP/Servlet (85%) - 웹 애플리케이션 개발
-• MyBatis (85%) - 데이터베이스 매핑
-• Python (80%) - 스크립팅 및 자동화
-
-주요 경험:
-✓ RESTful API 설계 및 구현
-✓ Spring Security 기반 인증/인가 시스템
-✓ OAuth2 소셜 로그인 통합
-✓ Spring AI를 활용한 AI 기능 구현"""
-    
-    title3.text_frame.paragraphs[0].font.size = Pt(36)
-    title3.text_frame.paragraphs[0].font.color.rgb = primary_color
-    
-    # 슬라이드 4: 기술 스택 - Frontend & Mobile
-    slide4 = prs.slides.add_slide(prs.slide_layouts[1])
-    title4 = slide4.shapes.title
-    content4 = slide4.placeholders[1]
-    
-    title4.text = "Technical Skills - Frontend & Mobile"
-    content4.text = """Frontend & Mobile Technologies:
-
-Frontend:
-• HTML5/CSS3 (90%) - 반응형 웹 디자인
-• Bootstrap (85%) - UI 프레임워크
-• JavaScript/jQuery (85%) - 동적 웹 개발
-• Flutter/Dart (85%) - 크로스 플랫폼 개발
-
-Mobile:
-• Android/Java & Kotlin (90%) - 네이티브 앱 개발
-• iOS/Swift & SwiftUI (80%) - iOS 앱 개발
-• Python (80%) - 모바일 자동화
-
-주요 경험:
-✓ Flutter 기반 크로스 플랫폼 앱 개발
-✓ Android 네이티브 앱 개발 (금융권 프로젝트)
-✓ iOS 앱 개발 및 배포
-✓ 반응형 웹 애플리케이션 개발"""
-    
-    title4.text_frame.paragraphs[0].font.size = Pt(36)
-    title4.text_frame.paragraphs[0].font.color.rgb = primary_color
-    
-    # 슬라이드 5: 기술 스택 - Database & Tools
-    slide5 = prs.slides.add_slide(prs.slide_layouts[1])
-    title5 = slide5.shapes.title
-    content5 = slide5.placeholders[1]
-    
-    title5.text = "Technical Skills - Database & Tools"
-    content5.text = """Database & DevOps Tools:
-
-Database:
-• Oracle (85%) - 엔터프라이즈 데이터베이스
-
-DevOps & Tools:
-• Git/GitHub & GitLab & Bitbucket (85%) - 버전 관리
-• CI/CD (Jenkins) (75%) - 지속적 통합/배포
-• Docker (80%) - 컨테이너화
-• Figma (80%) - UI/UX 디자인
-
-주요 경험:
-✓ Oracle 23 AI 데이터베이스 설계 및 최적화
-✓ Git 기반 협업 및 코드 리뷰
-✓ Docker를 활용한 컨테이너화 및 배포
-✓ CI/CD 파이프라인 구축 및 관리"""
-    
-    title5.text_frame.paragraphs[0].font.size = Pt(36)
-    title5.text_frame.paragraphs[0].font.color.rgb = primary_color
-    
-    # 슬라이드 6: 주요 경력 1
-    slide6 = prs.slides.add_slide(prs.slide_layouts[1])
-    title6 = slide6.shapes.title
-    content6 = slide6.placeholders[1]
-    
-    title6.text = "Key Experience (1/3)"
-    content6.text = """우리은행 - WON뱅킹 Re-Modeling
-2022.07 - 2023.07 (12개월)
-
-프로젝트 내용:
-• 우리은행 개인비대면 채널 Re-Modeling 추진사업
-• 만보기 기능 추가
-• 이체기능 네이티브 → 웹 서비스 전환
-• 로컬 CI/CD 환경 구축
-
-기술 스택: Android, Java, Kotlin, WebView, CI/CD
-
-─────────────────────────────────────
-
-신한은행 - 땡겨요 O2O 플랫폼
-2021.10 - 2022.02 (5개월)
-
-프로젝트 내용:
-• 음식주문중개 O2O 플랫폼 구축
-• Pull refresh 확장기능 개발
-• 땡기기 기능 구현
-• WebView 설계 및 구현
-• Docker를 이용한 암호화/빌드 시스템 관리
-
-기술 스택: Android, Java, Docker, WebView"""
-    
-    title6.text_frame.paragraphs[0].font.size = Pt(36)
-    title6.text_frame.paragraphs[0].font.color.rgb = primary_color
-    
-    # 슬라이드 7: 주요 경력 2
-    slide7 = prs.slides.add_slide(prs.slide_layouts[1])
-    title7 = slide7.shapes.title
-    content7 = slide7.placeholders[1]
-    
-    title7.text = "Key Experience (2/3)"
-    content7.text = """KB 국민카드 - MyData 플랫폼
-2021.04 - 2021.08 (5개월)
-
-프로젝트 내용:
-• KB 국민카드 표준API기반 MyData 플랫폼 개편 프로젝트
-• 표준API기반 MyData 기능 적용
-• 전체메뉴 > 메뉴검색 기능 추가
-
-기술 스택: Android, Java, RESTful API
-
-─────────────────────────────────────
-
-하나은행 - Line Bank Indonesia
-2020.08 - 2021.03 (8개월)
-
-프로젝트 내용:
-• 인도네시아 하나은행 Linebank 앱 개발
-• MVVM 패턴 설계 및 구현
-• 보안 키패드 이슈 해결
-• Django & Bootstrap을 활용한 내부용 앱 배포 사이트 구축
-
-기술 스택: Android, Java, MVVM, Django, Bootstrap"""
-    
-    title7.text_frame.paragraphs[0].font.size = Pt(36)
-    title7.text_frame.paragraphs[0].font.color.rgb = primary_color
-    
-    # 슬라이드 8: 주요 경력 3
-    slide8 = prs.slides.add_slide(prs.slide_layouts[1])
-    title8 = slide8.shapes.title
-    content8 = slide8.placeholders[1]
-    
-    title8.text = "Key Experience (3/3)"
-    content8.text = """KB국민은행 - 마이머니 App 고도화
-2019.08 - 2019.11 (4개월)
-
-프로젝트 내용:
-• KB국민은행 마이머니 Android App 고도화 작업
-• 안드로이드 네이티브 앱 개발
-• 인트로 화면/프로그레스바 고도화
-• 지문인증 솔루션 업데이트
-• androidX 컨버팅
-
-기술 스택: Android, Java, AndroidX
-
-─────────────────────────────────────
-
-키움증권 - 영웅문S MTS 개발
-2018.05 - 2018.12 (8개월)
-
-프로젝트 내용:
-• 키움증권 영웅문S MTS 고도화 프로젝트
-• 관심종목 C++ 공통 플랫폼 개발
-• Javascript를 이용한 MTS 화면개발
-
-기술 스택: C++, JavaScript, WebView"""
-    
-    title8.text_frame.paragraphs[0].font.size = Pt(36)
-    title8.text_frame.paragraphs[0].font.color.rgb = primary_color
-    
-    # 슬라이드 9: 주요 프로젝트 - Miracle Reading System
-    slide9 = prs.slides.add_slide(prs.slide_layouts[1])
-    title9 = slide9.shapes.title
-    content9 = slide9.placeholders[1]
-    
-    title9.text = "Featured Project - Miracle Reading System"
-    content9.text = """프로젝트 개요:
-독서 습관 형성과 도서 관리를 위한 종합적인 웹 애플리케이션
-
-개발 기간: 2025.11.10 - 2025.12.10 (1개월)
-개발 형태: 개인 프로젝트 (1인 총괄 개발)
-
-주요 기능:
-✓ 사용자 인증 및 관리 (폼 로그인, OAuth2)
-✓ 도서 관리 시스템 (알라딘 API 연동)
-✓ AI 기반 도서 요약 (Spring AI + Ollama)
-✓ 독서 계획 및 기록 관리
-✓ 속독 훈련 기능
-✓ 갤러리 및 소셜 기능 (좋아요, 댓글)
-✓ 마인드맵 기능
-✓ 관리자 콘솔
-
-기술 스택:
-Java 17, Spring Boot 3.3.5, Spring AI, Oracle 23 AI,
-JSP, Bootstrap 5, jQuery, Docker, Ollama (Qwen3:1.7b)
-
-주요 성과:
-• AI 통합: Spring AI를 활용한 로컬 LLM 연동
-• 확장 가능한 아키텍처: 계층형 구조 설계
-• 다중 인증 시스템: 폼 로그인 + OAuth2 통합"""
-    
-    title9.text_frame.paragraphs[0].font.size = Pt(32)
-    title9.text_frame.paragraphs[0].font.color.rgb = primary_color
-    
-    # 슬라이드 10: 주요 프로젝트 - Productivity Hub
-    slide10 = prs.slides.add_slide(prs.slide_layouts[1])
-    title10 = slide10.shapes.title
-    content10 = slide10.placeholders[1]
-    
-    title10.text = "Featured Project - Productivity Hub"
-    content10.text = """프로젝트 개요:
-Flutter 기반의 통합 생산성 앱
-
-개발 기간: 2025.12.04 오후 (4시간)
-개발 형태: 개인 프로젝트 (1인 총괄 개발)
-
-주요 기능:
-✓ 할 일 관리 (Todo) - 추가/수정/삭제, 완료 상태 토글
-✓ 아이디어 기록 - 카테고리별 아이디어 관리
-✓ 독서 카드 - 독서 진행 관리, 키워드/요약 기록
-✓ 날씨 정보 - 현재 위치 및 도시별 날씨 조회
-✓ 뉴스 피드 - AI/양자컴퓨팅 관련 최신 뉴스
-
-기술 스택:
-Flutter 3.x, Dart, Provider, SQLite, Open-Meteo API,
-RSS Feed, Geolocator
-
-아키텍처:
-• Provider 패턴 (MVVM 기반) 상태 관리
-• SQLite 로컬 데이터 저장
-• RESTful API 연동 (날씨, 뉴스)
-• 반응형 UI 디자인"""
-    
-    title10.text_frame.paragraphs[0].font.size = Pt(32)
-    title10.text_frame.paragraphs[0].font.color.rgb = primary_color
-    
-    # 슬라이드 11: 교육 및 자격증
-    slide11 = prs.slides.add_slide(prs.slide_layouts[1])
-    title11 = slide11.shapes.title
-    content11 = slide11.placeholders[1]
-    
-    title11.text = "Education & Certifications"
-    content11.text = """학위:
-
-• 석사 - 광주과학기술원 기전공학과 (2005.03 ~ 2007.08)
-• 학사 - 강원대학교 전기전자공학과 (1995.03 ~ 2004.02)
-
-교육 이력:
-
-• Spring Framework 기반 Java Full-Stack 개발자 양성과정
-  쌍용강북교육센터 (2025.05.12 - 2025.11.12, 944시간)
-  
-• 소음진동평가모니터링시스템개발 과정
-  경영기술개발원교육센터 (2012.06 - 2012.12, 960시간)
-  
-• 임베디드 SW 전문가 과정
-  한국정보기술연구원 (2007.10 - 2008.03, 960시간)
-
-자격증:
-✓ 정보처리기사 (2025.09)
-✓ RFID-GL (2013.11)
-✓ SCJP (2010.04)
-✓ 전기공사 (2004.08)
-
-해외 경험:
-• 산업인력공단 월드잡 연수 프로그램 (2010.07 - 2011.05)
-  - Canadagate IT 비즈니스 실무 과정
-  - Advanced 과정(Toefl) 수업 약 4개월 수강
-  - 미국, 캐나다 Brain-based Speed Reading 세미나 참석"""
-    
-    title11.text_frame.paragraphs[0].font.size = Pt(36)
-    title11.text_frame.paragraphs[0].font.color.rgb = primary_color
-    
-    # 슬라이드 12: 핵심 역량 요약
-    slide12 = prs.slides.add_slide(prs.slide_layouts[1])
-    title12 = slide12.shapes.title
-    content12 = slide12.placeholders[1]
-    
-    title12.text = "Core Competencies"
-    content12.text = """기술 역량:
-
-Full-Stack Development:
-• Backend: Java, Spring Framework, Spring Boot, Spring AI
-• Frontend: HTML5/CSS3, JavaScript, jQuery, Bootstrap
-• Mobile: Android (Java/Kotlin), iOS (Swift/SwiftUI), Flutter
-• Database: Oracle, SQLite
-• DevOps: Git, Docker, CI/CD (Jenkins)
-
-프로젝트 경험:
-
-금융권 프로젝트:
-• 우리은행, 신한은행, KB국민카드/은행, 하나은행 등
-• 안드로이드 네이티브 앱 개발
-• 웹 서비스 전환 및 고도화
-• 보안 및 인증 시스템 구현
-
-기타 프로젝트:
-• O2O 플랫폼 개발
-• 증권사 MTS 개발
-• 도시가스 검침 시스템 개발
-• 통합 생산성 앱 개발
-
-주요 강점:
-✓ 금융권 프로젝트 다수 경험
-✓ 풀스택 개발 역량
-✓ 크로스 플랫폼 개발 경험
-✓ 최신 기술 학습 및 적용 능력"""
-    
-    title12.text_frame.paragraphs[0].font.size = Pt(36)
-    title12.text_frame.paragraphs[0].font.color.rgb = primary_color
-    
-    # 슬라이드 13: 마무리
-    slide13 = prs.slides.add_slide(prs.slide_layouts[0])
-    title13 = slide13.shapes.title
-    subtitle13 = slide13.placeholders[1]
-    
-    title13.text = "Thank You"
-    subtitle13.text = "Portfolio\n\nFull-Stack Developer\n\n문의사항이 있으시면 언제든지 연락주세요.\n\nLinkedIn: linkedin.com/in/namil-kim-a59951123\nGitHub: github.com/NAM-IL"
-    
-    title13.text_frame.paragraphs[0].font.size = Pt(54)
-    title13.text_frame.paragraphs[0].font.bold = True
-    title13.text_frame.paragraphs[0].font.color.rgb = primary_color
-    subtitle13.text_frame.paragraphs[0].font.size = Pt(20)
-    subtitle13.text_frame.paragraphs[0].font.color.rgb = text_color
+from pptx.util import Inches
+
+from portfolio_content import load_content
+from portfolio_icons import ICON_SIZES, competency_icons
+from portfolio_images import fit_size, project_images
+from portfolio_ooxml import StreamingPresentation
+from portfolio_profile import add_profile_arguments, phase, profile_phases
+from portfolio_textfit import TextFrame, paginate
+from portfolio_theme import body_frame, new_presentation, slide_layout
+
+# 경력 + 프로젝트 항목 수가 이 값을 넘으면 스트리밍 모드로 생성
+STREAM_THRESHOLD = 200
+
+def create_portfolio_ppt(lang='ko', filename=None, content=None, stream=None):
+    """
+    포트폴리오 PPT 생성
+    lang: 콘텐츠 언어 (ko/en), filename: 출력 경로 (기본: doc/PORTFOLIO_PRESENTATION.pptx)
+    stream: 스트리밍 작성기 사용 여부 (None이면 경력+프로젝트 수가 STREAM_THRESHOLD를 넘을 때 자동 사용)
+    content: 미리 준비한 콘텐츠 모델 (벤치마크/일괄 생성용, 기본: load_content(lang))
+    슬라이드 크기는 고정(10 x 7.5 inch)이므로 용지 크기 옵션이 없습니다.
+    색상/글꼴 크기는 portfolio_theme.py 템플릿의 테마와 레이아웃에 들어 있으므로 슬라이드에서는 텍스트만 채웁니다.
+    """
+    # 공유 콘텐츠 모델 로드 (index.html + locales/<lang>.json)
+    if content is None:
+        with phase('content'):
+            content = load_content(lang)
+    
+    filename = Path(filename) if filename else DOC_DIR / "PORTFOLIO_PRESENTATION.pptx"
+    if stream is None:
+        stream = len(content.experiences) + len(content.projects) > STREAM_THRESHOLD
+    
+    # 프레젠테이션 템플릿 로드 (팔레트/글꼴 크기가 들어 있는 마스터와 레이아웃, 캐시 사용)
+    # 스트리밍 모드는 출력 파일을 바로 열고 슬라이드를 하나씩 쓰면서 저장
+    with phase('styles'):
+        prs = StreamingPresentation(filename) if stream else new_presentation()
+    
+    # 프로젝트 스크린샷 축소본과 역량 아이콘 준비 (캐시 사용, 여러 이미지는 동시에 처리)
+    with phase('images'):
+        images = project_images(content, 'pptx')
+        icons = competency_icons(content, 'pptx')
+    
+    # 슬라이드 생성
+    with phase('build'):
+        text = content.text
+        divider = "─────────────────────────────────────"
+    
+        def add_content_slide(title_text, body_text, layout='content'):
+            """제목 + 본문 레이아웃 슬라이드 추가 (layout: portfolio_theme.LAYOUTS 키)"""
+            slide = prs.slides.add_slide(slide_layout(prs, layout))
+            slide.shapes.title.text = title_text
+            slide.placeholders[1].text = body_text
+            return slide
+    
+        def add_paginated_slides(title_text, blocks, layout='content', separator=("",), body_width=None,
+                                 decorate=None):
+            """
+            본문 블록(단락 목록)을 자리 표시자를 넘치지 않게 나눠 슬라이드 여러 장으로 추가
+            두 장 이상이면 제목에 (i/n)을 붙이고, 추가한 슬라이드 수를 반환합니다.
+            body_width: 본문 너비 (오른쪽에 그림을 놓아 본문을 좁히는 경우)
+            decorate: 첫 슬라이드에 그림 등을 추가하는 함수 (스트리밍 모드에서는 다음 슬라이드를
+                      추가하면 앞 슬라이드가 파일에 쓰이므로 바로 호출합니다)
+            """
+            _, _, width, height, size = body_frame(layout)
+            frame = TextFrame(body_width or width, height, size)
+            blocks = [[line for paragraph in block for line in paragraph.split("\n")] for block in blocks if block]
+            pages = paginate(blocks, frame, separator)
+            for index, page in enumerate(pages, 1):
+                page_title = f"{title_text} ({index}/{len(pages)})" if len(pages) > 1 else title_text
+                slide = add_content_slide(page_title, "\n".join(page), layout)
+                if index == 1 and decorate:
+                    decorate(slide)
+            return len(pages)
+    
+        def narrow_body(slide, width):
+            """본문 자리 표시자 너비만 줄임 (위치/높이는 레이아웃 값을 그대로 지정)"""
+            body = slide.placeholders[1]
+            left, top, body_height = body.left, body.top, body.height
+            body.left, body.top, body.height = left, top, body_height
+            body.width = width
+    
+        # 슬라이드 1: 타이틀 슬라이드
+        add_content_slide(text('nav.logo', 'Portfolio'),
+                          f"{text('hero.title')}\n{text('hero.subtitle')}", layout='title')
+    
+        # 슬라이드 2: 소개 (About Me)
+        about_blocks = [[text('about.jobTitle')], [text('about.p1')],
+                        [f"✓ {stat.value} {stat.label}" for stat in content.stats], [text('about.p2')]]
+        add_paginated_slides(text('about.title'), about_blocks, layout='about')
+    
+        # 슬라이드 3: 핵심 역량 (아이콘이 있으면 본문을 왼쪽으로 좁히고 오른쪽에 위에서부터 차례로 배치)
+        competency_blocks = [[f"• {competency.title}", f"  {competency.summary}"] for competency in content.competencies]
+        icon_size = Inches(ICON_SIZES['pptx'])
+        icon_left = prs.slide_width - icon_size - Inches(0.5)
+        body_left, body_top = body_frame('content')[:2]
+        body_width = icon_left - body_left - Inches(0.2) if icons else None
+
+        def add_icons(slide):
+            narrow_body(slide, body_width)
+            for index, competency in enumerate(c for c in content.competencies if c.key in icons):
+                slide.shapes.add_picture(str(icons[competency.key]), icon_left,
+                                         body_top + index * (icon_size + Inches(0.4)), icon_size, icon_size)
+    
+        add_paginated_slides(text('competencies.title'), competency_blocks, body_width=body_width,
+                             decorate=add_icons if icons else None)
+    
+        # 기술 스택 슬라이드 (카테고리별)
+        for group in content.skill_groups:
+            skill_lines = []
+            for skill in group.skills:
+                level = f" ({skill.level}%)" if skill.level else ""
+                desc = f" - {skill.description}" if skill.description else ""
+                skill_lines.append(f"• {skill.name}{level}{desc}")
+            add_paginated_slides(f"{text('skills.title')} - {group.title}", [[f"{group.title}:"], skill_lines])
+    
+        # 주요 경력 슬라이드 (넘치지 않는 만큼씩)
+        experience_blocks = []
+        for exp in content.experiences:
+            block = [exp.company, f"{exp.period} · {exp.title}"]
+            if exp.description:
+                block += ["", exp.description]
+            experience_blocks.append(block)
+        add_paginated_slides(text('experience.title'), experience_blocks, separator=("", divider, ""))
+    
+        # 프로젝트 슬라이드 (프로젝트당 1개, 넘치면 이어지는 슬라이드로)
+        body_left, body_top = body_frame('project')[:2]
+        for project in content.projects:
+            project_blocks = [[f"{text('projects.client')} {project.client}",
+                               f"{text('projects.period')} {project.period}"]]
+            if project.intro:
+                project_blocks.append([project.intro])
+            if project.roles:
+                project_blocks.append([f"{text('projects.role')}:"] + [f"✓ {role}" for role in project.roles])
+            if project.env:
+                project_blocks.append([f"{text('projects.env')}", project.env])
+            image_width = add_image = None
+            if project.key in images:
+                # 첫 슬라이드의 본문을 왼쪽으로 좁히고 오른쪽에 스크린샷 배치
+                image_path, pixel_size = images[project.key]
+                width, height = fit_size(pixel_size, 'pptx')
+                image_left = prs.slide_width - Inches(width + 0.4)
+                image_width = image_left - body_left - Inches(0.2)
+    
+                def add_image(slide):
+                    narrow_body(slide, image_width)
+                    slide.shapes.add_picture(str(image_path), image_left, body_top, Inches(width), Inches(height))
+    
+            add_paginated_slides(f"{text('projects.title')} - {project.title}", project_blocks,
+                                 layout='project', body_width=image_width, decorate=add_image)
+    
+        # 교육 및 자격증
+        education_blocks = [
+            [f"{text('contact.education_title')}:", ""] + [f"• {education}" for education in content.education],
+            [f"{text('contact.cert_title')}:"] + [f"✓ {cert}" for cert in content.certifications],
+            [f"{text('contact.exp_title')}:"] + [f"• {career}" for career in content.careers],
+        ]
+        add_paginated_slides(f"{text('contact.education_title')} & {text('contact.cert_title')}", education_blocks)
+    
+        # 마무리
+        closing_lines = [text('hero.title'), "", text('contact.linkedin_desc'), ""]
+        for label, url in (('LinkedIn', content.links.get('linkedin')), ('GitHub', content.links.get('github'))):
+            if url:
+                closing_lines.append(f"{label}: {url}")
+        add_content_slide(text('contact.title'), "\n".join(closing_lines), layout='closing')
     
     # 파일 저장 (doc 폴더에 저장)
-    filename = DOC_DIR / "PORTFOLIO_PRESENTATION.pptx"
-    prs.save(str(filename))
+    with phase('save'):
+        prs.save(str(filename))
     print(f"✅ 포트폴리오 PPT가 생성되었습니다: {filename}")
-    print(f"📊 총 {len(prs.slides)}개의 슬라이드가 포함되어 있습니다.")
+    print(f"📊 총 {len(prs.slides)}개의 슬라이드가 포함되어 있습니다." + (" (스트리밍)" if stream else ""))
     print(f"📝 생성된 슬라이드 목록:")
     for i, slide in enumerate(prs.slides, 1):
         try:
@@ -423,12 +210,21 @@ Full-Stack Development:
             print(f"   {i}. {title}")
         except:
             print(f"   {i}. (슬라이드 {i})")
-    print(f"\n💡 index.html의 내용을 기반으로 작성되었습니다.")
+    print(f"\n💡 index.html과 locales/{lang}.json의 내용을 기반으로 작성되었습니다.")
     print(f"📁 저장 위치: {filename}")
+    
+    return filename
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="포트폴리오 PPTX 생성")
+    parser.add_argument('--lang', default='ko', help="콘텐츠 언어 (기본: ko)")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    # 기본 변형(ko, A4)이 아니면 build_portfolio.py와 같은 변형 파일명으로 저장
+    from build_portfolio import output_path
     try:
-        create_portfolio_ppt()
+        with profile_phases(args.profile, args.profile_dir, prefix='pptx-'):
+            create_portfolio_ppt(lang=args.lang, filename=output_path('pptx', args.lang))
     except ImportError:
         print("❌ python-pptx 라이브러리가 설치되지 않았습니다.")
         print("📦 설치 방법: pip install python-pptx")
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+포트폴리오 콘텐츠 모델
+index.html(data-i18n 키)과 locales/*.json을 한 번만 파싱하여
+PDF/DOC/PPT 생성 스크립트가 공유하는 가벼운 레코드(__slots__)로 변환합니다.
+
+파싱 결과는 원본 파일 해시를 키로 디스크(doc/.cache/content)에 캐시되므로,
+원본이 바뀌지 않았다면 다음 실행부터는 파싱 없이 바로 로드됩니다.
+
+사용 방법:
+    from portfolio_content import load_content
+    content = load_content('ko')
+    for exp in content.experiences:
+        print(exp.company, exp.period)
+
+    # 캐시 상태 확인: python doc/portfolio_content.py [ko|en]
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import re
+import sys
+from html.parser import HTMLParser
+from pathlib import Path
+
+# 현재 스크립트의 디렉토리를 기준으로 경로 설정
+SCRIPT_DIR = Path(__file__).parent.absolute()
+DOC_DIR = SCRIPT_DIR
+ROOT_DIR = SCRIPT_DIR.parent
+
+INDEX_HTML = ROOT_DIR / "index.html"
+APP_JS = ROOT_DIR / "js" / "app.js"
+LOCALES_DIR = ROOT_DIR / "locales"
+CACHE_DIR = DOC_DIR / ".cache" / "content"
+
+SUPPORTED_LANGS = ('ko', 'en')
+
+# 파서/레코드 구조가 바뀌면 올려서 기존 캐시를 무효화합니다.
+CONTENT_MODEL_VERSION = 1
+
+# 연락처 섹션 경력 목록에 나오는 회사 (contact.exp_<회사>_company 키, careers 앞부분에 이 순서로 들어감)
+CAREER_COMPANIES = ('wizard', 'smartek')
+
+# 값이 없는 요소 (닫는 태그가 없음)
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+             'link', 'meta', 'source', 'track', 'wbr'}
+
+
+class _Record:
+    """__slots__ 기반 레코드 공통 기능 (키워드 생성자, repr)"""
+    __slots__ = ()
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+
+    def __repr__(self):
+        values = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({values})"
+
+
+class Skill(_Record):
+    """기술 항목 (이름, 숙련도 %, 설명)"""
+    __slots__ = ('name', 'level', 'description')
+
+
+class SkillGroup(_Record):
+    """기술 카테고리 (Backend, Frontend, Database & Tools)"""
+    __slots__ = ('key', 'title', 'skills')
+
+
+class Stat(_Record):
+    """소개 섹션의 통계 항목 (예: 15+ 프로젝트)"""
+    __slots__ = ('value', 'label')
+
+
+class Competency(_Record):
+    """핵심 역량 항목"""
+    __slots__ = ('key', 'title', 'summary', 'details')
+
+
+class Experience(_Record):
+    """경력 타임라인 항목"""
+    __slots__ = ('key', 'period', 'title', 'company', 'description')
+
+
+class Project(_Record):
+    """프로젝트 카드 항목"""
+    __slots__ = ('key', 'title', 'client', 'period', 'env', 'intro', 'roles', 'tags', 'image')
+
+
+class PortfolioContent(_Record):
+    """한 언어에 대한 포트폴리오 전체 콘텐츠"""
+    __slots__ = ('lang', 'source_hash', 'strings', 'links', 'stats', 'competencies',
+                 'skill_groups', 'experiences', 'projects', 'education', 'certifications',
+                 'careers')
+
+    def text(self, key, default=''):
+        """locale 문자열 조회 (없으면 index.html의 기본 텍스트, 그것도 없으면 default)"""
+        return self.strings.get(key, default)
+
+
+def _collapse(text):
+    """HTML 들여쓰기로 생긴 공백/줄바꿈을 하나의 공백으로 정리"""
+    return re.sub(r'\s+', ' ', text or '').strip()
+
+
+def _flatten(tree, prefix=''):
+    """중첩된 locale JSON을 'section.key' 형태의 평탄한 딕셔너리로 변환"""
+    flat = {}
+    for key, value in tree.items():
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            flat.update(_flatten(value, path))
+        else:
+            flat[path] = value
+    return flat
+
+
+class _IndexParser(HTMLParser):
+    """index.html에서 콘텐츠 구조(키 순서, 기술, 프로젝트 카드 등)를 추출"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.stack = []          # (tag, classes)
+        self.captures = []       # [depth, kind, payload, buffer]
+        self.defaults = {}       # data-i18n 키 -> index.html 기본 텍스트
+        self.keys = []           # 문서 순서대로 등장한 data-i18n 키
+        self.skill_groups = []   # {'key': ..., 'skills': [[name, level], ...]}
+        self.projects = []       # {'title_key': ..., 'env': ..., 'tags': [...], 'image': ...}
+        self.stats = []          # [value, label_key]
+        self.links = {}
+        self._last_label_key = None
+
+    def _has_class(self, name):
+        return any(name in classes for _, classes in self.stack)
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        classes = (attrs.get('class') or '').split()
+        depth = len(self.stack)
+        if tag not in VOID_TAGS:
+            self.stack.append((tag, classes))
+
+        href = attrs.get('href') or ''
+        if 'linkedin.com' in href:
+            self.links.setdefault('linkedin', href)
+        elif 'github.com/NAM-IL' in href and href.rstrip('/').endswith('NAM-IL'):
+            self.links.setdefault('github', href)
+
+        if 'skill-category' in classes:
+            self.skill_groups.append({'key': None, 'skills': []})
+        if 'project-card' in classes:
+            self.projects.append({'title_key': None, 'env': None, 'tags': [], 'image': None})
+        if 'project-image' in classes and self.projects:
+            for cls in classes:
+                if cls.startswith('project-bg-'):
+                    self.projects[-1]['image'] = cls
+        if 'skill-progress' in classes and self.skill_groups and self.skill_groups[-1]['skills']:
+            self.skill_groups[-1]['skills'][-1][1] = attrs.get('data-progress')
+        if tag in VOID_TAGS:
+            return
+
+        key = attrs.get('data-i18n')
+        if key:
+            self.keys.append(key)
+            self.captures.append([depth, 'i18n', key, []])
+            if 'category-title' in classes and self.skill_groups:
+                self.skill_groups[-1]['key'] = key
+            if self.projects and self._has_class('project-card'):
+                if key.endswith('_title') and self.projects[-1]['title_key'] is None:
+                    self.projects[-1]['title_key'] = key
+                if 'detail-label' in classes:
+                    self._last_label_key = key
+        elif 'detail-value' in classes and self._last_label_key == 'projects.env':
+            self.captures.append([depth, 'env', None, []])
+        if 'skill-name' in classes:
+            self.captures.append([depth, 'skill', None, []])
+        elif 'tag' in classes and self._has_class('project-tags'):
+            self.captures.append([depth, 'tag', None, []])
+        elif 'stat-number' in classes:
+            self.captures.append([depth, 'stat', None, []])
+
+    def handle_endtag(self, tag):
+        if tag in VOID_TAGS:
+            return
+        # 잘못 닫힌 태그가 있어도 가장 가까운 같은 태그까지 정리
+        for index in range(len(self.stack) - 1, -1, -1):
+            if self.stack[index][0] == tag:
+                del self.stack[index:]
+                break
+        else:
+            return
+        while self.captures and self.captures[-1][0] >= len(self.stack):
+            self._finish(self.captures.pop())
+
+    def handle_data(self, data):
+        for capture in self.captures:
+            capture[3].append(data)
+
+    def _finish(self, capture):
+        _, kind, payload, buffer = capture
+        text = _collapse(''.join(buffer))
+        if kind == 'i18n':
+            self.defaults.setdefault(payload, text)
+            if payload.startswith('about.stats') and self.stats and self.stats[-1][1] is None:
+                self.stats[-1][1] = payload
+        elif kind == 'env' and self.projects:
+            self.projects[-1]['env'] = text
+            self._last_label_key = None
+        elif kind == 'skill' and self.skill_groups:
+            self.skill_groups[-1]['skills'].append([text, None])
+        elif kind == 'tag' and self.projects:
+            self.projects[-1]['tags'].append(text)
+        elif kind == 'stat':
+            self.stats.append([text, None])
+
+
+def _parse_app_js(source):
+    """js/app.js에서 기술 설명(skillTooltips)과 프로젝트 이미지 매핑을 추출"""
+    tooltips = {}
+    pattern = re.compile(r"'([^']+)':\s*\{\s*ko:\s*'([^']*)',\s*en:\s*'([^']*)'\s*\}")
+    for name, ko, en in pattern.findall(source):
+        tooltips[name] = {'ko': ko, 'en': en}
+    images = dict(re.findall(r"'(project-bg-\d+)':\s*'([^']+)'", source))
+    return tooltips, images
+
+
+def source_files(lang):
+    """해당 언어 콘텐츠를 만드는 데 사용되는 원본 파일 목록"""
+    return [INDEX_HTML, APP_JS, LOCALES_DIR / f"{lang}.json"]
+
+
+def source_hash(lang):
+    """원본 파일 내용과 모델 버전으로 계산한 캐시 키"""
+    digest = hashlib.sha256(f"v{CONTENT_MODEL_VERSION}:{lang}".encode())
+    for path in source_files(lang):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def parse_content(lang='ko', digest=None):
+    """원본 파일을 파싱하여 PortfolioContent를 생성 (캐시 사용 안 함)"""
+    parser = _IndexParser()
+    parser.feed(INDEX_HTML.read_text(encoding='utf-8'))
+    parser.close()
+    tooltips, images = _parse_app_js(APP_JS.read_text(encoding='utf-8'))
+    with open(LOCALES_DIR / f"{lang}.json", encoding='utf-8') as f:
+        locale = _flatten(json.load(f))
+
+    # locale 값 우선, 없으면 index.html 기본 텍스트
+    strings = dict(parser.defaults)
+    strings.update({k: v for k, v in locale.items() if isinstance(v, str)})
+
+    def text(key):
+        return _collapse(strings.get(key, ''))
+
+    skill_groups = [
+        SkillGroup(key=group['key'], title=text(group['key']), skills=[
+            Skill(name=name,
+                  level=int(level) if level else None,
+                  description=tooltips.get(name, {}).get(lang, ''))
+            for name, level in group['skills']
+        ])
+        for group in parser.skill_groups
+    ]
+
+    competencies = []
+    experiences = []
+    for key in parser.keys:
+        match = re.fullmatch(r'competencies\.(item\d+)_title', key)
+        if match:
+            item = match.group(1)
+            details = []
+            index = 1
+            while f"competencies.{item}_desc{index}" in strings:
+                details.append(text(f"competencies.{item}_desc{index}"))
+                index += 1
+            competencies.append(Competency(key=item, title=text(key),
+                                           summary=text(f"competencies.{item}_summary"),
+                                           details=details))
+        match = re.fullmatch(r'experience\.(timeline\d+)_period', key)
+        if match:
+            item = match.group(1)
+            experiences.append(Experience(key=item, period=text(key),
+                                          title=text(f"experience.{item}_title"),
+                                          company=text(f"experience.{item}_company"),
+                                          description=text(f"experience.{item}_desc")))
+
+    projects = []
+    for card in parser.projects:
+        if not card['title_key']:
+            continue
+        prefix = card['title_key'][:-len('_title')]
+        env_key = f"{prefix}_env"
+        roles = [r.strip() for r in text(f"{prefix}_role").split('|') if r.strip()]
+        projects.append(Project(key=prefix.split('.')[-1],
+                                title=text(card['title_key']),
+                                client=text(f"{prefix}_client"),
+                                period=text(f"{prefix}_period"),
+                                env=text(env_key) if env_key in strings else (card['env'] or ''),
+                                intro=text(f"{prefix}_intro"),
+                                roles=roles,
+                                tags=card['tags'],
+                                image=images.get(card['image'])))
+
+    def keyed(pattern):
+        return [text(k) for k in parser.keys if re.fullmatch(pattern, k)]
+
+    careers = []
+    for company in CAREER_COMPANIES:
+        careers.append(f"{text(f'contact.exp_{company}_company')} - {text(f'contact.exp_{company}')}")
+    careers.extend(keyed(r'contact\.exp_(total|financial)'))
+
+    return PortfolioContent(
+        lang=lang,
+        source_hash=digest or source_hash(lang),
+        strings=strings,
+        links=parser.links,
+        stats=[Stat(value=value, label=text(label)) for value, label in parser.stats if label],
+        competencies=competencies,
+        skill_groups=skill_groups,
+        experiences=experiences,
+        projects=projects,
+        education=keyed(r'contact\.education_(master|bachelor)'),
+        certifications=keyed(r'contact\.cert\d+'),
+        careers=careers,
+    )
+
+
+# 프로세스 내 메모리 캐시 (lang -> PortfolioContent)
+_MEMORY_CACHE = {}
+
+
+def load_content(lang='ko', use_cache=True):
+    """
+    포트폴리오 콘텐츠 로드
+    1) 프로세스 메모리 캐시 → 2) 디스크 캐시(원본 해시 일치 시) → 3) 원본 파싱 순으로 시도합니다.
+    """
+    if lang not in SUPPORTED_LANGS:
+        raise ValueError(f"지원하지 않는 언어입니다: {lang} (지원: {', '.join(SUPPORTED_LANGS)})")
+
+    digest = source_hash(lang)
+    cached = _MEMORY_CACHE.get(lang)
+    if use_cache and cached is not None and cached.source_hash == digest:
+        return cached
+
+    cache_file = CACHE_DIR / f"{lang}-{digest[:16]}.pickle"
+    content = None
+    if use_cache and cache_file.exists():
+        try:
+            with open(cache_file, 'rb') as f:
+                content = pickle.load(f)
+        except Exception as e:
+            print(f"⚠️ 콘텐츠 캐시를 읽을 수 없어 다시 파싱합니다 ({cache_file.name}): {e}")
+            content = None
+
+    if content is None:
+        content = parse_content(lang, digest)
+        if use_cache:
+            try:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                # 같은 언어의 오래된 캐시 정리
+                # (다른 워커 프로세스가 먼저 지웠을 수 있음)
+                for stale in CACHE_DIR.glob(f"{lang}-*.pickle"):
+                    stale.unlink(missing_ok=True)
+                # 워커 프로세스들이 동시에 같은 캐시를 쓸 수 있으므로 임시 파일 이름에 pid를 붙임
+                tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+                with open(tmp_file, 'wb') as f:
+                    pickle.dump(content, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_file, cache_file)
+            except OSError as e:
+                print(f"⚠️ 콘텐츠 캐시 저장 실패: {e}")
+
+    _MEMORY_CACHE[lang] = content
+    return content
+
+
+if __name__ == "__main__":
+    # 캐시된 레코드의 모듈 경로가 '__main__'이 되지 않도록 모듈 이름으로 다시 import
+    import portfolio_content
+
+    lang = sys.argv[1] if len(sys.argv) > 1 else 'ko'
+    content = portfolio_content.load_content(lang)
+    print(f"✅ 콘텐츠 모델 로드 완료 ({lang}, {content.source_hash[:16]})")
+    print(f"   기술 그룹: {len(content.skill_groups)}개, "
+          f"기술: {sum(len(g.skills) for g in content.skill_groups)}개")
+    print(f"   핵심 역량: {len(content.competencies)}개, 경력: {len(content.experiences)}개, "
+          f"프로젝트: {len(content.projects)}개")
+    print(f"   학력: {len(content.education)}개, 자격증: {len(content.certifications)}개")
+    print(f"📁 캐시 위치: {portfolio_content.CACHE_DIR}")
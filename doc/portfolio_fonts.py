@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+한글 폰트 탐색 및 파싱 결과 캐시
+Windows/Linux/macOS의 표준 폰트 디렉토리와 환경 변수로 지정한 경로에서
+한글 폰트(맑은 고딕, 나눔고딕, Noto Sans KR/CJK 등)를 찾고,
+reportlab TTFont의 파싱 결과를 디스크(doc/.cache/fonts)에 캐시합니다.
+수 MB 크기의 CJK TTF/TTC를 매 실행마다 다시 파싱하지 않아도 됩니다.
+
+환경 변수:
+    PORTFOLIO_FONT_PATH  폰트 파일 또는 디렉토리 (여러 개는 os.pathsep으로 구분)
+                         예) PORTFOLIO_FONT_PATH=/opt/fonts/NanumGothic.ttf
+
+사용 방법:
+    python doc/portfolio_fonts.py   # 찾은 폰트 목록 확인
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+from functools import partial
+from operator import mul
+from pathlib import Path
+
+# 현재 스크립트의 디렉토리를 기준으로 경로 설정
+SCRIPT_DIR = Path(__file__).parent.absolute()
+DOC_DIR = SCRIPT_DIR
+ROOT_DIR = SCRIPT_DIR.parent
+
+CACHE_DIR = DOC_DIR / ".cache" / "fonts"
+FONT_ENV_VAR = 'PORTFOLIO_FONT_PATH'
+
+# 캐시 형식이 바뀌면 올려서 기존 캐시를 무효화합니다.
+FONT_CACHE_VERSION = 1
+
+# 선호 순서대로 나열한 한글 폰트 파일 이름 (대소문자 무시)
+# reportlab은 TrueType 윤곽선만 지원하므로 CFF 기반 .otf/.ttc는 등록에 실패하면 다음 후보로 넘어갑니다.
+KOREAN_FONT_FILES = [
+    'malgun.ttf',                   # 맑은 고딕 (Windows)
+    'NanumGothic.ttf',              # 나눔고딕
+    'NanumBarunGothic.ttf',         # 나눔바른고딕
+    'NotoSansKR-Regular.ttf',       # Noto Sans KR (Google Fonts, TrueType)
+    'NotoSansKR[wght].ttf',
+    'AppleSDGothicNeo.ttc',         # macOS
+    'AppleGothic.ttf',              # macOS
+    'NotoSansCJK-Regular.ttc',      # Noto Sans CJK (Linux 배포판 패키지)
+    'NotoSansCJKkr-Regular.otf',
+    'UnDotum.ttf',                  # 은글꼴
+    'gulim.ttc',                    # 굴림 (Windows)
+    'batang.ttc',                   # 바탕 (Windows)
+]
+
+
+def _font_dirs():
+    """운영체제별 표준 폰트 디렉토리"""
+    home = Path.home()
+    if sys.platform.startswith('win'):
+        windir = Path(os.environ.get('WINDIR', 'C:/Windows'))
+        dirs = [windir / 'Fonts']
+        if os.environ.get('LOCALAPPDATA'):
+            dirs.append(Path(os.environ['LOCALAPPDATA']) / 'Microsoft' / 'Windows' / 'Fonts')
+    elif sys.platform == 'darwin':
+        dirs = [Path('/System/Library/Fonts'), Path('/System/Library/Fonts/Supplemental'),
+                Path('/Library/Fonts'), home / 'Library' / 'Fonts']
+    else:
+        dirs = [Path('/usr/share/fonts'), Path('/usr/local/share/fonts'),
+                home / '.local' / 'share' / 'fonts', home / '.fonts']
+    return [d for d in dirs if d.is_dir()]
+
+
+def _env_paths():
+    """환경 변수로 지정한 폰트 파일/디렉토리"""
+    value = os.environ.get(FONT_ENV_VAR, '')
+    return [Path(p).expanduser() for p in value.split(os.pathsep) if p.strip()]
+
+
+def _scan(directory, wanted):
+    """디렉토리를 재귀적으로 훑어 원하는 파일 이름(소문자) -> 경로 매핑 생성"""
+    found = {}
+    for root, _, files in os.walk(directory):
+        for name in files:
+            lower = name.lower()
+            if lower in wanted and lower not in found:
+                found[lower] = Path(root) / name
+    return found
+
+
+def discover_korean_fonts():
+    """
+    사용 가능한 한글 폰트 후보를 우선순위대로 반환
+    1) 환경 변수로 지정한 파일, 2) 환경 변수 디렉토리, 3) 시스템 폰트 디렉토리 순서
+    """
+    wanted = [name.lower() for name in KOREAN_FONT_FILES]
+    candidates = []
+    search_dirs = []
+    for path in _env_paths():
+        if path.is_file():
+            candidates.append(path)
+        elif path.is_dir():
+            search_dirs.append(path)
+    search_dirs += _font_dirs()
+
+    for directory in search_dirs:
+        found = _scan(directory, set(wanted))
+        candidates += [found[name] for name in wanted if name in found]
+
+    unique = []
+    for path in candidates:
+        if path not in unique:
+            unique.append(path)
+    return unique
+
+
+def _cache_file(path, subfont_index):
+    """폰트 파일 상태 + reportlab 버전으로 만든 캐시 파일 경로"""
+    import reportlab
+    stat = path.stat()
+    key = f"v{FONT_CACHE_VERSION}|{path.resolve()}|{stat.st_size}|{stat.st_mtime_ns}|{subfont_index}|{reportlab.Version}"
+    return CACHE_DIR / f"{path.stem}-{hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]}.pickle"
+
+
+def load_ttfont(name, path, subfont_index=0):
+    """
+    reportlab TTFont 로드 (파싱 결과 디스크 캐시 사용)
+    캐시에는 폰트 객체의 상태(메트릭, 글리프 테이블, 원본 데이터)만 저장하고,
+    스레드별 상태(state)는 로드할 때 새로 만듭니다.
+    """
+    from weakref import WeakKeyDictionary
+    from reportlab.pdfbase.ttfonts import TTFont
+
+    path = Path(path)
+    cache_file = _cache_file(path, subfont_index)
+    if cache_file.exists():
+        try:
+            with open(cache_file, 'rb') as f:
+                state = pickle.load(f)
+            font = TTFont.__new__(TTFont)
+            font.__dict__.update(state)
+            font.fontName = name
+            font.state = WeakKeyDictionary()
+            return font
+        except Exception as e:
+            print(f"⚠️ 폰트 캐시를 읽을 수 없어 다시 파싱합니다 ({cache_file.name}): {e}")
+
+    font = TTFont(name, str(path), subfontIndex=subfont_index)
+    # 지역 lambda는 pickle할 수 없으므로 동일한 동작의 partial로 교체
+    font.face._pdfScale = partial(mul, 1000 / font.face.unitsPerEm)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        state = {k: v for k, v in font.__dict__.items() if k != 'state'}
+        # 워커 프로세스들이 동시에 같은 캐시를 쓸 수 있으므로 임시 파일 이름에 pid를 붙임
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except Exception as e:
+        print(f"⚠️ 폰트 캐시 저장 실패: {e}")
+    return font
+
+
+if __name__ == "__main__":
+    fonts = discover_korean_fonts()
+    if not fonts:
+        print("⚠️ 한글 폰트를 찾을 수 없습니다.")
+        print(f"💡 {FONT_ENV_VAR} 환경 변수로 폰트 파일 또는 디렉토리를 지정해주세요.")
+        sys.exit(1)
+    print("🔤 찾은 한글 폰트 (우선순위 순):")
+    for index, path in enumerate(fonts, 1):
+        print(f"   {index}. {path}")
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+doc/icon SVG 아이콘 변환 및 캐시
+핵심 역량 아이콘(doc/icon/*.svg)을 PDF에는 벡터 Drawing으로, DOCX/PPTX에는 목표 DPI의 PNG로 변환합니다.
+변환 결과는 SVG 내용 해시 + 출력 크기로 doc/.cache/icons에 캐시되므로
+아이콘은 한 번만 변환되고 이후 빌드와 다른 형식에서 재사용됩니다.
+(캐시된 Drawing은 pickle로 저장되어, 다시 빌드할 때는 svglib를 import하지도 않습니다.)
+
+- SVG 파싱: svglib (pip install svglib)
+- PNG 변환: reportlab renderPM(rlPyCairo 백엔드) 또는 cairosvg 중 설치된 것 사용
+  둘 다 없으면 DOCX/PPTX에는 아이콘을 넣지 않습니다.
+
+사용 방법:
+    python doc/portfolio_icons.py   # 아이콘 캐시 미리 만들기
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+from pathlib import Path
+
+# 현재 스크립트의 디렉토리를 기준으로 경로 설정
+SCRIPT_DIR = Path(__file__).parent.absolute()
+DOC_DIR = SCRIPT_DIR
+ROOT_DIR = SCRIPT_DIR.parent
+
+ICON_DIR = DOC_DIR / "icon"
+CACHE_DIR = DOC_DIR / ".cache" / "icons"
+
+# 캐시 형식/변환 방식이 바뀌면 올려서 기존 캐시를 무효화합니다.
+ICON_CACHE_VERSION = 1
+
+# PNG 아이콘 해상도 (작게 표시되므로 선명하도록 높게)
+ICON_DPI = 300
+
+# 형식별 아이콘 표시 크기 (inch, 정사각형 상자)
+ICON_SIZES = {
+    'pdf': 0.45,
+    'docx': 0.3,
+    'pptx': 0.9,
+}
+
+# 핵심 역량 key -> 아이콘 (index.html 역량 카드 순서)
+COMPETENCY_ICONS = {
+    'item1': 'improved_puzzle_icon.svg',       # 문제 해결 능력
+    'item2': 'advanced_problem_solving.svg',   # 빠른 학습 능력 (협업/다양한 시스템/자동화)
+    'item3': 'problem_solving.svg',            # 데이터 분석 능력
+}
+
+# (SVG 해시, 크기) -> Drawing (같은 프로세스에서 재사용)
+_DRAWING_CACHE = {}
+
+# PNG 변환기를 찾지 못했다는 경고는 한 번만 출력
+_warned = set()
+
+# 사용할 PNG 변환기 ('renderPM', 'cairosvg', None), 처음 필요할 때 한 번만 확인
+_png_backend = []
+
+
+def _warn_once(key, message):
+    if key not in _warned:
+        _warned.add(key)
+        print(message)
+
+
+def _svg_digest(path):
+    """SVG 내용 해시 (파일이 작으므로 매번 읽음)"""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def _load_svg(path):
+    """svglib로 SVG를 Drawing으로 변환 (svglib가 없으면 None)"""
+    try:
+        from svglib.svglib import svg2rlg
+    except ImportError:
+        _warn_once('svglib', "⚠️ svglib가 설치되지 않아 아이콘을 넣지 않습니다. (pip install svglib)")
+        return None
+    return svg2rlg(str(path))
+
+
+def _fit(drawing, size_pt):
+    """Drawing을 size_pt 정사각형 상자 안에 들어가도록 비율 유지 축소/확대"""
+    scale = size_pt / max(drawing.width, drawing.height)
+    drawing.scale(scale, scale)
+    drawing.width *= scale
+    drawing.height *= scale
+    return drawing
+
+
+def icon_drawing(path, size_in):
+    """
+    SVG 아이콘을 size_in(inch) 크기의 reportlab Drawing으로 반환 (PDF용 벡터)
+    메모리 → 디스크(pickle) → SVG 파싱 순으로 찾고, 변환할 수 없으면 None
+    """
+    path = Path(path)
+    size_pt = round(size_in * 72, 2)
+    digest = _svg_digest(path)
+    key = (digest, size_pt)
+    if key in _DRAWING_CACHE:
+        return _DRAWING_CACHE[key]
+
+    cache_file = CACHE_DIR / f"{path.stem}-{digest[:16]}-{size_pt}pt-v{ICON_CACHE_VERSION}.pickle"
+    drawing = None
+    if cache_file.exists():
+        try:
+            with open(cache_file, 'rb') as f:
+                drawing = pickle.load(f)
+        except Exception as e:
+            print(f"⚠️ 아이콘 캐시를 읽을 수 없어 다시 변환합니다 ({cache_file.name}): {e}")
+
+    if drawing is None:
+        drawing = _load_svg(path)
+        if drawing is None:
+            return None
+        _fit(drawing, size_pt)
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # 워커 프로세스들이 동시에 같은 캐시를 쓸 수 있으므로 임시 파일 이름에 pid를 붙임
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(drawing, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            print(f"⚠️ 아이콘 캐시 저장 실패: {e}")
+
+    _DRAWING_CACHE[key] = drawing
+    return drawing
+
+
+def png_backend():
+    """설치된 PNG 변환기 이름 (renderPM 백엔드 → cairosvg 순, 없으면 None)"""
+    if not _png_backend:
+        backend = None
+        try:
+            from reportlab.graphics.renderPM import _getPMBackend
+            _getPMBackend()
+            backend = 'renderPM'
+        except Exception:
+            try:
+                import cairosvg  # noqa: F401
+                backend = 'cairosvg'
+            except Exception:
+                pass
+        _png_backend.append(backend)
+    return _png_backend[0]
+
+
+def _rasterize(path, pixels):
+    """SVG를 pixels 크기 상자 안에 들어가는 PNG 바이트로 변환 (변환기가 없으면 None)"""
+    backend = png_backend()
+    if backend is None:
+        _warn_once('png', "⚠️ SVG를 PNG로 변환할 수 없어 DOCX/PPTX에는 아이콘을 넣지 않습니다. "
+                          "(pip install rlPyCairo 또는 cairosvg)")
+        return None
+    if backend == 'cairosvg':
+        import cairosvg
+        return cairosvg.svg2png(url=str(path), output_width=pixels)
+
+    from reportlab.graphics import renderPM
+    drawing = _load_svg(path)
+    if drawing is None:
+        return None
+    # 1pt = 1px가 되도록 dpi=72로 렌더링
+    _fit(drawing, pixels)
+    return renderPM.drawToString(drawing, fmt='PNG', dpi=72)
+
+
+def icon_png(path, size_in, dpi=ICON_DPI):
+    """
+    SVG 아이콘을 size_in(inch) × dpi 크기의 PNG로 변환해 캐시 경로 반환 (DOCX/PPTX용)
+    변환할 수 없으면 None
+    """
+    path = Path(path)
+    pixels = int(round(size_in * dpi))
+    digest = _svg_digest(path)
+    cache_file = CACHE_DIR / f"{path.stem}-{digest[:16]}-{pixels}px-v{ICON_CACHE_VERSION}.png"
+    if cache_file.exists():
+        return cache_file
+
+    data = _rasterize(path, pixels)
+    if data is None:
+        return None
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    # 워커 프로세스들이 동시에 같은 캐시를 쓸 수 있으므로 임시 파일 이름에 pid를 붙임
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    tmp_file.write_bytes(data)
+    os.replace(tmp_file, cache_file)
+    return cache_file
+
+
+def competency_icons(content, fmt):
+    """
+    핵심 역량별 아이콘 (역량 key -> PDF는 Drawing, DOCX/PPTX는 PNG 경로)
+    변환할 수 없는 아이콘은 제외합니다.
+    """
+    size_in = ICON_SIZES[fmt]
+    icons = {}
+    for competency in content.competencies:
+        name = COMPETENCY_ICONS.get(competency.key)
+        if not name or not (ICON_DIR / name).exists():
+            continue
+        if fmt == 'pdf':
+            icon = icon_drawing(ICON_DIR / name, size_in)
+        else:
+            icon = icon_png(ICON_DIR / name, size_in)
+        if icon is not None:
+            icons[competency.key] = icon
+    return icons
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, str(SCRIPT_DIR))
+    from portfolio_content import load_content
+
+    content = load_content('ko')
+    for fmt in ICON_SIZES:
+        icons = competency_icons(content, fmt)
+        print(f"🎨 {fmt:<5} {ICON_SIZES[fmt]}in: {len(icons)}개")
+        for key, icon in icons.items():
+            name = icon.name if isinstance(icon, Path) else f"Drawing {icon.width:.0f}x{icon.height:.0f}pt"
+            print(f"   {key:<6} {COMPETENCY_ICONS[key]:<32} {name}")
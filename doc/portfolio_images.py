@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+프로젝트 스크린샷 축소 및 캐시
+img/의 원본 스크린샷(수 MB PNG)을 문서에 들어갈 크기(목표 DPI 기준)로 줄이고
+JPEG로 다시 압축해 doc/.cache/images에 저장합니다.
+캐시 파일 이름은 원본 내용 해시 + 목표 크기이므로, 다시 빌드할 때는 원본 PNG를
+디코딩하지 않고 캐시된 축소본을 바로 사용합니다.
+여러 이미지는 스레드 풀에서 동시에 처리합니다 (Pillow는 디코딩/리사이즈 중 GIL을 놓음).
+
+사용 방법:
+1. Pillow 설치: pip install Pillow
+2. 미리 캐시 만들기: python doc/portfolio_images.py
+"""
+
+import hashlib
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# 현재 스크립트의 디렉토리를 기준으로 경로 설정
+SCRIPT_DIR = Path(__file__).parent.absolute()
+DOC_DIR = SCRIPT_DIR
+ROOT_DIR = SCRIPT_DIR.parent
+
+CACHE_DIR = DOC_DIR / ".cache" / "images"
+
+# 캐시 형식/압축 설정이 바뀌면 올려서 기존 캐시를 무효화합니다.
+IMAGE_CACHE_VERSION = 1
+
+# 문서에 넣는 이미지의 목표 해상도와 JPEG 품질
+TARGET_DPI = 150
+JPEG_QUALITY = 82
+
+# 형식별 이미지 최대 표시 크기 (inch, 너비 x 높이)
+DISPLAY_SIZES = {
+    'pdf': (6.0, 3.5),
+    'docx': (6.0, 3.5),
+    'pptx': (3.4, 4.8),
+}
+
+# 원본 경로 상태 -> 내용 해시 (같은 프로세스에서 원본을 다시 읽지 않음)
+_DIGEST_CACHE = {}
+
+
+def target_pixels(fmt, dpi=TARGET_DPI):
+    """형식별 최대 표시 크기를 목표 DPI의 픽셀 크기로 변환"""
+    width, height = DISPLAY_SIZES[fmt]
+    return int(width * dpi), int(height * dpi)
+
+
+def _source_digest(path):
+    """원본 이미지 내용 해시 (파일 상태가 같으면 프로세스 안에서 재사용)"""
+    stat = path.stat()
+    key = (str(path), stat.st_size, stat.st_mtime_ns)
+    digest = _DIGEST_CACHE.get(key)
+    if digest is None:
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        _DIGEST_CACHE[key] = digest
+    return digest
+
+
+def _cache_file(path, max_size):
+    """원본 해시 + 목표 크기로 만든 축소본 경로"""
+    digest = _source_digest(path)
+    return CACHE_DIR / f"{digest[:16]}-{max_size[0]}x{max_size[1]}-v{IMAGE_CACHE_VERSION}.jpg"
+
+
+def prepare_image(path, max_size):
+    """
+    이미지 하나를 max_size(픽셀) 안에 들어가도록 축소 (확대는 하지 않음)
+    반환값: (축소본 경로, (너비, 높이))
+    """
+    from PIL import Image
+
+    path = Path(path)
+    cache_file = _cache_file(path, max_size)
+    if cache_file.exists():
+        # 헤더만 읽어 크기 확인 (픽셀 데이터는 디코딩하지 않음)
+        with Image.open(cache_file) as cached:
+            return cache_file, cached.size
+
+    with Image.open(path) as image:
+        image.draft('RGB', max_size)  # JPEG 원본은 디코딩 단계에서 바로 축소
+        image.thumbnail(max_size, Image.LANCZOS)
+        if image.mode in ('RGBA', 'LA', 'P'):
+            # 투명 배경은 흰색으로 합성 (JPEG는 알파 채널이 없음)
+            image = image.convert('RGBA')
+            background = Image.new('RGB', image.size, (255, 255, 255))
+            background.paste(image, mask=image.split()[-1])
+            image = background
+        elif image.mode != 'RGB':
+            image = image.convert('RGB')
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # 워커 프로세스들이 동시에 같은 캐시를 쓸 수 있으므로 임시 파일 이름에 pid를 붙임
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        image.save(tmp_file, 'JPEG', quality=JPEG_QUALITY, optimize=True, progressive=True)
+        os.replace(tmp_file, cache_file)
+        return cache_file, image.size
+
+
+def prepare_images(paths, max_size, jobs=None):
+    """
+    여러 이미지를 스레드 풀에서 동시에 축소
+    반환값: {원본 경로: (축소본 경로, (너비, 높이))}
+    없거나 읽을 수 없는 이미지가 있으면 OSError (스크린샷이 빠진 출력이 최신으로 기록되지 않도록)
+    """
+    unique = []
+    for path in paths:
+        path = Path(path)
+        if path not in unique:
+            unique.append(path)
+    if not unique:
+        return {}
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        print("⚠️ Pillow가 설치되지 않아 프로젝트 이미지를 넣지 않습니다. (pip install Pillow)")
+        return {}
+
+    def work(path):
+        try:
+            return path, prepare_image(path, max_size)
+        except (OSError, ValueError) as e:
+            print(f"❌ 이미지를 처리할 수 없습니다 ({path.name}): {e}")
+            return path, None
+
+    workers = min(jobs or os.cpu_count() or 1, len(unique))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(work, unique))
+    failed = [path.name for path, result in results if result is None]
+    if failed:
+        raise OSError(f"프로젝트 이미지를 처리할 수 없습니다: {', '.join(failed)}")
+    return dict(results)
+
+
+def project_images(content, fmt):
+    """콘텐츠 모델의 프로젝트 이미지를 형식에 맞게 준비 (프로젝트 key -> (축소본 경로, 크기))"""
+    sources = {project.key: ROOT_DIR / project.image for project in content.projects if project.image}
+    prepared = prepare_images(sources.values(), target_pixels(fmt))
+    return {key: prepared[path] for key, path in sources.items() if path in prepared}
+
+
+def fit_size(pixel_size, fmt, dpi=TARGET_DPI):
+    """축소본 픽셀 크기를 형식별 최대 표시 크기(inch) 안의 표시 크기(inch)로 변환"""
+    max_width, max_height = DISPLAY_SIZES[fmt]
+    width, height = pixel_size[0] / dpi, pixel_size[1] / dpi
+    scale = min(max_width / width, max_height / height, 1.0)
+    return width * scale, height * scale
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, str(SCRIPT_DIR))
+    from portfolio_content import load_content
+
+    content = load_content('ko')
+    for fmt in DISPLAY_SIZES:
+        prepared = project_images(content, fmt)
+        print(f"🖼️  {fmt:<5} {target_pixels(fmt)[0]}x{target_pixels(fmt)[1]}px: {len(prepared)}개")
+        for key, (path, size) in prepared.items():
+            print(f"   {key:<7} {size[0]}x{size[1]}  {path.stat().st_size / 1024:7.1f}KB  {path.name}")
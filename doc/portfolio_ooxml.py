@@ -0,0 +1,640 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DOCX/PPTX 스트리밍 OOXML 작성기
+python-docx/python-pptx는 문서 전체를 객체 트리로 메모리에 만든 뒤 save()에서 한꺼번에 직렬화합니다.
+경력/프로젝트가 수백 개인 통합 포트폴리오나 일괄 생성에서는 이 단계가 병목이 되므로,
+본문(word/document.xml)과 슬라이드(ppt/slides/slideN.xml) XML을 만들면서 바로 zip에 써 넣는
+작성기를 제공합니다. 메모리에는 마지막 단락/슬라이드 하나만 남습니다.
+
+- 생성 스크립트가 쓰는 python-docx/python-pptx API 일부만 같은 이름으로 제공하므로
+  create_portfolio_doc()/create_portfolio_ppt()는 stream=True일 때 문서 객체만 바꿔서 같은 코드로 생성합니다.
+- 단락/슬라이드는 다음 단락/슬라이드를 추가할 때 zip에 기록되므로,
+  반환받은 객체는 다음 항목을 추가하기 전까지만 수정할 수 있습니다.
+- 스타일/테마/레이아웃 등 고정 부분은 python-docx 기본 템플릿과 portfolio_theme.py 템플릿을 그대로 복사합니다.
+
+사용 예:
+    from portfolio_ooxml import StreamingDocument, StreamingPresentation
+
+    doc = StreamingDocument('out.docx')
+    doc.add_heading('Portfolio', 0)
+    doc.add_paragraph('본문', style='List Bullet')
+    doc.save('out.docx')
+"""
+
+import io
+import re
+import zipfile
+from pathlib import Path
+from xml.sax.saxutils import escape, quoteattr
+
+# 현재 스크립트의 디렉토리를 기준으로 경로 설정
+SCRIPT_DIR = Path(__file__).parent.absolute()
+DOC_DIR = SCRIPT_DIR
+ROOT_DIR = SCRIPT_DIR.parent
+
+# zip 항목에 한 번에 쓰는 XML 크기 (작은 write 호출을 모아서 압축)
+WRITE_CHUNK_BYTES = 64 * 1024
+
+# 1pt = 12700 EMU, 1twip = 635 EMU
+EMU_PER_POINT = 12700
+EMU_PER_TWIP = 635
+
+IMAGE_CONTENT_TYPES = {
+    'jpg': 'image/jpeg',
+    'jpeg': 'image/jpeg',
+    'png': 'image/png',
+    'gif': 'image/gif',
+}
+
+RT_IMAGE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/image'
+RT_SLIDE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide'
+RT_SLIDE_LAYOUT = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout'
+CT_SLIDE = 'application/vnd.openxmlformats-officedocument.presentationml.slide+xml'
+
+# 템플릿에서 읽은 고정 부분 (같은 프로세스에서 다시 읽지 않음)
+_TEMPLATE_CACHE = {}
+
+
+class _PartWriter:
+    """zip 항목 하나에 XML 문자열을 WRITE_CHUNK_BYTES 단위로 모아 쓰기"""
+
+    def __init__(self, zip_file, name):
+        self._handle = zip_file.open(name, 'w', force_zip64=True)
+        self._chunks = []
+        self._size = 0
+
+    def write(self, text):
+        self._chunks.append(text)
+        self._size += len(text)
+        if self._size >= WRITE_CHUNK_BYTES:
+            self.flush()
+
+    def flush(self):
+        if self._chunks:
+            self._handle.write(''.join(self._chunks).encode('utf-8'))
+            self._chunks = []
+            self._size = 0
+
+    def close(self):
+        self.flush()
+        self._handle.close()
+
+
+def _image_info(path):
+    """이미지 확장자와 원래 크기(EMU, 이미지 DPI 기준), 헤더만 읽음"""
+    from docx.image.image import Image
+    image = Image.from_file(str(path))
+    return image.ext, (int(image.width), int(image.height))
+
+
+def _scaled_size(native_size, width, height):
+    """width/height 중 주어지지 않은 쪽을 비율에 맞춰 계산 (둘 다 없으면 원래 크기)"""
+    native_width, native_height = native_size
+    if width is None and height is None:
+        return native_width, native_height
+    if width is None:
+        return int(round(native_width * int(height) / native_height)), int(height)
+    if height is None:
+        return int(width), int(round(native_height * int(width) / native_width))
+    return int(width), int(height)
+
+
+def _rels_xml(relationships):
+    """(rId, 형식, 대상) 목록으로 .rels XML 생성"""
+    items = ''.join(f'<Relationship Id="{rid}" Type="{rel_type}" Target="{target}"/>'
+                    for rid, rel_type, target in relationships)
+    return ("<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+            f'<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">{items}</Relationships>')
+
+
+def _add_content_types(content_types_xml, defaults=(), overrides=()):
+    """[Content_Types].xml에 확장자 기본값/부분 재정의 추가 (이미 있는 확장자는 건너뜀)"""
+    existing = set(re.findall(r'<Default Extension="([^"]+)"', content_types_xml))
+    items = [f'<Default Extension="{ext}" ContentType="{content_type}"/>'
+             for ext, content_type in defaults if ext not in existing]
+    items += [f'<Override PartName="{name}" ContentType="{content_type}"/>' for name, content_type in overrides]
+    return content_types_xml.replace('</Types>', ''.join(items) + '</Types>')
+
+
+def _max_rid(rels_xml):
+    """.rels XML에서 가장 큰 rId 번호"""
+    return max((int(n) for n in re.findall(r'Id="rId(\d+)"', rels_xml)), default=0)
+
+
+class _Color:
+    def __init__(self):
+        self.rgb = None
+
+
+class _Font:
+    """python-docx Font 중 생성 스크립트가 쓰는 속성"""
+
+    def __init__(self):
+        self.name = None
+        self.size = None
+        self.bold = None
+        self.italic = None
+        self.color = _Color()
+
+    def rpr_xml(self):
+        parts = []
+        if self.name:
+            parts.append(f'<w:rFonts w:ascii={quoteattr(self.name)} w:hAnsi={quoteattr(self.name)}/>')
+        if self.bold is not None:
+            parts.append('<w:b/>' if self.bold else '<w:b w:val="0"/>')
+        if self.italic is not None:
+            parts.append('<w:i/>' if self.italic else '<w:i w:val="0"/>')
+        if self.color.rgb is not None:
+            parts.append(f'<w:color w:val="{self.color.rgb}"/>')
+        if self.size is not None:
+            parts.append(f'<w:sz w:val="{int(self.size) * 2 // EMU_PER_POINT}"/>')
+        return f"<w:rPr>{''.join(parts)}</w:rPr>" if parts else ''
+
+
+def _run_text_xml(text):
+    """run 텍스트 XML (python-docx처럼 탭은 w:tab, 줄바꿈은 w:br로)"""
+    parts = []
+    for index, line in enumerate(re.split(r'\r\n|\r|\n', text)):
+        if index:
+            parts.append('<w:br/>')
+        for tab_index, piece in enumerate(line.split('\t')):
+            if tab_index:
+                parts.append('<w:tab/>')
+            if piece:
+                parts.append(f'<w:t xml:space="preserve">{escape(piece)}</w:t>')
+    return ''.join(parts)
+
+
+class _Run:
+    """단락 안의 run (텍스트 또는 그림)"""
+
+    def __init__(self, document, text=''):
+        self._document = document
+        self.text = text
+        self.font = _Font()
+        self._drawing = None
+        self._page_break = False
+
+    def add_picture(self, image_path, width=None, height=None):
+        """인라인 그림 추가 (width/height 중 하나만 주면 비율 유지)"""
+        self._drawing = self._document._inline_picture(image_path, width, height)
+
+    def add_break(self, break_type=None):
+        self._page_break = True
+
+    def xml(self):
+        body = self._drawing or ''
+        if self._page_break:
+            body += '<w:br w:type="page"/>'
+        return f'<w:r>{self.font.rpr_xml()}{body}{_run_text_xml(self.text)}</w:r>'
+
+
+class _Paragraph:
+    """python-docx Paragraph 중 생성 스크립트가 쓰는 부분"""
+
+    def __init__(self, document, style_id=None):
+        self._document = document
+        self._style_id = style_id
+        self.alignment = None
+        self.runs = []
+
+    def add_run(self, text=''):
+        run = _Run(self._document, text)
+        self.runs.append(run)
+        return run
+
+    def xml(self):
+        ppr = ''
+        if self._style_id:
+            ppr += f'<w:pStyle w:val="{self._style_id}"/>'
+        if self.alignment is not None:
+            from docx.enum.text import WD_ALIGN_PARAGRAPH
+            ppr += f'<w:jc w:val="{WD_ALIGN_PARAGRAPH.to_xml(self.alignment)}"/>'
+        ppr = f'<w:pPr>{ppr}</w:pPr>' if ppr else ''
+        return f"<w:p>{ppr}{''.join(run.xml() for run in self.runs)}</w:p>"
+
+
+class _Section:
+    def __init__(self, page_width, page_height):
+        self.page_width = page_width
+        self.page_height = page_height
+
+
+class _Style:
+    def __init__(self):
+        self.font = _Font()
+
+
+def _docx_template():
+    """python-docx 기본 템플릿의 고정 부분 (zip 항목, 본문 머리/꼬리, 스타일 이름 -> ID)"""
+    if 'docx' in _TEMPLATE_CACHE:
+        return _TEMPLATE_CACHE['docx']
+
+    import docx
+    from docx.styles import BabelFish
+
+    path = Path(docx.__file__).parent / 'templates' / 'default.docx'
+    with zipfile.ZipFile(path) as template:
+        parts = {info.filename: template.read(info.filename) for info in template.infolist()}
+    document_xml = parts['word/document.xml'].decode('utf-8')
+    head = document_xml[:document_xml.index('<w:body>') + len('<w:body>')]
+    sect_pr = re.search(r'<w:sectPr.*</w:sectPr>', document_xml, re.S).group(0)
+    styles_xml = parts['word/styles.xml'].decode('utf-8')
+    style_ids = {}
+    for style_id, name in re.findall(r'<w:style [^>]*w:styleId="([^"]+)"[^>]*>\s*<w:name w:val="([^"]+)"', styles_xml):
+        style_ids[name] = style_id
+    template = {'parts': parts, 'head': head, 'sect_pr': sect_pr, 'style_ids': style_ids,
+                'ui2internal': BabelFish.ui2internal}
+    _TEMPLATE_CACHE['docx'] = template
+    return template
+
+
+class StreamingDocument:
+    """
+    word/document.xml을 zip에 바로 써 나가는 DOCX 작성기 (python-docx Document 대체)
+    filename: 출력 경로 (생성할 때 바로 열고, save()에서 나머지 부분을 써서 닫음)
+    """
+
+    def __init__(self, filename):
+        template = _docx_template()
+        self.filename = Path(filename)
+        self._template = template
+        self.sections = [_Section(None, None)]
+        self.styles = {'Normal': _Style()}
+        self.paragraph_count = 0
+        self._pending = None
+        self._images = {}        # 이미지 경로 -> (rId, media 파일 이름, 원래 크기)
+        self._next_rid = _max_rid(template['parts']['word/_rels/document.xml.rels'].decode('utf-8')) + 1
+        self._next_shape_id = 1
+        self._zip = zipfile.ZipFile(self.filename, 'w', zipfile.ZIP_DEFLATED)
+        self._body = _PartWriter(self._zip, 'word/document.xml')
+        self._body.write(template['head'])
+
+    def _style_id(self, name):
+        """스타일 이름 -> styleId (python-docx와 같이 UI 이름도 허용)"""
+        style_ids = self._template['style_ids']
+        internal = self._template['ui2internal'](name)
+        if internal not in style_ids:
+            raise KeyError(f"no style with name '{name}'")
+        return style_ids[internal]
+
+    def _flush(self):
+        if self._pending is not None:
+            self._body.write(self._pending.xml())
+            self._pending = None
+
+    def add_paragraph(self, text='', style=None):
+        self._flush()
+        paragraph = _Paragraph(self, self._style_id(style) if style else None)
+        if text:
+            paragraph.add_run(text)
+        self._pending = paragraph
+        self.paragraph_count += 1
+        return paragraph
+
+    def add_heading(self, text='', level=1):
+        style = 'Title' if level == 0 else f'Heading {level}'
+        return self.add_paragraph(text, style)
+
+    def add_page_break(self):
+        paragraph = self.add_paragraph()
+        paragraph.add_run().add_break()
+        return paragraph
+
+    def add_picture(self, image_path, width=None, height=None):
+        run = self.add_paragraph().add_run()
+        run.add_picture(image_path, width, height)
+        return run
+
+    def _image_rid(self, image_path):
+        """이미지를 word/media에 한 번만 기록하고 관계 ID와 원래 크기 반환"""
+        key = str(Path(image_path).resolve())
+        if key not in self._images:
+            ext, native_size = _image_info(image_path)
+            target = f"image{len(self._images) + 1}.{ext}"
+            # 본문 항목이 열려 있는 동안은 다른 항목을 쓸 수 없으므로 이미지는 save()에서 기록
+            self._images[key] = (f"rId{self._next_rid}", target, native_size, image_path)
+            self._next_rid += 1
+        rid, _, native_size, _ = self._images[key]
+        return rid, native_size
+
+    def _inline_picture(self, image_path, width, height):
+        rid, native_size = self._image_rid(image_path)
+        cx, cy = _scaled_size(native_size, width, height)
+        shape_id = self._next_shape_id
+        self._next_shape_id += 1
+        name = quoteattr(Path(image_path).name)
+        return (
+            '<w:drawing><wp:inline distT="0" distB="0" distL="0" distR="0" '
+            'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+            'xmlns:pic="http://schemas.openxmlformats.org/drawingml/2006/picture">'
+            f'<wp:extent cx="{cx}" cy="{cy}"/><wp:docPr id="{shape_id}" name="Picture {shape_id}"/>'
+            '<wp:cNvGraphicFramePr><a:graphicFrameLocks noChangeAspect="1"/></wp:cNvGraphicFramePr>'
+            '<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/picture">'
+            f'<pic:pic><pic:nvPicPr><pic:cNvPr id="0" name={name}/><pic:cNvPicPr/></pic:nvPicPr>'
+            f'<pic:blipFill><a:blip r:embed="{rid}"/><a:stretch><a:fillRect/></a:stretch></pic:blipFill>'
+            f'<pic:spPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+            '<a:prstGeom prst="rect"/></pic:spPr></pic:pic></a:graphicData></a:graphic></wp:inline></w:drawing>'
+        )
+
+    def _section_xml(self):
+        sect_pr = self._template['sect_pr']
+        section = self.sections[0]
+        if section.page_width is not None and section.page_height is not None:
+            size = f'<w:pgSz w:w="{int(section.page_width) // EMU_PER_TWIP}" w:h="{int(section.page_height) // EMU_PER_TWIP}"/>'
+            sect_pr = re.sub(r'<w:pgSz [^>]*/>', size, sect_pr)
+        return sect_pr
+
+    def _styles_xml(self):
+        """Normal 스타일 글꼴을 반영한 styles.xml"""
+        styles_xml = self._template['parts']['word/styles.xml'].decode('utf-8')
+        rpr = self.styles['Normal'].font.rpr_xml()
+        if rpr:
+            normal = re.search(r'(<w:style [^>]*w:styleId="Normal"[^>]*>)(.*?)(</w:style>)', styles_xml, re.S)
+            styles_xml = (styles_xml[:normal.start(3)] + rpr + styles_xml[normal.start(3):])
+        return styles_xml.encode('utf-8')
+
+    def save(self, path=None):
+        """본문을 닫고 스타일/이미지/관계/콘텐츠 형식 부분을 써서 파일 완성"""
+        if path is not None and Path(path).resolve() != self.filename.resolve():
+            raise ValueError(f"StreamingDocument는 생성할 때 지정한 경로에만 저장합니다: {self.filename}")
+        self._flush()
+        self._body.write(self._section_xml())
+        self._body.write('</w:body></w:document>')
+        self._body.close()
+
+        parts = self._template['parts']
+        rels_xml = parts['word/_rels/document.xml.rels'].decode('utf-8').replace('</Relationships>', ''.join(
+            f'<Relationship Id="{rid}" Type="{RT_IMAGE}" Target="media/{target}"/>'
+            for rid, target, _, _ in self._images.values()) + '</Relationships>')
+        extensions = {Path(target).suffix[1:] for _, target, _, _ in self._images.values()}
+        content_types = _add_content_types(parts['[Content_Types].xml'].decode('utf-8'),
+                                           defaults=[(ext, IMAGE_CONTENT_TYPES[ext]) for ext in sorted(extensions)])
+
+        for _, target, _, source in self._images.values():
+            self._zip.write(str(source), f"word/media/{target}")
+        for name, data in parts.items():
+            if name == 'word/document.xml':
+                continue
+            if name == 'word/_rels/document.xml.rels':
+                data = rels_xml.encode('utf-8')
+            elif name == 'word/styles.xml':
+                data = self._styles_xml()
+            elif name == '[Content_Types].xml':
+                data = content_types.encode('utf-8')
+            self._zip.writestr(name, data)
+        self._zip.close()
+        return self.filename
+
+
+# --- PPTX ---------------------------------------------------------------------------------------
+
+def _pptx_template():
+    """portfolio_theme 템플릿의 고정 부분과 레이아웃별 자리 표시자 정보"""
+    from pptx.enum.shapes import PP_PLACEHOLDER
+    from portfolio_theme import new_presentation, template_bytes
+
+    data = template_bytes()
+    cached = _TEMPLATE_CACHE.get('pptx')
+    if cached and cached['data'] is data:
+        return cached
+
+    with zipfile.ZipFile(io.BytesIO(data)) as template:
+        parts = {info.filename: template.read(info.filename) for info in template.infolist()}
+    prs = new_presentation()
+    layouts = {}
+    for layout in prs.slide_layouts:
+        placeholders = []
+        for placeholder in layout.iter_cloneable_placeholders():
+            fmt = placeholder.placeholder_format
+            # 기본값(obj 형식, idx 0)은 python-pptx처럼 생략
+            ph_type = PP_PLACEHOLDER.to_xml(fmt.type)
+            attrs = '' if ph_type == 'obj' else f'type="{ph_type}"'
+            if fmt.idx:
+                attrs = f'{attrs} idx="{fmt.idx}"'.strip()
+            placeholders.append({
+                'idx': fmt.idx, 'name': placeholder.name, 'ph': attrs,
+                'is_title': fmt.type.name in ('TITLE', 'CENTER_TITLE'),
+                'geometry': (placeholder.left, placeholder.top, placeholder.width, placeholder.height),
+            })
+        layouts[layout.name] = _SlideLayout(layout.name, str(layout.part.partname), placeholders)
+    cached = {'data': data, 'parts': parts, 'layouts': layouts,
+              'slide_width': prs.slide_width, 'slide_height': prs.slide_height}
+    _TEMPLATE_CACHE['pptx'] = cached
+    return cached
+
+
+class _SlideLayout:
+    def __init__(self, name, partname, placeholders):
+        self.name = name
+        self.partname = partname
+        self.placeholders = placeholders
+
+
+class _SlideLayouts:
+    def __init__(self, layouts):
+        self._layouts = layouts
+
+    def get_by_name(self, name, default=None):
+        return self._layouts.get(name, default)
+
+    def __iter__(self):
+        return iter(self._layouts.values())
+
+
+class _Placeholder:
+    """python-pptx 자리 표시자 중 생성 스크립트가 쓰는 부분 (텍스트, 위치/크기)"""
+
+    def __init__(self, shape_id, spec):
+        self.shape_id = shape_id
+        self.name = spec['name']
+        self.text = ''
+        self._ph = spec['ph']
+        self._inherited = spec['geometry']
+        self._geometry = None
+
+    def _get(self, index):
+        return (self._geometry or self._inherited)[index]
+
+    def _set(self, index, value):
+        geometry = list(self._geometry or self._inherited)
+        geometry[index] = int(value)
+        self._geometry = geometry
+
+    left = property(lambda self: self._get(0), lambda self, value: self._set(0, value))
+    top = property(lambda self: self._get(1), lambda self, value: self._set(1, value))
+    width = property(lambda self: self._get(2), lambda self, value: self._set(2, value))
+    height = property(lambda self: self._get(3), lambda self, value: self._set(3, value))
+
+    def xml(self):
+        ph = f'<p:ph {self._ph}/>' if self._ph else '<p:ph/>'
+        sp_pr = '<p:spPr/>'
+        if self._geometry:
+            x, y, cx, cy = self._geometry
+            sp_pr = f'<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm></p:spPr>'
+        paragraphs = ''.join(
+            f'<a:p><a:r><a:t>{escape(line)}</a:t></a:r></a:p>' if line else '<a:p/>'
+            for line in self.text.split('\n'))
+        return (f'<p:sp><p:nvSpPr><p:cNvPr id="{self.shape_id}" name={quoteattr(self.name)}/>'
+                f'<p:cNvSpPr><a:spLocks noGrp="1"/></p:cNvSpPr><p:nvPr>{ph}</p:nvPr></p:nvSpPr>{sp_pr}'
+                f'<p:txBody><a:bodyPr/><a:lstStyle/>{paragraphs}</p:txBody></p:sp>')
+
+
+class _SlideShapes:
+    def __init__(self, slide):
+        self._slide = slide
+        self.title = None
+
+    def add_picture(self, image_path, left, top, width=None, height=None):
+        return self._slide._add_picture(image_path, left, top, width, height)
+
+
+class _Slide:
+    """기록 전까지 자리 표시자 텍스트/그림을 모아 두는 슬라이드"""
+
+    def __init__(self, presentation, number, layout):
+        self._presentation = presentation
+        self.number = number
+        self.layout = layout
+        self.shapes = _SlideShapes(self)
+        self.placeholders = {}
+        self._pictures = []
+        self._next_shape_id = 2
+        for spec in layout.placeholders:
+            placeholder = _Placeholder(self._next_shape_id, spec)
+            self._next_shape_id += 1
+            self.placeholders[spec['idx']] = placeholder
+            if spec['is_title']:
+                self.shapes.title = placeholder
+
+    def _add_picture(self, image_path, left, top, width, height):
+        target, native_size = self._presentation._media_target(image_path)
+        width, height = _scaled_size(native_size, width, height)
+        shape_id = self._next_shape_id
+        self._next_shape_id += 1
+        self._pictures.append((shape_id, Path(image_path).name, target, int(left), int(top), width, height))
+
+    def xml_and_rels(self):
+        """슬라이드 XML과 관계 목록"""
+        relationships = [('rId1', RT_SLIDE_LAYOUT, f"../slideLayouts/{Path(self.layout.partname).name}")]
+        shapes = [placeholder.xml() for placeholder in self.placeholders.values()]
+        rids = {}
+        for shape_id, name, target, x, y, cx, cy in self._pictures:
+            if target not in rids:
+                rids[target] = f"rId{len(relationships) + 1}"
+                relationships.append((rids[target], RT_IMAGE, f"../media/{target}"))
+            shapes.append(
+                f'<p:pic><p:nvPicPr><p:cNvPr id="{shape_id}" name="Picture {shape_id - 1}" descr={quoteattr(name)}/>'
+                '<p:cNvPicPr><a:picLocks noChangeAspect="1"/></p:cNvPicPr><p:nvPr/></p:nvPicPr>'
+                f'<p:blipFill><a:blip r:embed="{rids[target]}"/><a:stretch><a:fillRect/></a:stretch></p:blipFill>'
+                f'<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+                '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></p:spPr></p:pic>')
+        xml = ("<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+               '<p:sld xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+               'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships" '
+               'xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main">'
+               '<p:cSld><p:spTree><p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr>'
+               f"<p:grpSpPr/>{''.join(shapes)}</p:spTree></p:cSld>"
+               '<p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr></p:sld>')
+        return xml, relationships
+
+    def release(self):
+        """기록 후 제목만 남기고 본문/그림 정보를 버림 (슬라이드 목록 출력용)"""
+        self.placeholders = {}
+        self._pictures = []
+
+
+class _Slides:
+    def __init__(self, presentation):
+        self._presentation = presentation
+        self._slides = []
+
+    def add_slide(self, layout):
+        return self._presentation._add_slide(layout)
+
+    def __len__(self):
+        return len(self._slides)
+
+    def __iter__(self):
+        return iter(self._slides)
+
+
+class StreamingPresentation:
+    """
+    슬라이드 XML을 zip에 바로 써 나가는 PPTX 작성기 (python-pptx Presentation 대체)
+    portfolio_theme 템플릿의 마스터/레이아웃을 사용하며, filename은 생성할 때 바로 엽니다.
+    """
+
+    def __init__(self, filename):
+        template = _pptx_template()
+        self.filename = Path(filename)
+        self._template = template
+        self.slide_layouts = _SlideLayouts(template['layouts'])
+        self.slide_width = template['slide_width']
+        self.slide_height = template['slide_height']
+        self.slides = _Slides(self)
+        self._pending = None
+        self._media = {}     # 이미지 경로 -> (media 파일 이름, 원래 크기)
+        self._zip = zipfile.ZipFile(self.filename, 'w', zipfile.ZIP_DEFLATED)
+
+    def _media_target(self, image_path):
+        """이미지를 ppt/media에 한 번만 기록하고 파일 이름과 원래 크기 반환"""
+        key = str(Path(image_path).resolve())
+        if key not in self._media:
+            ext, native_size = _image_info(image_path)
+            target = f"image{len(self._media) + 1}.{ext}"
+            self._zip.write(str(image_path), f"ppt/media/{target}")
+            self._media[key] = (target, native_size)
+        return self._media[key]
+
+    def _flush(self):
+        slide = self._pending
+        if slide is None:
+            return
+        xml, relationships = slide.xml_and_rels()
+        self._zip.writestr(f"ppt/slides/slide{slide.number}.xml", xml)
+        self._zip.writestr(f"ppt/slides/_rels/slide{slide.number}.xml.rels", _rels_xml(relationships))
+        slide.release()
+        self._pending = None
+
+    def _add_slide(self, layout):
+        self._flush()
+        slide = _Slide(self, len(self.slides) + 1, layout)
+        self.slides._slides.append(slide)
+        self._pending = slide
+        return slide
+
+    def save(self, path=None):
+        """마지막 슬라이드를 기록하고 presentation.xml/관계/콘텐츠 형식 부분을 써서 파일 완성"""
+        if path is not None and Path(path).resolve() != self.filename.resolve():
+            raise ValueError(f"StreamingPresentation은 생성할 때 지정한 경로에만 저장합니다: {self.filename}")
+        self._flush()
+
+        parts = self._template['parts']
+        rels_xml = parts['ppt/_rels/presentation.xml.rels'].decode('utf-8')
+        first_rid = _max_rid(rels_xml) + 1
+        count = len(self.slides)
+        slide_rels = ''.join(
+            f'<Relationship Id="rId{first_rid + i}" Type="{RT_SLIDE}" Target="slides/slide{i + 1}.xml"/>'
+            for i in range(count))
+        rels_xml = rels_xml.replace('</Relationships>', slide_rels + '</Relationships>')
+        slide_ids = ''.join(f'<p:sldId id="{256 + i}" r:id="rId{first_rid + i}"/>' for i in range(count))
+        presentation_xml = parts['ppt/presentation.xml'].decode('utf-8').replace(
+            '<p:sldIdLst/>', f'<p:sldIdLst>{slide_ids}</p:sldIdLst>' if count else '')
+        extensions = {Path(target).suffix[1:] for target, _ in self._media.values()}
+        content_types = _add_content_types(
+            parts['[Content_Types].xml'].decode('utf-8'),
+            defaults=[(ext, IMAGE_CONTENT_TYPES[ext]) for ext in sorted(extensions)],
+            overrides=[(f"/ppt/slides/slide{i + 1}.xml", CT_SLIDE) for i in range(count)])
+
+        for name, data in parts.items():
+            if name == 'ppt/_rels/presentation.xml.rels':
+                data = rels_xml.encode('utf-8')
+            elif name == 'ppt/presentation.xml':
+                data = presentation_xml.encode('utf-8')
+            elif name == '[Content_Types].xml':
+                data = content_types.encode('utf-8')
+            self._zip.writestr(name, data)
+        self._zip.close()
+        return self.filename
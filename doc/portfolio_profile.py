@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+포트폴리오 문서 생성 단계별 시간 측정
+생성 스크립트는 주요 단계(콘텐츠 로드, 폰트 등록, 스타일 생성, 이미지 준비, 요소 생성, 레이아웃, 저장)를
+phase('이름')으로 감싸 두고, 측정이 켜져 있을 때만 시간이 기록됩니다.
+측정이 꺼져 있으면 phase()는 아무 일도 하지 않으므로 평소 실행 비용은 거의 없습니다.
+
+단계가 중첩되면 바깥 단계에는 안쪽 단계를 뺀 시간만 기록합니다
+(예: layout 안의 save 시간은 layout에 포함되지 않음).
+profile_dir를 지정하면 단계마다 cProfile을 따로 돌려 <단계>.prof 파일로 저장합니다.
+
+사용 예:
+    from portfolio_profile import phase, record_phases
+
+    with record_phases() as recorder:
+        create_portfolio_pdf()
+    print(recorder.seconds)   # {'content': 0.01, 'fonts': 0.02, ...}
+
+생성 스크립트에서:
+    python doc/generate_portfolio_pdf.py --profile
+    python doc/generate_portfolio_ppt.py --profile --profile-dir doc/.cache/profile
+    python -m pstats doc/.cache/profile/pptx-save.prof
+"""
+
+import cProfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+# 단계 이름 (보고서 출력 순서)
+PHASES = ('content', 'fonts', 'styles', 'images', 'build', 'layout', 'save')
+
+# 현재 측정 중인 기록기 스택 (중첩된 record_phases() 지원)
+_ACTIVE = []
+
+
+class PhaseRecorder:
+    """단계별 소요 시간(중첩 단계 제외)과 호출 횟수 기록"""
+
+    def __init__(self, profile=False):
+        self.seconds = {}
+        self.counts = {}
+        self.profile = profile
+        self.profilers = {}
+        self._stack = []
+
+    @contextmanager
+    def phase(self, name):
+        """한 단계의 시간 측정 (바깥 단계에서는 이 시간이 빠짐)"""
+        # cProfile은 동시에 하나만 켤 수 있으므로 바깥 단계의 프로파일러는 잠시 끔
+        outer = self._stack[-1][1] if self._stack else None
+        profiler = None
+        if self.profile:
+            profiler = self.profilers.setdefault(name, cProfile.Profile())
+            if outer is not None:
+                outer.disable()
+            profiler.enable()
+        self._stack.append([0.0, profiler])
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            nested = self._stack.pop()[0]
+            if profiler is not None:
+                profiler.disable()
+                if outer is not None:
+                    outer.enable()
+            self.seconds[name] = self.seconds.get(name, 0.0) + elapsed - nested
+            self.counts[name] = self.counts.get(name, 0) + 1
+            if self._stack:
+                self._stack[-1][0] += elapsed
+
+    def dump_stats(self, directory, prefix=''):
+        """단계별 cProfile 결과를 <prefix><단계>.prof 파일로 저장, 저장한 경로 목록 반환"""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        paths = []
+        for name, profiler in self.profilers.items():
+            path = directory / f"{prefix}{name}.prof"
+            profiler.dump_stats(str(path))
+            paths.append(path)
+        return paths
+
+    def total(self):
+        """기록된 모든 단계의 합계"""
+        return sum(self.seconds.values())
+
+    def as_dict(self):
+        """JSON 저장용 딕셔너리 (PHASES 순서, 그 밖의 단계는 뒤에)"""
+        names = [name for name in PHASES if name in self.seconds]
+        names += [name for name in self.seconds if name not in PHASES]
+        return {name: round(self.seconds[name], 6) for name in names}
+
+
+@contextmanager
+def phase(name):
+    """측정 중이면 현재 기록기에 단계 시간을 기록, 아니면 아무 일도 하지 않음"""
+    if not _ACTIVE:
+        yield
+        return
+    with _ACTIVE[-1].phase(name):
+        yield
+
+
+def add_profile_arguments(parser):
+    """생성 스크립트 공통 --profile / --profile-dir 옵션 추가"""
+    parser.add_argument('--profile', action='store_true',
+                        help="단계별(폰트 등록, 스타일, 요소 생성, 레이아웃, 저장) 소요 시간 출력")
+    parser.add_argument('--profile-dir', default=None,
+                        help="단계별 cProfile 결과(.prof)를 저장할 디렉토리 (--profile 포함)")
+
+
+def print_report(recorder, title="단계별 소요 시간"):
+    """단계별 시간과 비율 출력"""
+    total = recorder.total()
+    print(f"\n⏱️  {title} (합계 {total:.3f}s)")
+    for name, seconds in recorder.as_dict().items():
+        share = seconds / total * 100 if total else 0.0
+        calls = recorder.counts.get(name, 0)
+        calls_text = f" ({calls}회)" if calls > 1 else ""
+        print(f"   {name:<8} {seconds:8.3f}s  {share:5.1f}%{calls_text}")
+
+
+@contextmanager
+def profile_phases(enabled=False, profile_dir=None, prefix=''):
+    """
+    생성 스크립트의 --profile 옵션 처리
+    enabled 또는 profile_dir가 있으면 단계별 시간을 기록해 블록이 끝날 때 출력하고,
+    profile_dir가 있으면 단계별 cProfile 결과도 저장합니다.
+    """
+    if not enabled and not profile_dir:
+        yield None
+        return
+    with record_phases(PhaseRecorder(profile=bool(profile_dir))) as recorder:
+        try:
+            yield recorder
+        finally:
+            print_report(recorder)
+            if profile_dir:
+                paths = recorder.dump_stats(profile_dir, prefix)
+                print(f"📁 cProfile 결과: {Path(profile_dir)} ({len(paths)}개)")
+                print(f"💡 확인: python -m pstats {paths[0] if paths else '<파일>.prof'}")
+
+
+@contextmanager
+def record_phases(recorder=None):
+    """블록 안에서 실행되는 phase()를 기록하는 기록기를 활성화"""
+    recorder = recorder or PhaseRecorder()
+    _ACTIVE.append(recorder)
+    try:
+        yield recorder
+    finally:
+        _ACTIVE.remove(recorder)
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PPTX 본문 텍스트 측정 및 슬라이드 나누기
+글꼴 파일의 글자 폭(advance) 표를 한 번 읽어 doc/.cache/metrics에 캐시해 두고,
+렌더링 없이 본문 텍스트의 줄바꿈/높이를 계산해 자리 표시자를 넘치는 내용을 다음 슬라이드로 나눕니다.
+단어 폭도 측정기 안에 캐시하므로 경력/프로젝트 수백 개도 렌더링 없이 빠르게 나눌 수 있습니다.
+
+- 측정용 글꼴: portfolio_fonts.discover_korean_fonts()가 찾은 첫 번째 한글 폰트 (fontTools 필요)
+  없으면 유니코드 동아시아 문자 폭(전각/반각)으로 추정한 폭을 사용합니다.
+- PowerPoint와 같은 글꼴로 그리지는 않으므로 약간의 여유(FIT_MARGIN)를 두고 나눕니다.
+
+사용 방법:
+    python doc/portfolio_textfit.py   # 측정용 글꼴과 슬라이드 나누기 결과 확인
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import unicodedata
+from pathlib import Path
+
+# 현재 스크립트의 디렉토리를 기준으로 경로 설정
+SCRIPT_DIR = Path(__file__).parent.absolute()
+DOC_DIR = SCRIPT_DIR
+ROOT_DIR = SCRIPT_DIR.parent
+
+CACHE_DIR = DOC_DIR / ".cache" / "metrics"
+
+# 캐시 형식이 바뀌면 올려서 기존 캐시를 무효화합니다.
+METRICS_CACHE_VERSION = 1
+
+# 1pt = 12700 EMU
+EMU_PER_POINT = 12700
+
+# 기본 템플릿 본문 자리 표시자의 안쪽 여백과 1수준 들여쓰기 (EMU)
+INSET_X = 91440
+INSET_Y = 45720
+INDENT = 342900
+
+# 줄 높이 (글꼴 크기 대비)와 단락 앞 간격 (줄 높이 대비, 마스터 bodyStyle spcBef 20%)
+LINE_SPACING = 1.2
+SPACE_BEFORE = 0.2
+
+# 측정 오차를 고려해 본문 높이의 이 비율까지만 채움
+FIT_MARGIN = 0.92
+
+# 글꼴이 없을 때의 추정 폭 (em): 전각(한글/한자), 반각, 공백
+FALLBACK_WIDE = 1.0
+FALLBACK_NARROW = 0.55
+FALLBACK_SPACE = 0.25
+
+# 글꼴 파일 -> 측정기 (같은 프로세스에서 다시 만들지 않음)
+_METRICS = {}
+
+
+class TextMetrics:
+    """글자 폭 표로 텍스트 폭을 계산하는 측정기 (폭 단위: em)"""
+
+    def __init__(self, advances, name, default=None):
+        self.advances = advances
+        self.name = name
+        self.default = default
+        self._word_cache = {}
+
+    def _advance(self, char):
+        advance = self.advances.get(ord(char))
+        if advance is None:
+            if char.isspace():
+                advance = FALLBACK_SPACE
+            elif unicodedata.east_asian_width(char) in ('W', 'F'):
+                advance = FALLBACK_WIDE
+            else:
+                advance = self.default or FALLBACK_NARROW
+        return advance
+
+    def word_width(self, word):
+        """단어 하나의 폭 (em, 캐시)"""
+        width = self._word_cache.get(word)
+        if width is None:
+            width = sum(map(self._advance, word))
+            self._word_cache[word] = width
+        return width
+
+    def wrap(self, text, width_em):
+        """
+        폭이 width_em(em)인 줄에 맞춰 단어 단위로 줄바꿈 (한 줄보다 긴 단어는 글자 단위로 나눔)
+        공백에서 나뉜 줄은 끝에 공백을 남기므로 ''.join(lines)가 원래 텍스트가 됩니다.
+        """
+        space = self._advance(' ')
+        lines, line, line_width = [], '', 0.0
+        for index, word in enumerate(text.split(' ')):
+            word_width = self.word_width(word)
+            if index:
+                line += ' '
+                line_width += space
+            if line.strip() and line_width + word_width > width_em:
+                lines.append(line)
+                line, line_width = '', 0.0
+            if line_width + word_width <= width_em:
+                line += word
+                line_width += word_width
+                continue
+            for char in word:
+                char_width = self._advance(char)
+                if line.strip() and line_width + char_width > width_em:
+                    lines.append(line)
+                    line, line_width = '', 0.0
+                line += char
+                line_width += char_width
+        lines.append(line)
+        return lines
+
+
+def fallback_metrics():
+    """글꼴 없이 유니코드 문자 폭으로 추정하는 측정기"""
+    return TextMetrics({}, 'estimate')
+
+
+def _cache_file(path):
+    """폰트 파일 상태로 만든 글자 폭 표 캐시 경로"""
+    stat = path.stat()
+    key = f"v{METRICS_CACHE_VERSION}|{path.resolve()}|{stat.st_size}|{stat.st_mtime_ns}"
+    return CACHE_DIR / f"{path.stem}-{hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]}.pickle"
+
+
+def _read_advances(path):
+    """fontTools로 글자(코드포인트) -> 폭(em) 표 읽기"""
+    from fontTools.ttLib import TTFont
+    font = TTFont(str(path), lazy=True, fontNumber=0)
+    try:
+        units_per_em = font['head'].unitsPerEm
+        widths = font['hmtx'].metrics
+        return {codepoint: widths[glyph][0] / units_per_em
+                for codepoint, glyph in font.getBestCmap().items() if glyph in widths}
+    finally:
+        font.close()
+
+
+def load_metrics(path):
+    """글꼴 파일의 측정기 (글자 폭 표는 디스크에 캐시, 읽을 수 없으면 None)"""
+    path = Path(path)
+    key = str(path.resolve())
+    if key in _METRICS:
+        return _METRICS[key]
+
+    cache_file = _cache_file(path)
+    advances = None
+    if cache_file.exists():
+        try:
+            with open(cache_file, 'rb') as f:
+                advances = pickle.load(f)
+        except Exception as e:
+            print(f"⚠️ 글자 폭 캐시를 읽을 수 없어 다시 만듭니다 ({cache_file.name}): {e}")
+    if advances is None:
+        try:
+            advances = _read_advances(path)
+        except ImportError:
+            return None
+        except Exception as e:
+            print(f"⚠️ 글꼴의 글자 폭을 읽을 수 없습니다 ({path.name}): {e}")
+            return None
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # 워커 프로세스들이 동시에 같은 캐시를 쓸 수 있으므로 임시 파일 이름에 pid를 붙임
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(advances, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            print(f"⚠️ 글자 폭 캐시 저장 실패: {e}")
+
+    metrics = TextMetrics(advances, path.name, default=advances.get(ord('n')))
+    _METRICS[key] = metrics
+    return metrics
+
+
+def default_metrics():
+    """찾은 첫 번째 한글 폰트의 측정기 (없으면 추정 측정기)"""
+    if None not in _METRICS:
+        from portfolio_fonts import discover_korean_fonts
+        metrics = None
+        for path in discover_korean_fonts():
+            metrics = load_metrics(path)
+            if metrics is not None:
+                break
+        _METRICS[None] = metrics or fallback_metrics()
+    return _METRICS[None]
+
+
+class TextFrame:
+    """본문 자리 표시자 크기와 글꼴 크기로 계산한 줄 폭/높이 (pt)"""
+
+    def __init__(self, width, height, size_pt, metrics=None):
+        self.size = size_pt
+        self.metrics = metrics or default_metrics()
+        self.line_width_em = ((width - 2 * INSET_X - INDENT) / EMU_PER_POINT) / size_pt
+        self.capacity = (height - 2 * INSET_Y) / EMU_PER_POINT * FIT_MARGIN
+        self.line_height = size_pt * LINE_SPACING
+
+    def wrap(self, paragraph):
+        return self.metrics.wrap(paragraph, self.line_width_em)
+
+    def paragraph_height(self, paragraph, lines=None):
+        """단락 하나의 높이 (줄 수 × 줄 높이 + 단락 앞 간격)"""
+        count = lines if lines is not None else len(self.wrap(paragraph))
+        return self.line_height * (count + SPACE_BEFORE)
+
+    def height(self, paragraphs):
+        return sum(self.paragraph_height(p) for p in paragraphs)
+
+
+def paginate(blocks, frame, separator=()):
+    """
+    블록(단락 목록) 단위로 본문을 나눠 페이지(단락 목록) 목록 반환
+    블록은 되도록 한 페이지에 두고, 한 페이지보다 긴 블록만 단락 (그래도 길면 줄) 단위로 나눕니다.
+    separator: 같은 페이지의 블록 사이에 넣는 단락 (예: 빈 줄 + 구분선)
+    """
+    pages = []
+    page, used = [], 0.0
+    separator = list(separator)
+    separator_height = frame.height(separator)
+
+    def new_page():
+        nonlocal page, used
+        # 페이지 끝의 빈 단락은 버림
+        while page and not page[-1].strip():
+            page.pop()
+        if page:
+            pages.append(page)
+        page, used = [], 0.0
+
+    for block in blocks:
+        block = list(block)
+        block_height = frame.height(block)
+        gap = separator_height if page else 0.0
+        if page and used + gap + block_height > frame.capacity:
+            new_page()
+            gap = 0.0
+        if gap:
+            page += separator
+            used += gap
+        if used + block_height <= frame.capacity:
+            page += block
+            used += block_height
+            continue
+
+        # 한 페이지보다 긴 블록: 단락 단위로 채우고, 한 단락이 넘치면 줄 단위로 나눔
+        for paragraph in block:
+            lines = frame.wrap(paragraph)
+            height = frame.paragraph_height(paragraph, len(lines))
+            if page and used + height > frame.capacity:
+                new_page()
+            if not page and not paragraph.strip():
+                continue
+            if height <= frame.capacity:
+                page.append(paragraph)
+                used += height
+                continue
+            per_page = max(1, int(frame.capacity / frame.line_height - SPACE_BEFORE))
+            for start in range(0, len(lines), per_page):
+                chunk = lines[start:start + per_page]
+                if page:
+                    new_page()
+                page.append(''.join(chunk).strip())
+                used = frame.paragraph_height(None, len(chunk))
+    new_page()
+    return pages or [[]]
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, str(SCRIPT_DIR))
+    import time
+    from portfolio_content import load_content
+    from portfolio_theme import body_frame
+
+    metrics = default_metrics()
+    print(f"📏 측정용 글꼴: {metrics.name} ({len(metrics.advances)}자)")
+    content = load_content('ko')
+    left, top, width, height, size = body_frame('content')
+    frame = TextFrame(width, height, size, metrics)
+    blocks = [[exp.company, f"{exp.period} · {exp.title}", "", exp.description] for exp in content.experiences * 100]
+    started = time.perf_counter()
+    pages = paginate(blocks, frame, separator=['', '─' * 20, ''])
+    elapsed = time.perf_counter() - started
+    print(f"   경력 {len(blocks)}개 → 슬라이드 {len(pages)}장 ({elapsed * 1000:.1f}ms)")
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+포트폴리오 PPTX 템플릿 (마스터/테마/레이아웃)
+색상 팔레트와 제목/본문 글꼴 크기를 테마와 슬라이드 레이아웃에 미리 넣어 둔 템플릿을 만듭니다.
+생성 스크립트는 레이아웃으로 슬라이드를 추가하고 자리 표시자에 텍스트만 채우므로
+슬라이드마다 글꼴 크기/색상을 지정(run 단위 서식)할 필요가 없습니다.
+
+- python-pptx 기본 템플릿에서 시작해 테마 색상, 마스터 제목 스타일, 레이아웃별 글꼴 크기를 바꾸고
+  사용하지 않는 레이아웃은 지웁니다 (출력 파일이 작아지고 PowerPoint가 더 빨리 엽니다).
+- 만든 템플릿은 설정 해시로 doc/.cache/templates에 저장해 두고 다음 빌드부터는 바로 읽습니다.
+
+사용 방법:
+    python doc/portfolio_theme.py   # 템플릿 미리 만들기 (레이아웃 목록 출력)
+"""
+
+import copy
+import hashlib
+import io
+import json
+import os
+import zipfile
+from pathlib import Path
+
+# 현재 스크립트의 디렉토리를 기준으로 경로 설정
+SCRIPT_DIR = Path(__file__).parent.absolute()
+DOC_DIR = SCRIPT_DIR
+ROOT_DIR = SCRIPT_DIR.parent
+
+CACHE_DIR = DOC_DIR / ".cache" / "templates"
+
+# 템플릿 만드는 방식이 바뀌면 올려서 기존 캐시를 무효화합니다.
+THEME_VERSION = 2
+
+# 슬라이드 크기 (inch)
+SLIDE_SIZE = (10, 7.5)
+
+# 테마 색상 (theme 색 이름 -> RGB)
+# dk2: 제목(진한 파란색), dk1: 본문(다크 그레이), accent1/2: 스틸 블루/다크 오렌지, lt2: 연한 배경
+THEME_COLORS = {
+    'dk1': '333333',
+    'dk2': '003366',
+    'lt2': 'F5F5FA',
+    'accent1': '4682B4',
+    'accent2': 'FF8C00',
+}
+
+# 레이아웃 이름 -> (원본 레이아웃 번호, 제목 크기 pt, 제목 굵게, 부제목 크기 pt, 본문 크기 pt)
+# 원본 0: 제목 슬라이드, 1: 제목 및 내용 (크기가 None이면 마스터 스타일 사용)
+# 본문 크기는 portfolio_textfit이 슬라이드를 나눌 때도 사용합니다.
+LAYOUTS = {
+    'title':   (0, 54, True, 24, None),
+    'content': (1, 36, False, None, 18),
+    'about':   (1, 44, False, None, 18),
+    'project': (1, 32, False, None, 16),
+    'closing': (0, 54, True, 20, None),
+}
+
+NS = {
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+}
+
+# 템플릿 내용 (같은 프로세스에서 파일을 다시 읽지 않음)
+_TEMPLATE_BYTES = {}
+
+# 레이아웃 키 -> 본문 자리 표시자 (left, top, width, height, 글꼴 크기)
+_BODY_FRAMES = {}
+
+
+def layout_name(key):
+    """템플릿 안의 레이아웃 이름"""
+    return f"Portfolio {key.capitalize()}"
+
+
+def _qn(tag):
+    prefix, name = tag.split(':')
+    return f"{{{NS[prefix]}}}{name}"
+
+
+def _settings_digest():
+    """템플릿 설정 해시 (설정/버전/python-pptx 버전이 바뀌면 새로 만듦)"""
+    import pptx
+    settings = {'version': THEME_VERSION, 'pptx': pptx.__version__, 'size': SLIDE_SIZE,
+                'colors': THEME_COLORS, 'layouts': LAYOUTS}
+    return hashlib.sha256(json.dumps(settings, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def _set_scheme_colors(theme_part):
+    """테마 색 구성표를 THEME_COLORS로 교체"""
+    from lxml import etree
+
+    theme = etree.fromstring(theme_part.blob)
+    theme.set('name', 'Portfolio')
+    scheme = theme.find('.//a:clrScheme', NS)
+    scheme.set('name', 'Portfolio')
+    for name, rgb in THEME_COLORS.items():
+        slot = scheme.find(f'a:{name}', NS)
+        for child in list(slot):
+            slot.remove(child)
+        etree.SubElement(slot, _qn('a:srgbClr'), val=rgb)
+    theme_part._blob = etree.tostring(theme, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+
+def _set_solid_fill(def_rpr, scheme_color):
+    """defRPr의 글자 색을 테마 색으로 지정 (기존 색 지정은 제거)"""
+    from lxml import etree
+
+    for fill in def_rpr.findall('a:solidFill', NS):
+        def_rpr.remove(fill)
+    fill = etree.Element(_qn('a:solidFill'))
+    etree.SubElement(fill, _qn('a:schemeClr'), val=scheme_color)
+    def_rpr.insert(0, fill)
+
+
+def _level1_def_rpr(placeholder):
+    """자리 표시자 lstStyle의 1수준 글자 기본 서식 (없으면 만듦)"""
+    from lxml import etree
+
+    lst_style = placeholder.find('p:txBody/a:lstStyle', NS)
+    level1 = lst_style.find('a:lvl1pPr', NS)
+    if level1 is None:
+        level1 = etree.Element(_qn('a:lvl1pPr'))
+        lst_style.insert(0, level1)
+    def_rpr = level1.find('a:defRPr', NS)
+    if def_rpr is None:
+        def_rpr = etree.SubElement(level1, _qn('a:defRPr'))
+    return def_rpr
+
+
+def _style_layout(layout_element, name, title_size, title_bold, subtitle_size, body_size):
+    """레이아웃 이름과 제목/부제목/본문 글꼴 크기 지정"""
+    layout_element.find('p:cSld', NS).set('name', name)
+    for placeholder in layout_element.iterfind('p:cSld/p:spTree/p:sp', NS):
+        ph = placeholder.find('p:nvSpPr/p:nvPr/p:ph', NS)
+        ph_type = ph.get('type') if ph is not None else None
+        if ph_type in ('title', 'ctrTitle'):
+            def_rpr = _level1_def_rpr(placeholder)
+            def_rpr.set('sz', str(title_size * 100))
+            if title_bold:
+                def_rpr.set('b', '1')
+        elif ph_type == 'subTitle' and subtitle_size:
+            def_rpr = _level1_def_rpr(placeholder)
+            def_rpr.set('sz', str(subtitle_size * 100))
+            _set_solid_fill(def_rpr, 'tx1')
+        elif ph_type in (None, 'body', 'obj') and ph is not None and body_size:
+            _level1_def_rpr(placeholder).set('sz', str(body_size * 100))
+
+
+def build_template():
+    """템플릿 Presentation 생성 (LAYOUTS 순서의 레이아웃만 포함)"""
+    from pptx import Presentation
+    from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+    from pptx.util import Inches
+
+    prs = Presentation()
+    prs.slide_width = Inches(SLIDE_SIZE[0])
+    prs.slide_height = Inches(SLIDE_SIZE[1])
+    master = prs.slide_master
+    _set_scheme_colors(master.part.part_related_by(RT.THEME))
+
+    # 마스터 제목 스타일: 진한 파란색 (테마 dk2 = tx2)
+    title_rpr = master._element.find('p:txStyles/p:titleStyle/a:lvl1pPr/a:defRPr', NS)
+    _set_solid_fill(title_rpr, 'tx2')
+
+    # 원본 레이아웃 뼈대를 먼저 복사해 두고, 앞에서부터 차례로 덮어씀
+    originals = list(prs.slide_layouts)
+    sources = {index: copy.deepcopy(originals[index]._element) for index, *_ in LAYOUTS.values()}
+    for target, (key, (source, *sizes)) in zip(originals, LAYOUTS.items()):
+        element = target._element
+        element.replace(element.find('p:cSld', NS), copy.deepcopy(sources[source].find('p:cSld', NS)))
+        element.set('type', sources[source].get('type'))
+        _style_layout(element, layout_name(key), *sizes)
+
+    for layout in originals[len(LAYOUTS):]:
+        prs.slide_layouts.remove(layout)
+    return prs
+
+
+def template_bytes():
+    """캐시된 템플릿 내용 (없으면 만들어 저장)"""
+    digest = _settings_digest()
+    if digest in _TEMPLATE_BYTES:
+        return _TEMPLATE_BYTES[digest]
+
+    cache_file = CACHE_DIR / f"portfolio-{digest[:16]}-v{THEME_VERSION}.pptx"
+    data = None
+    if cache_file.exists():
+        try:
+            data = cache_file.read_bytes()
+            # 잘린 파일은 중앙 디렉토리를 읽을 때 BadZipFile이 나므로 여기서 확인
+            zipfile.ZipFile(io.BytesIO(data)).close()
+        except (OSError, zipfile.BadZipFile) as e:
+            print(f"⚠️ PPTX 템플릿 캐시를 읽을 수 없어 다시 만듭니다 ({cache_file.name}): {e}")
+            data = None
+
+    if data is None:
+        buffer = io.BytesIO()
+        build_template().save(buffer)
+        data = buffer.getvalue()
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # 워커 프로세스들이 동시에 같은 캐시를 쓸 수 있으므로 임시 파일 이름에 pid를 붙임
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            print(f"⚠️ PPTX 템플릿 캐시 저장 실패: {e}")
+    _TEMPLATE_BYTES[digest] = data
+    return data
+
+
+def new_presentation():
+    """포트폴리오 템플릿으로 새 Presentation 생성"""
+    from pptx import Presentation
+    return Presentation(io.BytesIO(template_bytes()))
+
+
+def slide_layout(prs, key):
+    """레이아웃 키(LAYOUTS)로 슬라이드 레이아웃 찾기"""
+    return prs.slide_layouts.get_by_name(layout_name(key))
+
+
+def body_frame(key):
+    """레이아웃의 본문 자리 표시자 위치/크기(EMU)와 본문 글꼴 크기(pt): (left, top, width, height, size)"""
+    if not _BODY_FRAMES:
+        prs = new_presentation()
+        for name, settings in LAYOUTS.items():
+            layout = slide_layout(prs, name)
+            body = next(p for p in layout.placeholders if p.placeholder_format.idx == 1)
+            _BODY_FRAMES[name] = (body.left, body.top, body.width, body.height, settings[4] or 32)
+    return _BODY_FRAMES[key]
+
+
+if __name__ == "__main__":
+    prs = new_presentation()
+    print(f"🎨 PPTX 템플릿: {len(template_bytes()) / 1024:.1f}KB ({CACHE_DIR})")
+    for layout in prs.slide_layouts:
+        print(f"   {layout.name}")
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+포트폴리오 문서 로컬 렌더 서버
+요청한 형식/언어/용지 크기의 포트폴리오 문서를 그 자리에서 만들어 응답합니다 (doc/에는 쓰지 않음).
+한 프로세스에서 계속 실행되므로 생성기 모듈, 한글 폰트, 스타일, 템플릿이 메모리에 남아 있고,
+만든 문서는 (형식, 언어, 용지 크기, 입력 해시) 키의 LRU 캐시에 보관해 같은 요청에는 바로 응답합니다.
+
+- 입력 해시: build_manifest.inputs_hash() (콘텐츠 원본, 스크립트, 폰트, 이미지가 바뀌면 새 키)
+- 캐시 크기: 문서 바이트 합계가 CACHE_MAX_BYTES를 넘으면 가장 오래 쓰지 않은 문서부터 버림
+- 생성기는 스레드에 안전하지 않으므로 렌더링은 한 번에 하나씩 (같은 요청이 몰리면 한 번만 렌더링)
+- 생성기의 진행 메시지(stdout)는 렌더 잠금 안에서만 버리고, 서버 로그는 stderr로 출력
+
+엔드포인트:
+    GET /render/<pdf|docx|pptx>?lang=ko&pagesize=A4   문서 바이트 (X-Cache: HIT/MISS, X-Render-Seconds)
+    GET /stats                                         캐시 hit/miss/eviction과 형식별 렌더 시간 (JSON)
+
+사용 방법:
+    python doc/serve_portfolio.py                       # http://127.0.0.1:8765
+    python doc/serve_portfolio.py --port 9000 --cache-mb 128
+    python doc/serve_portfolio.py --socket /tmp/portfolio.sock
+    curl -o portfolio.pdf "http://127.0.0.1:8765/render/pdf?lang=en&pagesize=letter"
+    curl --unix-socket /tmp/portfolio.sock http://localhost/stats
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+# 현재 스크립트의 디렉토리를 기준으로 경로 설정
+SCRIPT_DIR = Path(__file__).parent.absolute()
+DOC_DIR = SCRIPT_DIR
+ROOT_DIR = SCRIPT_DIR.parent
+
+if str(SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_DIR))
+
+from build_manifest import inputs_hash
+from build_portfolio import (DEFAULT_LANG, DEFAULT_PAGESIZE, PAGED_FORMATS, RENDERERS,
+                             render_format, variants, warm_up)
+from portfolio_content import SUPPORTED_LANGS
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# 캐시에 보관할 문서 바이트 합계 상한
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# 형식별로 보관할 최근 렌더 시간 개수 (통계용)
+LATENCY_WINDOW = 100
+
+CONTENT_TYPES = {
+    'pdf': 'application/pdf',
+    'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
+}
+
+
+def log(message):
+    """
+    서버 로그 출력 (stderr)
+    렌더링하는 동안 프로세스 전체의 sys.stdout을 바꾸므로 다른 스레드에서는 print를 쓰지 않음
+    """
+    sys.stderr.write(message + "\n")
+    sys.stderr.flush()
+
+
+class RenderCache:
+    """바이트 합계로 크기를 제한하는 LRU 캐시 (키 -> 문서 바이트)"""
+
+    def __init__(self, max_bytes=CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """캐시된 문서 (없으면 None), 찾으면 가장 최근 사용으로 옮김"""
+        with self._lock:
+            data = self.entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def peek(self, key):
+        """통계와 순서를 바꾸지 않고 캐시된 문서 확인 (없으면 None)"""
+        with self._lock:
+            return self.entries.get(key)
+
+    def put(self, key, data):
+        """문서 저장 (상한을 넘으면 오래된 것부터 버림, 상한보다 큰 문서는 저장하지 않음)"""
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous)
+            self.entries[key] = data
+            self.size += len(data)
+            while self.size > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= len(evicted)
+                self.evictions += 1
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self.entries),
+                'bytes': self.size,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else None,
+                'evictions': self.evictions,
+            }
+
+
+class RenderService:
+    """생성기를 감싸 문서 바이트를 만들고 캐시/렌더 시간 통계를 관리"""
+
+    def __init__(self, cache_max_bytes=CACHE_MAX_BYTES):
+        self.cache = RenderCache(cache_max_bytes)
+        self.latencies = {fmt: deque(maxlen=LATENCY_WINDOW) for fmt in RENDERERS}
+        self.renders = {fmt: 0 for fmt in RENDERERS}
+        self.errors = 0
+        self.started = time.time()
+        # 생성기(reportlab 폰트 등록, 모듈 캐시)는 스레드에 안전하지 않으므로 렌더링은 하나씩
+        self._render_lock = threading.Lock()
+        self._tmp_dir = tempfile.TemporaryDirectory(prefix='portfolio-render-')
+
+    def key(self, fmt, lang, pagesize):
+        """캐시 키 (형식, 언어, 용지 크기, 입력 해시)"""
+        digest = inputs_hash(fmt, lang, extra={'pagesize': pagesize} if pagesize else None)
+        return fmt, lang, pagesize, digest
+
+    def render(self, fmt, lang=DEFAULT_LANG, pagesize=DEFAULT_PAGESIZE):
+        """
+        문서 바이트 반환: (bytes, 캐시 hit 여부, 렌더 시간)
+        지원하지 않는 형식/언어/용지 크기는 ValueError, 렌더링 실패는 RuntimeError
+        """
+        (fmt, lang, pagesize), = variants([fmt], [lang], [pagesize])
+        key = self.key(fmt, lang, pagesize)
+        data = self.cache.get(key)
+        if data is not None:
+            return data, True, 0.0
+
+        with self._render_lock:
+            # 기다리는 동안 같은 문서를 다른 요청이 이미 만들었을 수 있음
+            data = self.cache.peek(key)
+            if data is not None:
+                return data, True, 0.0
+
+            suffix = f"_{lang}_{pagesize}" if pagesize else f"_{lang}"
+            path = Path(self._tmp_dir.name) / f"portfolio{suffix}.{fmt}"
+            # 생성기의 진행 메시지는 버림 (sys.stdout은 프로세스 전체에서 공유되므로
+            # 반드시 렌더 잠금 안에서만 바꾸고, 다른 스레드의 로그는 log()로 stderr에 출력)
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = render_format(fmt, lang, pagesize, filename=path)
+            if result['error']:
+                self.errors += 1
+                log(f"❌ 렌더링 실패 ({fmt}, {lang}, {pagesize}): {result['error']}")
+                raise RuntimeError(result['error'])
+            rendered = Path(result['path'])
+            data = rendered.read_bytes()
+            rendered.unlink()
+
+        self.cache.put(key, data)
+        self.renders[fmt] += 1
+        self.latencies[fmt].append(result['seconds'])
+        return data, False, result['seconds']
+
+    def stats(self):
+        """캐시와 형식별 렌더 시간 통계 (최근 LATENCY_WINDOW회 기준)"""
+        render_stats = {}
+        for fmt, samples in self.latencies.items():
+            ordered = sorted(samples)
+            render_stats[fmt] = {
+                'renders': self.renders[fmt],
+                'mean_seconds': round(sum(ordered) / len(ordered), 4) if ordered else None,
+                'p95_seconds': round(ordered[int(0.95 * (len(ordered) - 1))], 4) if ordered else None,
+                'max_seconds': round(ordered[-1], 4) if ordered else None,
+            }
+        return {
+            'uptime_seconds': round(time.time() - self.started, 1),
+            'cache': self.cache.stats(),
+            'render': render_stats,
+            'errors': self.errors,
+        }
+
+    def close(self):
+        self._tmp_dir.cleanup()
+
+
+class RenderHandler(BaseHTTPRequestHandler):
+    """GET /render/<형식>, GET /stats"""
+
+    server_version = "PortfolioRender/1.0"
+
+    @property
+    def service(self):
+        return self.server.service
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        parts = [part for part in url.path.split('/') if part]
+        if parts == ['stats']:
+            self._send_json(200, self.service.stats())
+        elif len(parts) == 2 and parts[0] == 'render':
+            self._render(parts[1], parse_qs(url.query))
+        else:
+            self._send_json(404, {'error': f"알 수 없는 경로입니다: {url.path}"})
+
+    def _render(self, fmt, query):
+        lang = query.get('lang', [DEFAULT_LANG])[0]
+        pagesize = query.get('pagesize', [DEFAULT_PAGESIZE])[0]
+        try:
+            data, hit, seconds = self.service.render(fmt, lang, pagesize)
+        except ValueError as e:
+            self._send_json(404 if fmt not in RENDERERS else 400, {'error': str(e)})
+            return
+        except Exception as e:
+            self._send_json(500, {'error': str(e)})
+            return
+        suffix = f"_{lang}" + (f"_{pagesize}" if fmt in PAGED_FORMATS else "")
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPES[fmt])
+        self.send_header('Content-Length', str(len(data)))
+        self.send_header('Content-Disposition', f'attachment; filename="PORTFOLIO_PRESENTATION{suffix}.{fmt}"')
+        self.send_header('X-Cache', 'HIT' if hit else 'MISS')
+        self.send_header('X-Render-Seconds', f"{seconds:.4f}")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False, indent=2).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self):
+        # unix 소켓에는 클라이언트 주소가 없음
+        return self.client_address[0] if self.client_address else 'unix'
+
+
+class UnixRenderServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """unix 소켓용 렌더 서버 (HTTP 요청 형식은 같음)"""
+    daemon_threads = True
+
+
+def make_server(service, host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None):
+    """HTTP(TCP) 또는 unix 소켓 서버 생성"""
+    if socket_path:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(socket_path)
+        server = UnixRenderServer(str(socket_path), RenderHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), RenderHandler)
+    server.service = service
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="포트폴리오 문서 로컬 렌더 서버 (LRU 캐시)")
+    parser.add_argument('--host', default=DEFAULT_HOST, help=f"바인드 주소 (기본: {DEFAULT_HOST})")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"포트 (기본: {DEFAULT_PORT})")
+    parser.add_argument('--socket', default=None, help="TCP 대신 이 경로의 unix 소켓에서 대기")
+    parser.add_argument('--cache-mb', type=float, default=CACHE_MAX_BYTES / (1024 * 1024),
+                        help=f"캐시할 문서 크기 합계 상한 (MB, 기본: {CACHE_MAX_BYTES // (1024 * 1024)})")
+    parser.add_argument('--langs', default=','.join(SUPPORTED_LANGS),
+                        help="시작할 때 미리 준비할 언어 (쉼표 구분, 기본: 모든 언어)")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    langs = [lang.strip() for lang in args.langs.split(',') if lang.strip()]
+    # 서버 스레드를 시작하기 전이므로 stdout을 바꿔도 다른 출력에 영향이 없음
+    with contextlib.redirect_stdout(io.StringIO()):
+        warm_up(list(RENDERERS), langs)
+    service = RenderService(int(args.cache_mb * 1024 * 1024))
+    server = make_server(service, args.host, args.port, args.socket)
+    where = f"unix:{args.socket}" if args.socket else f"http://{args.host}:{args.port}"
+    log(f"🚀 렌더 서버 시작: {where} (준비 {time.perf_counter() - started:.2f}s, 캐시 {args.cache_mb:g}MB)")
+    log(f"   GET /render/<{'|'.join(RENDERERS)}>?lang=ko&pagesize=A4, GET /stats (Ctrl+C로 종료)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        log("\n👋 렌더 서버를 종료합니다.")
+    finally:
+        server.server_close()
+        service.close()
+        if args.socket:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(args.socket)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기술 태그별 맞춤 포트폴리오 일괄 생성
+지원하는 회사마다 다른 기술 스택(Android만, Spring/Java만, Flutter만 등)에 맞춘 포트폴리오가 필요할 때,
+생성 스크립트 안의 경력/기술 목록을 손으로 고치지 않고 태그 필터 목록을 받아
+필터마다 PDF/DOCX/PPTX 한 벌을 한 번에 만듭니다.
+
+- 필터 형식: [이름=]태그,태그,...  (예: android=Android,Kotlin, spring-java=Spring,Java, Flutter)
+  태그 중 하나라도 단어 단위로 일치하면(대소문자 무시, 'Java'는 'JavaScript'에 걸리지 않음) 남깁니다.
+  · 프로젝트: 제목, 개발 환경, 태그
+  · 경력: 직함, 회사, 설명 (연락처의 경력 목록도 남은 경력의 회사만)
+  · 기술: 기술 이름 (남는 기술이 없는 카테고리는 뺌)
+  어느 언어의 텍스트에서든 걸리면 선택하고, 같은 선택을 모든 언어에 적용하므로
+  ko/en 문서의 항목 목록이 같습니다. 핵심 역량, 학력, 자격증, 링크는 그대로 둡니다.
+- 작업(필터 × 형식 × 언어 × 용지 크기)은 프로세스 풀에서 처리합니다. 워커는 시작할 때
+  build_portfolio.warm_up()으로 콘텐츠 모델, 한글 폰트, 스타일/템플릿을 한 번만 준비하고,
+  필터를 적용한 콘텐츠도 프로세스 안에 캐시해 여러 작업이 함께 씁니다.
+- 빌드 매니페스트(build_manifest.py)에 필터 태그까지 넣어 기록하므로 바뀌지 않은 문서는 건너뜁니다.
+- 끝나면 새로 만든 문서 수와 처리량(docs/s)을 출력합니다.
+- 결과 위치: doc/tailored/PORTFOLIO_PRESENTATION_<이름>.<형식> (ko, A4 이외는 _en_letter 등을 붙임)
+
+사용 방법:
+    python doc/tailor_portfolio.py android=Android,Kotlin spring-java=Spring,Java Flutter
+    python doc/tailor_portfolio.py Flutter --formats pdf --langs ko,en --jobs 4
+    python doc/tailor_portfolio.py android=Android --list     # 필터에 걸리는 항목만 확인
+    python doc/build_portfolio.py --tailor android=Android,Kotlin --tailor Flutter
+"""
+
+import argparse
+import contextlib
+import copy
+import hashlib
+import io
+import os
+import re
+import sys
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+# 현재 스크립트의 디렉토리를 기준으로 경로 설정
+SCRIPT_DIR = Path(__file__).parent.absolute()
+DOC_DIR = SCRIPT_DIR
+ROOT_DIR = SCRIPT_DIR.parent
+
+# 워커 프로세스에서도 doc/ 모듈을 import할 수 있도록 경로 추가
+if str(SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_DIR))
+
+from portfolio_content import CAREER_COMPANIES, SUPPORTED_LANGS, SkillGroup, load_content
+from build_manifest import BuildManifest, inputs_hash
+from build_portfolio import (DEFAULT_LANG, DEFAULT_PAGESIZE, OUTPUT_NAME, RENDERERS, output_path,
+                             render_format, variant_label, variants, warm_up)
+
+TAILORED_DIR = DOC_DIR / "tailored"
+
+
+def _slug(text):
+    """필터 이름 -> 파일명에 쓸 이름 (영문 소문자/숫자/한글과 '-'만 남김)"""
+    text = unicodedata.normalize('NFKC', text).lower()
+    return re.sub(r'[^0-9a-z가-힣]+', '-', text).strip('-')
+
+
+def parse_filter(spec):
+    """
+    '[이름=]태그,태그,...' -> (이름, (태그, ...))
+    이름을 생략하면 태그로 만듭니다 ('Spring,Java' -> 'spring-java').
+    """
+    name, sep, tags = spec.partition('=')
+    if not sep:
+        name, tags = '', name
+    tags = tuple(dict.fromkeys(tag.strip() for tag in tags.split(',') if tag.strip()))
+    if not tags:
+        raise ValueError(f"태그가 없는 필터입니다: {spec!r}")
+    slug = _slug(name or '-'.join(tags))
+    if not slug:
+        raise ValueError(f"필터 이름을 파일명으로 쓸 수 없습니다: {spec!r}")
+    return slug, tags
+
+
+def tag_pattern(tags):
+    """태그 중 하나와 단어 단위로 일치하는 정규식 (대소문자 무시)"""
+    alternatives = '|'.join(re.escape(tag) for tag in sorted(tags, key=len, reverse=True))
+    return re.compile(rf'(?<!\w)(?:{alternatives})(?!\w)', re.IGNORECASE)
+
+
+def select_items(tags, langs=SUPPORTED_LANGS):
+    """
+    태그에 걸리는 프로젝트/경력/기술을 한 번만 고름 (어느 언어의 텍스트에서든 걸리면 선택)
+    번역된 텍스트마다 결과가 달라지지 않도록 locale 키로 고르고 모든 언어에 같은 선택을 적용합니다.
+    ('안드로이드'라고 쓴 ko 설명도 en 설명의 'Android'로 선택됨)
+    반환값: {'projects': 프로젝트 키 집합, 'experiences': 경력 키 집합, 'skills': (카테고리 키, 순서) 집합}
+    """
+    pattern = tag_pattern(tags)
+
+    def hit(*texts):
+        return any(pattern.search(text) for text in texts if text)
+
+    selection = {'projects': set(), 'experiences': set(), 'skills': set()}
+    for lang in langs:
+        content = load_content(lang)
+        selection['projects'].update(project.key for project in content.projects
+                                     if hit(project.title, project.env, *(project.tags or [])))
+        selection['experiences'].update(experience.key for experience in content.experiences
+                                        if hit(experience.title, experience.company, experience.description))
+        for group in content.skill_groups:
+            selection['skills'].update((group.key, index) for index, skill in enumerate(group.skills)
+                                       if hit(skill.name))
+    return selection
+
+
+def tailor_content(content, selection):
+    """
+    select_items()로 고른 항목만 남긴 콘텐츠 복사본
+    (원본 콘텐츠 모델은 그대로 두므로 다른 필터와 함께 써도 됨)
+    연락처의 경력 목록에서도 남은 경력에 없는 회사는 뺍니다 (총 경력 등 요약 줄은 유지).
+    """
+    tailored = copy.copy(content)
+    tailored.projects = [project for project in content.projects if project.key in selection['projects']]
+    tailored.experiences = [experience for experience in content.experiences
+                            if experience.key in selection['experiences']]
+    tailored.skill_groups = []
+    for group in content.skill_groups:
+        skills = [skill for index, skill in enumerate(group.skills) if (group.key, index) in selection['skills']]
+        if skills:
+            tailored.skill_groups.append(SkillGroup(key=group.key, title=group.title, skills=skills))
+
+    companies = {experience.company for experience in tailored.experiences}
+    tailored.careers = [career for index, career in enumerate(content.careers)
+                        if index >= len(CAREER_COMPANIES)
+                        or content.text(f"contact.exp_{CAREER_COMPANIES[index]}_company") in companies]
+    return tailored
+
+
+# 프로세스 내 캐시 ((태그, 언어별 원본 해시) -> 선택, (lang, 태그, 원본 해시) -> PortfolioContent)
+_SELECTION_CACHE = {}
+_TAILORED_CACHE = {}
+
+
+def tag_selection(tags):
+    """태그 필터의 항목 선택 (모든 언어 공통, 같은 프로세스의 작업끼리 공유)"""
+    key = (tags, tuple(load_content(lang).source_hash for lang in SUPPORTED_LANGS))
+    if key not in _SELECTION_CACHE:
+        _SELECTION_CACHE[key] = select_items(tags)
+    return _SELECTION_CACHE[key]
+
+
+def tailored_content(lang, tags):
+    """언어별 공유 콘텐츠 모델에 필터를 적용한 결과 (같은 프로세스의 작업끼리 공유)"""
+    content = load_content(lang)
+    key = (lang, tags, content.source_hash)
+    if key not in _TAILORED_CACHE:
+        _TAILORED_CACHE[key] = tailor_content(content, tag_selection(tags))
+    return _TAILORED_CACHE[key]
+
+
+def tailored_path(name, fmt, lang=DEFAULT_LANG, pagesize=DEFAULT_PAGESIZE):
+    """맞춤 포트폴리오 출력 경로 (변형 파일명에 필터 이름을 붙임)"""
+    base = output_path(fmt, lang, pagesize).name
+    return TAILORED_DIR / base.replace(OUTPUT_NAME, f"{OUTPUT_NAME}_{name}", 1)
+
+
+def _script_hash():
+    """필터 규칙이 바뀌면 맞춤 문서를 다시 만들도록 이 스크립트 내용을 입력 해시에 포함"""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+def _init_worker(formats, langs):
+    """워커 시작 시 콘텐츠 모델/폰트/스타일 준비 (실패하면 각 작업에서 오류로 보고)"""
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            warm_up(formats, langs)
+    except Exception:
+        pass
+
+
+def render_tailored(name, tags, fmt, lang=DEFAULT_LANG, pagesize=None):
+    """
+    맞춤 포트폴리오 하나를 렌더링 (워커 프로세스에서 실행)
+    반환값: build_portfolio.render_format()의 결과 + {'filter'}
+    """
+    content = tailored_content(lang, tags)
+    # 문서마다 나오는 생성기 진행 메시지는 숨기고 마지막에 결과표로 보여줌
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = render_format(fmt, lang, pagesize, filename=tailored_path(name, fmt, lang, pagesize),
+                               content=content)
+    result['filter'] = name
+    return result
+
+
+def tailor_all(filters, formats=None, langs=None, pagesizes=None, jobs=None, serial=False, force=False):
+    """
+    필터 × 변형(형식 × 언어 × 용지 크기) 맞춤 포트폴리오를 동시에 빌드
+    filters: [(이름, (태그, ...)), ...]
+    반환값: (결과 리스트, 전체 소요 시간, 매니페스트)
+    """
+    matrix = variants(formats, langs, pagesizes)
+    formats = sorted({fmt for fmt, _, _ in matrix})
+    langs = sorted({lang for _, lang, _ in matrix})
+    names = [name for name, _ in filters]
+    duplicated = sorted({name for name in names if names.count(name) > 1})
+    if duplicated:
+        raise ValueError(f"필터 이름이 겹칩니다: {', '.join(duplicated)} (이름=태그 형식으로 구분해주세요)")
+
+    started = time.perf_counter()
+    manifest = BuildManifest()
+    script_hash = _script_hash()
+    digests = {}
+    results = []
+    pending = []
+    for name, tags in filters:
+        for fmt, lang, pagesize in matrix:
+            job = (name, tags, fmt, lang, pagesize)
+            # 선택은 모든 언어의 텍스트로 정하므로 다른 언어의 locale이 바뀌어도 선택이 달라지면 다시 빌드
+            selection = {part: sorted(items) for part, items in tag_selection(tags).items()}
+            digests[job] = inputs_hash(fmt, lang, extra={'pagesize': pagesize, 'tags': list(tags),
+                                                         'selection': selection, 'tailor': script_hash})
+            output = tailored_path(name, fmt, lang, pagesize)
+            if manifest.is_fresh(output, digests[job], force=force):
+                results.append({'filter': name, 'format': fmt, 'lang': lang, 'pagesize': pagesize,
+                                'path': str(output), 'seconds': 0.0, 'pid': os.getpid(), 'error': None,
+                                'skipped': True})
+            else:
+                pending.append(job)
+
+    TAILORED_DIR.mkdir(parents=True, exist_ok=True)
+    if serial or len(pending) <= 1:
+        if pending:
+            _init_worker(formats, langs)
+        for job in pending:
+            results.append(render_tailored(*job))
+    else:
+        # 워커마다 폰트/스타일/콘텐츠를 한 번만 준비하고 여러 작업에 재사용
+        workers = min(jobs or os.cpu_count() or 1, len(pending))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(formats, langs)) as executor:
+            futures = [executor.submit(render_tailored, *job) for job in pending]
+            for future in as_completed(futures):
+                results.append(future.result())
+    wall_seconds = time.perf_counter() - started
+
+    tags_by_name = dict(filters)
+    for result in results:
+        if result['skipped'] or result['error'] or not result['path']:
+            continue
+        job = (result['filter'], tags_by_name[result['filter']], result['format'], result['lang'],
+               result['pagesize'])
+        manifest.record(result['path'], digests[job], format=result['format'], lang=result['lang'],
+                        pagesize=result['pagesize'], tags=list(job[1]))
+    manifest.save()
+
+    order = [(name, fmt, lang, pagesize) for name, _ in filters for fmt, lang, pagesize in matrix]
+    results.sort(key=lambda r: order.index((r['filter'], r['format'], r['lang'], r['pagesize'])))
+    return results, wall_seconds, manifest
+
+
+def print_filters(filters, langs):
+    """필터별로 남는 프로젝트/경력/기술 수 출력"""
+    for name, tags in filters:
+        for lang in langs:
+            content = tailored_content(lang, tags)
+            skills = sum(len(group.skills) for group in content.skill_groups)
+            print(f"🏷️  {name}/{lang} ({', '.join(tags)}): 프로젝트 {len(content.projects)}개, "
+                  f"경력 {len(content.experiences)}개, 기술 {skills}개, 연락처 경력 {len(content.careers)}줄")
+
+
+def print_report(results, wall_seconds):
+    """빌드 결과와 처리량 출력"""
+    print("\n📊 맞춤 포트폴리오 빌드 결과")
+    for result in results:
+        label = f"{result['filter']}:{variant_label(result['format'], result['lang'], result['pagesize'])}"
+        if result['skipped']:
+            print(f"   ⏭️  {label:<28} {'-':>6}   변경 없음: {result['path']}")
+        elif result['error']:
+            print(f"   ❌ {label:<28} {result['seconds']:6.2f}s  {result['error']}")
+        else:
+            print(f"   ✅ {label:<28} {result['seconds']:6.2f}s  {result['path']}")
+    built = [r for r in results if not r['skipped'] and not r['error']]
+    workers = len({r['pid'] for r in built})
+    throughput = len(built) / wall_seconds if wall_seconds else 0.0
+    total = sum(r['seconds'] for r in built)
+    print(f"\n⏱️  전체 소요 시간: {wall_seconds:.2f}s (문서별 합계 {total:.2f}s, 워커 {workers}개)")
+    print(f"🚀 처리량: 문서 {len(built)}개 / {wall_seconds:.2f}s = {throughput:.2f} docs/s "
+          f"(건너뜀 {sum(1 for r in results if r['skipped'])}개)")
+
+
+def run_tailor(specs, formats=None, langs=None, pagesizes=None, jobs=None, serial=False, force=False,
+               list_only=False):
+    """필터 문자열 목록으로 맞춤 포트폴리오 빌드 후 결과 출력, 종료 코드 반환"""
+    try:
+        filters = [parse_filter(spec) for spec in specs]
+        langs = list(langs or [DEFAULT_LANG])
+        variants(formats, langs, pagesizes)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 2
+
+    print_filters(filters, langs)
+    # 프로젝트와 경력이 하나도 남지 않는 필터는 빈 문서가 되므로 빌드하지 않음
+    empty = [name for name, tags in filters
+             if not any(tailored_content(lang, tags).projects or tailored_content(lang, tags).experiences
+                        for lang in langs)]
+    for name in empty:
+        print(f"⚠️ '{name}' 필터에 걸리는 프로젝트/경력이 없어 건너뜁니다.")
+    filters = [(name, tags) for name, tags in filters if name not in empty]
+    if list_only or not filters:
+        return 0 if list_only or not empty else 1
+
+    try:
+        results, wall_seconds, manifest = tailor_all(filters, formats, langs, pagesizes, jobs=jobs,
+                                                     serial=serial, force=force)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 2
+    print_report(results, wall_seconds)
+    print(f"📋 매니페스트: hit {len(manifest.hits)}개, miss {len(manifest.misses)}개")
+    print(f"📁 저장 위치: {TAILORED_DIR}")
+
+    failed = [r for r in results if r['error']]
+    for result in failed:
+        label = variant_label(result['format'], result['lang'], result['pagesize'])
+        print(f"\n❌ {result['filter']}:{label} 빌드 오류:")
+        print(result.get('traceback', result['error']))
+    return 1 if failed else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="기술 태그별 맞춤 포트폴리오 PDF/DOCX/PPTX 일괄 생성")
+    parser.add_argument('filters', nargs='+', metavar='[NAME=]TAG,...',
+                        help="태그 필터 (예: android=Android,Kotlin spring-java=Spring,Java Flutter)")
+    parser.add_argument('--formats', default=','.join(RENDERERS),
+                        help="빌드할 형식 (쉼표 구분, 기본: pdf,docx,pptx)")
+    parser.add_argument('--langs', '--lang', dest='langs', default=DEFAULT_LANG,
+                        help="콘텐츠 언어 (쉼표 구분, 기본: ko)")
+    parser.add_argument('--pagesizes', default=DEFAULT_PAGESIZE,
+                        help="PDF/DOCX 용지 크기 (쉼표 구분, 기본: A4, 지원: A4,letter)")
+    parser.add_argument('--jobs', type=int, default=None, help="워커 프로세스 수 (기본: 작업 수, 최대 CPU 수)")
+    parser.add_argument('--serial', action='store_true', help="프로세스 풀 없이 순차 실행")
+    parser.add_argument('--force', action='store_true', help="빌드 매니페스트를 무시하고 전체 빌드")
+    parser.add_argument('--list', action='store_true', help="빌드하지 않고 필터별로 남는 항목 수만 출력")
+    args = parser.parse_args(argv)
+
+    formats = [fmt.strip() for fmt in args.formats.split(',') if fmt.strip()]
+    langs = [lang.strip() for lang in args.langs.split(',') if lang.strip()]
+    pagesizes = [size.strip() for size in args.pagesizes.split(',') if size.strip()]
+    return run_tailor(args.filters, formats, langs, pagesizes, jobs=args.jobs, serial=args.serial,
+                      force=args.force, list_only=args.list)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+포트폴리오 문서 감시(watch) 모드
+index.html, js/app.js, locales/*.json, 프로젝트 이미지, 아이콘, 생성 스크립트를 감시하다가
+파일이 바뀌면 그 파일을 입력으로 쓰는 출력(변형)만 다시 빌드합니다.
+
+생성 스크립트를 매번 새로 실행하지 않고 한 프로세스에서 계속 빌드하므로
+reportlab/python-docx/python-pptx import, 한글 폰트 등록, PDF 스타일, PPTX 템플릿과 글자 폭 표,
+콘텐츠 모델이 메모리에 남아 있어 수정 후 1초 안에 출력이 다시 만들어집니다.
+
+- 변경 감지: POLL_INTERVAL마다 입력 파일의 (크기, 수정 시각)을 비교합니다 (추가 라이브러리 불필요).
+- 디바운스: 에디터가 저장을 여러 번 나눠 쓰는 경우 DEBOUNCE_SECONDS 동안 더 바뀌지 않을 때 한 번만 빌드합니다.
+- 영향받는 출력: build_manifest.input_files()로 입력 파일 -> 변형 목록을 만들어 찾고,
+  내용이 실제로 바뀌었는지는 빌드 매니페스트 해시로 한 번 더 확인합니다 (저장만 한 경우 건너뜀).
+- 생성 스크립트(generate_portfolio_*.py)가 바뀌면 그 모듈만 다시 import하고,
+  공유 모듈(portfolio_*.py)이 바뀌면 모듈 간 상태가 섞이지 않도록 감시 프로세스를 다시 시작합니다.
+
+사용 방법:
+    python doc/watch_portfolio.py
+    python doc/watch_portfolio.py --formats pdf,pptx --langs ko,en
+    python doc/build_portfolio.py --watch          # 같은 동작
+    (Ctrl+C로 종료)
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import time
+from pathlib import Path
+
+# 현재 스크립트의 디렉토리를 기준으로 경로 설정
+SCRIPT_DIR = Path(__file__).parent.absolute()
+DOC_DIR = SCRIPT_DIR
+ROOT_DIR = SCRIPT_DIR.parent
+
+if str(SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_DIR))
+
+from build_manifest import FORMAT_SCRIPTS, GENERATOR_SCRIPTS, SHARED_SCRIPTS, input_files
+from build_portfolio import (DEFAULT_LANG, DEFAULT_PAGESIZE, PAGE_SIZES, RENDERERS, build_all,
+                             print_report, variant_label, variants, warm_up)
+from portfolio_content import SUPPORTED_LANGS
+
+# 파일 상태 확인 주기 (초)
+POLL_INTERVAL = 0.1
+
+# 마지막 변경 후 이 시간 동안 더 바뀌지 않으면 빌드 (초)
+DEBOUNCE_SECONDS = 0.2
+
+
+def _stat(path):
+    """파일 상태 (크기, 수정 시각), 없으면 None"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def watched_files(matrix):
+    """입력 파일 -> 그 파일을 쓰는 변형 목록"""
+    files = {}
+    for variant in matrix:
+        fmt, lang, _ = variant
+        for path in input_files(fmt, lang):
+            files.setdefault(Path(path), []).append(variant)
+    return files
+
+
+class Watcher:
+    """입력 파일 변경을 디바운스해 영향받는 변형만 같은 프로세스에서 다시 빌드"""
+
+    def __init__(self, matrix, poll_interval=POLL_INTERVAL, debounce=DEBOUNCE_SECONDS):
+        self.matrix = list(matrix)
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.files = {}
+        self.states = {}
+        self.refresh()
+
+    def refresh(self):
+        """감시 대상 다시 계산 (콘텐츠가 바뀌면 참조하는 이미지 목록도 바뀔 수 있음)"""
+        self.files = watched_files(self.matrix)
+        self.states = {path: _stat(path) for path in self.files}
+
+    def changes(self):
+        """마지막 확인 이후 바뀐 파일 목록 (상태는 갱신)"""
+        changed = []
+        for path, state in self.states.items():
+            current = _stat(path)
+            if current != state:
+                self.states[path] = current
+                changed.append(path)
+        return changed
+
+    def wait_for_changes(self):
+        """변경이 생기고 DEBOUNCE 동안 잠잠해질 때까지 기다려 (바뀐 파일 목록, 첫 변경 감지 시각) 반환"""
+        changed = []
+        first_seen = last_seen = None
+        while True:
+            time.sleep(self.poll_interval)
+            now = time.perf_counter()
+            batch = self.changes()
+            if batch:
+                changed += [path for path in batch if path not in changed]
+                first_seen = first_seen or now
+                last_seen = now
+            elif changed and now - last_seen >= self.debounce:
+                return changed, first_seen
+
+    def affected(self, changed):
+        """바뀐 파일을 입력으로 쓰는 변형 (matrix 순서)"""
+        hit = {variant for path in changed for variant in self.files.get(path, [])}
+        return [variant for variant in self.matrix if variant in hit]
+
+    def rebuild(self, changed, force=False):
+        """바뀐 파일에 영향받는 변형만 빌드, 결과 목록 반환"""
+        names = {path.name for path in changed}
+        if names & set(SHARED_SCRIPTS + [name for scripts in FORMAT_SCRIPTS.values() for name in scripts]):
+            restart(self.matrix)
+        for fmt, script in GENERATOR_SCRIPTS.items():
+            module_name = RENDERERS[fmt][0]
+            if script in names and module_name in sys.modules:
+                importlib.reload(sys.modules[module_name])
+                print(f"🔁 {script} 다시 불러옴")
+
+        matrix = self.affected(changed)
+        if not matrix:
+            return []
+        results, wall_seconds, manifest = build_all(matrix=matrix, serial=True, force=force)
+        print_report(results, wall_seconds, manifest)
+        self.refresh()
+        return results
+
+
+def restart(matrix):
+    """공유 모듈이 바뀌었을 때 같은 옵션으로 감시 프로세스를 새로 시작"""
+    formats = sorted({fmt for fmt, _, _ in matrix}, key=list(RENDERERS).index)
+    langs = sorted({lang for _, lang, _ in matrix})
+    pagesizes = sorted({pagesize for _, _, pagesize in matrix if pagesize}) or [DEFAULT_PAGESIZE]
+    print("🔄 공유 모듈이 바뀌어 감시 프로세스를 다시 시작합니다.")
+    sys.stdout.flush()
+    os.execv(sys.executable, [sys.executable, str(Path(__file__).absolute()),
+                              '--formats', ','.join(formats), '--langs', ','.join(langs),
+                              '--pagesizes', ','.join(pagesizes)])
+
+
+def watch(formats=None, langs=None, pagesizes=None, force=False,
+          poll_interval=POLL_INTERVAL, debounce=DEBOUNCE_SECONDS):
+    """감시 모드 실행 (Ctrl+C로 종료), 종료 코드 반환"""
+    try:
+        matrix = variants(formats, langs, pagesizes)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 2
+
+    started = time.perf_counter()
+    warm_up(sorted({fmt for fmt, _, _ in matrix}), sorted({lang for _, lang, _ in matrix}))
+    # 감시를 시작하기 전에 오래된 출력부터 맞춰 둠
+    results, wall_seconds, manifest = build_all(matrix=matrix, serial=True, force=force)
+    print_report(results, wall_seconds, manifest)
+
+    watcher = Watcher(matrix, poll_interval, debounce)
+    labels = ', '.join(variant_label(*variant) for variant in matrix)
+    print(f"\n👀 감시 중: 입력 파일 {len(watcher.files)}개 → {labels} "
+          f"(준비 {time.perf_counter() - started:.2f}s, Ctrl+C로 종료)")
+    try:
+        while True:
+            changed, first_seen = watcher.wait_for_changes()
+            print(f"\n✏️  변경: {', '.join(sorted(path.name for path in changed))}")
+            results = watcher.rebuild(changed)
+            if not results:
+                print("⏭️  영향받는 출력이 없습니다.")
+                continue
+            built = [r for r in results if not r['skipped'] and not r['error']]
+            print(f"⚡ 변경 감지 → 출력 {len(built)}개: {time.perf_counter() - first_seen:.2f}s "
+                  f"(디바운스 {debounce:.1f}s 포함)")
+    except KeyboardInterrupt:
+        print("\n👋 감시를 종료합니다.")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="포트폴리오 문서 감시 모드 (바뀐 입력에 영향받는 출력만 다시 빌드)")
+    parser.add_argument('--formats', default=','.join(RENDERERS),
+                        help="빌드할 형식 (쉼표 구분, 기본: pdf,docx,pptx)")
+    parser.add_argument('--langs', '--lang', dest='langs', default=DEFAULT_LANG,
+                        help=f"콘텐츠 언어 (쉼표 구분, 기본: ko, 지원: {','.join(SUPPORTED_LANGS)})")
+    parser.add_argument('--pagesizes', default=DEFAULT_PAGESIZE,
+                        help=f"PDF/DOCX 용지 크기 (쉼표 구분, 기본: A4, 지원: {','.join(PAGE_SIZES)})")
+    parser.add_argument('--force', action='store_true', help="시작할 때 매니페스트를 무시하고 전체 빌드")
+    parser.add_argument('--debounce', type=float, default=DEBOUNCE_SECONDS,
+                        help=f"마지막 변경 후 빌드까지 기다리는 시간 (초, 기본: {DEBOUNCE_SECONDS})")
+    args = parser.parse_args(argv)
+
+    def split(value):
+        return [item.strip() for item in value.split(',') if item.strip()]
+
+    return watch(split(args.formats), split(args.langs), split(args.pagesizes),
+                 force=args.force, debounce=args.debounce)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
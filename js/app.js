@@ -11,9 +11,25 @@ let isSkillTooltipsInitialized = false;
 let isInitializing = false;
 
 // Language Management
-let currentLang = localStorage.getItem('language') || 'ko';
+// Pre-rendered per-language pages (doc/build_pages.py) are already translated: <html data-prerendered="en">
+const PRERENDERED_PAGES = { ko: 'ko.html', en: 'en.html' };
+const prerenderedLang = document.documentElement.getAttribute('data-prerendered');
+let currentLang = prerenderedLang || localStorage.getItem('language') || 'ko';
 
 function switchLanguage(lang) {
+    // Every language has a pre-rendered page: go to it instead of translating in place
+    // (index.html itself only redirects to one of these pages, see its <head> script)
+    if (PRERENDERED_PAGES[lang]) {
+        if (lang === prerenderedLang) return;
+        try {
+            localStorage.setItem('language', lang);
+        } catch (e) {
+            // Ignore localStorage errors
+        }
+        window.location.href = PRERENDERED_PAGES[lang] + window.location.hash;
+        return;
+    }
+
     // Update language state (synchronous, safe)
     currentLang = lang;
 
@@ -71,16 +87,90 @@ function switchLanguage(lang) {
     }, 60);
 }
 
+// --- Compiled locale bundles (doc/build_locales.py) ---
+// locales/dist/manifest.json lists flattened per-section bundles with content-hashed file names,
+// so only the manifest is revalidated and the bundles can be served from the browser cache.
+const LOCALE_BUNDLE_VERSION = 1;
+let localeManifestPromise = null;
+const localeBundleCache = {};
+
+function fetchLocaleManifest() {
+    if (!localeManifestPromise) {
+        localeManifestPromise = fetch('/locales/dist/manifest.json', { cache: 'no-cache' })
+            .then(res => (res.ok ? res.json() : null))
+            .then(manifest => (manifest && manifest.version === LOCALE_BUNDLE_VERSION ? manifest : null))
+            .catch(() => null);
+    }
+    return localeManifestPromise;
+}
+
+// Sections used by this page: first segment of every data-i18n / data-i18n-html / data-i18n-attr key
+function usedLocaleSections(manifest) {
+    const sections = new Set(['modal']); // modal strings are also read from JS
+    const addKey = key => {
+        const section = manifest.prefixes[(key || '').split('.')[0]];
+        if (section) sections.add(section);
+    };
+    document.querySelectorAll('[data-i18n]').forEach(el => addKey(el.getAttribute('data-i18n')));
+    document.querySelectorAll('[data-i18n-html]').forEach(el => addKey(el.getAttribute('data-i18n-html')));
+    document.querySelectorAll('[data-i18n-attr]').forEach(el => {
+        (el.getAttribute('data-i18n-attr') || '').split(';').forEach(pair => {
+            const idx = pair.indexOf(':');
+            if (idx !== -1) addKey(pair.substring(idx + 1).trim());
+        });
+    });
+    return sections;
+}
+
+function fetchLocaleBundle(file) {
+    if (!localeBundleCache[file]) {
+        localeBundleCache[file] = fetch('/locales/dist/' + file, { cache: 'force-cache' })
+            .then(res => {
+                if (!res.ok) throw new Error('locale bundle ' + file + ': ' + res.status);
+                return res.json();
+            })
+            .catch(e => {
+                delete localeBundleCache[file];
+                throw e;
+            });
+    }
+    return localeBundleCache[file];
+}
+
+// Flat 'section.key' -> string map from the compiled bundles, or the nested locale JSON as a fallback
+async function fetchLocaleDict(lang) {
+    const manifest = await fetchLocaleManifest();
+    const entry = manifest && manifest.langs[lang];
+    if (entry) {
+        try {
+            const files = Array.from(usedLocaleSections(manifest))
+                .map(section => entry.sections[section])
+                .filter(Boolean)
+                .map(section => section.file);
+            const parts = await Promise.all(files.map(fetchLocaleBundle));
+            return Object.assign({}, ...parts);
+        } catch (e) {
+            // fall through to the full locale file
+        }
+    }
+    const res = await fetch('/locales/' + lang + '.json', { cache: 'no-cache' });
+    return res.ok ? res.json() : null;
+}
+
 // --- JSON-based locale loader and applier (data-i18n) ---
 async function loadLocale(lang) {
     try {
-        const url = '/locales/' + lang + '.json';
-        const res = await fetch(url, { cache: 'no-cache' });
-        if (!res.ok) {
+        const dict = await fetchLocaleDict(lang);
+        if (!dict) {
             window.currentLocale = null;
             return;
         }
-        const dict = await res.json();
+
+        // The page text is already in this language; only keep the strings JS reads (modals etc.)
+        if (prerenderedLang === lang) {
+            window.currentLocale = dict;
+            return;
+        }
 
         // --- SCROLL ANCHORING START ---
         // Find the element currently closest to the top of the viewport to maintain relative scroll position
@@ -219,6 +309,8 @@ function applyLocaleTranslations(dict) {
 
 function getValueByPath(obj, path) {
     if (!obj || !path) return undefined;
+    // Compiled bundles are flat ('section.key' -> string); the full locale JSON is nested
+    if (Object.prototype.hasOwnProperty.call(obj, path)) return obj[path];
     return path.split('.').reduce((o, k) => (o && Object.prototype.hasOwnProperty.call(o, k) ? o[k] : undefined), obj);
 }
 
@@ -226,6 +318,8 @@ function getValueByPath(obj, path) {
 window.addEventListener('DOMContentLoaded', () => {
     try {
         if (currentLang) loadLocale(currentLang);
+        // Pre-rendered pages need no translation pass, so initialize without waiting for the locale fetch
+        if (prerenderedLang) initializePage();
     } catch (e) {
         // ignore
     }
@@ -266,8 +360,10 @@ const projectImageMap = {
 };
 
 // Lazy load project images
-function lazyLoadProjectImages() {
-    const projectImages = document.querySelectorAll('.project-image');
+// Cards with a responsive <picture> (doc/build_images.py) already load lazily via loading="lazy"
+function lazyLoadProjectImages(root = document) {
+    const projectImages = Array.from(root.querySelectorAll('.project-image'))
+        .filter(imageDiv => !imageDiv.querySelector('.project-picture'));
     if (projectImages.length === 0) return;
 
     const observer = new IntersectionObserver((entries, observer) => {
@@ -294,6 +390,283 @@ function lazyLoadProjectImages() {
     });
 }
 
+// Paginated project cards (doc/build_pages.py): pre-rendered pages keep the first cards inline and
+// mark the end of the grid with <div class="projects-more" data-projects-index="projects/<lang>.index.<hash>.json">.
+// The remaining pages are content-hashed HTML fragments, fetched when the marker nears the viewport.
+// Set by lazyLoadProjectPages(): resolves to the card with the given title, loading fragments up to its page
+let loadProjectCard = null;
+
+function findProjectCard(title) {
+    return Array.from(document.querySelectorAll('.project-card')).find(el => {
+        const titleEl = el.querySelector('.project-title');
+        return titleEl && titleEl.textContent.trim() === title;
+    }) || null;
+}
+
+function lazyLoadProjectPages() {
+    const sentinel = document.querySelector('.projects-more[data-projects-index]');
+    const grid = document.querySelector('.projects-grid');
+    if (!sentinel || !grid) return;
+
+    const base = sentinel.getAttribute('data-projects-index').replace(/[^/]*$/, '');
+    let indexPromise = null;
+    let pages = null;
+    let pending = null;
+
+    // Fetched once; pages holds the fragments not appended yet
+    const loadIndex = () => {
+        if (!indexPromise) {
+            indexPromise = fetch(sentinel.getAttribute('data-projects-index'), { cache: 'force-cache' })
+                .then(res => {
+                    if (!res.ok) throw new Error('project index: ' + res.status);
+                    return res.json();
+                })
+                .then(index => {
+                    pages = index.pages.slice();
+                    return index;
+                });
+        }
+        return indexPromise;
+    };
+
+    // Resolves to true while more pages remain
+    const loadPage = async () => {
+        try {
+            await loadIndex();
+            const file = pages.shift();
+            if (file) {
+                const res = await fetch(base + file, { cache: 'force-cache' });
+                if (!res.ok) throw new Error('project page ' + file + ': ' + res.status);
+                const template = document.createElement('template');
+                template.innerHTML = await res.text();
+                const cards = Array.from(template.content.querySelectorAll('.project-card'));
+                grid.appendChild(template.content);
+                cards.forEach(card => lazyLoadProjectImages(card));
+                document.dispatchEvent(new CustomEvent('projectcardsloaded', { detail: { cards } }));
+            }
+            if (!pages.length) {
+                observer.disconnect();
+                sentinel.remove();
+                return false;
+            }
+        } catch (e) {
+            console.error('Error loading project cards:', e);
+            observer.disconnect();
+            pages = [];
+            return false;
+        }
+        // Re-observe so a marker that is still visible after this page triggers the next one
+        observer.unobserve(sentinel);
+        observer.observe(sentinel);
+        return true;
+    };
+
+    // Scrolling and search can both ask for the next page; share the request in flight
+    const loadNextPage = () => pending || (pending = loadPage().finally(() => { pending = null; }));
+
+    const observer = new IntersectionObserver(entries => {
+        if (entries.some(entry => entry.isIntersecting)) loadNextPage();
+    }, { rootMargin: '600px' }); // Start loading well before the end of the grid is reached
+
+    observer.observe(sentinel);
+
+    loadProjectCard = async title => {
+        const card = findProjectCard(title);
+        if (card) return card;
+        // cards[].page: 0 = inline, n = index.pages[n - 1]
+        const index = await loadIndex();
+        const entry = (index.cards || []).find(item => item.title === title);
+        if (!entry) return null;
+        while (index.pages.length - pages.length < entry.page) {
+            if (pending) await pending;
+            else if (!(await loadNextPage())) break;
+        }
+        return findProjectCard(title);
+    };
+}
+
+// --- Site search (doc/build_search.py) ---
+// search/manifest.json points at a per-language inverted index over project, experience and skill text.
+// Tokens must follow the same rules as doc/build_search.py: Latin words, Hangul syllable n-grams.
+const SEARCH_INDEX_VERSION = 1;
+const SEARCH_RESULT_LIMIT = 8;
+const searchIndexCache = {};
+
+function tokenizeSearchText(text, ngram) {
+    // One token list per word; a Hangul word becomes its syllable n-grams
+    const words = (text || '').normalize('NFKC').toLowerCase().match(/[가-힣]+|[a-z0-9]+/g) || [];
+    return words.map(word => {
+        if (!/^[가-힣]/.test(word) || word.length < ngram) return [word];
+        const grams = [];
+        for (let i = 0; i + ngram <= word.length; i++) grams.push(word.substring(i, i + ngram));
+        return grams;
+    });
+}
+
+function fetchSearchIndex(lang) {
+    if (!searchIndexCache[lang]) {
+        searchIndexCache[lang] = fetch('/search/manifest.json', { cache: 'no-cache' })
+            .then(res => (res.ok ? res.json() : null))
+            .then(manifest => {
+                const entry = manifest && manifest.version === SEARCH_INDEX_VERSION && manifest.langs[lang];
+                if (!entry) throw new Error('no search index for ' + lang);
+                return fetch('/search/' + entry.file, { cache: 'force-cache' });
+            })
+            .then(res => {
+                if (!res.ok) throw new Error('search index: ' + res.status);
+                return res.json();
+            })
+            .then(index => {
+                // Postings are stored as [doc delta, weight, ...]; decode once
+                index.postings = {};
+                Object.keys(index.terms).forEach(term => {
+                    const flat = index.terms[term];
+                    const list = [];
+                    let doc = 0;
+                    for (let i = 0; i < flat.length; i += 2) {
+                        doc += flat[i];
+                        list.push([doc, flat[i + 1]]);
+                    }
+                    index.postings[term] = list;
+                });
+                index.termList = Object.keys(index.terms);
+                return index;
+            })
+            .catch(e => {
+                delete searchIndexCache[lang];
+                throw e;
+            });
+    }
+    return searchIndexCache[lang];
+}
+
+// Every n-gram of a word must match; documents matching more words rank first, then by idf x weight
+function searchPortfolio(index, query, limit = SEARCH_RESULT_LIMIT) {
+    const total = index.docs.length;
+    const tokenScores = token => {
+        let terms;
+        if (/^[가-힣]/.test(token)) {
+            terms = token.length >= index.ngram
+                ? (index.postings[token] ? [token] : [])
+                : index.termList.filter(term => term.includes(token));
+        } else {
+            terms = index.termList.filter(term => term.startsWith(token));
+        }
+        const scores = new Map();
+        terms.forEach(term => {
+            const postings = index.postings[term];
+            const idf = Math.log(1 + total / postings.length);
+            postings.forEach(([doc, weight]) => {
+                scores.set(doc, Math.max(scores.get(doc) || 0, idf * weight));
+            });
+        });
+        return scores;
+    };
+
+    const results = new Map(); // doc -> [matched words, score]
+    tokenizeSearchText(query, index.ngram).forEach(tokens => {
+        let wordScores = null;
+        Array.from(new Set(tokens)).forEach(token => {
+            const scores = tokenScores(token);
+            if (wordScores === null) {
+                wordScores = scores;
+            } else {
+                const merged = new Map();
+                wordScores.forEach((score, doc) => {
+                    if (scores.has(doc)) merged.set(doc, score + scores.get(doc));
+                });
+                wordScores = merged;
+            }
+        });
+        (wordScores || new Map()).forEach((score, doc) => {
+            const entry = results.get(doc) || [0, 0];
+            results.set(doc, [entry[0] + 1, entry[1] + score]);
+        });
+    });
+    return Array.from(results.entries())
+        .sort((a, b) => (b[1][0] - a[1][0]) || (b[1][1] - a[1][1]) || (a[0] - b[0]))
+        .slice(0, limit)
+        .map(([doc]) => index.docs[doc]);
+}
+
+function initSiteSearch() {
+    const input = document.getElementById('siteSearch');
+    const list = document.getElementById('siteSearchResults');
+    if (!input || !list) return;
+
+    const escapeHtml = text => String(text).replace(/[&<>"']/g, c => ({ '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' }[c]));
+    const close = () => {
+        list.hidden = true;
+        list.innerHTML = '';
+    };
+
+    const render = async () => {
+        const query = input.value.trim();
+        if (!query) return close();
+        let index;
+        try {
+            index = await fetchSearchIndex(currentLang);
+        } catch (e) {
+            return close();
+        }
+        if (input.value.trim() !== query) return; // a newer keystroke is being handled
+        const docs = searchPortfolio(index, query);
+        if (!docs.length) {
+            const empty = getValueByPath(window.currentLocale, 'nav.searchEmpty') || (currentLang === 'ko' ? '검색 결과가 없습니다.' : 'No results found.');
+            list.innerHTML = '<li class="site-search-empty">' + escapeHtml(empty) + '</li>';
+        } else {
+            list.innerHTML = docs.map(([type, title, subtitle, href]) =>
+                '<li><a href="' + escapeHtml(href) + '" data-title="' + escapeHtml(title) + '">' +
+                '<span class="site-search-type">' + escapeHtml(index.types[type] || '') + '</span>' +
+                escapeHtml(title) +
+                (subtitle ? '<span class="site-search-sub">' + escapeHtml(subtitle) + '</span>' : '') +
+                '</a></li>').join('');
+        }
+        list.hidden = false;
+    };
+
+    input.addEventListener('focus', () => {
+        fetchSearchIndex(currentLang).catch(() => { });
+    });
+    input.addEventListener('input', render);
+    input.addEventListener('keydown', e => {
+        if (e.key === 'Escape') {
+            close();
+            input.blur();
+        } else if (e.key === 'Enter') {
+            const first = list.querySelector('a');
+            if (first) first.click();
+        }
+    });
+    list.addEventListener('click', e => {
+        const link = e.target.closest('a');
+        if (!link) return;
+        close();
+        input.value = '';
+        // Scroll to the matching project card, loading its page first when it is not on the page yet;
+        // other results (and a card that cannot be found) fall back to the section link
+        if (link.getAttribute('href') !== '#projects') return;
+        const title = link.getAttribute('data-title');
+        const card = findProjectCard(title);
+        if (card) {
+            e.preventDefault();
+            card.scrollIntoView({ behavior: 'smooth', block: 'center' });
+        } else if (loadProjectCard) {
+            e.preventDefault();
+            const section = document.getElementById('projects');
+            if (section) section.scrollIntoView({ behavior: 'smooth' });
+            loadProjectCard(title)
+                .catch(() => null)
+                .then(found => {
+                    if (found) found.scrollIntoView({ behavior: 'smooth', block: 'center' });
+                });
+        }
+    });
+    document.addEventListener('click', e => {
+        if (!e.target.closest('.site-search')) close();
+    });
+}
+
 // Initialize skill tooltips
 function initSkillTooltips() {
     // Prevent multiple initializations
@@ -353,6 +726,20 @@ function initializePage() {
             console.error('Error initializing project image lazy loading:', e);
         }
 
+        // Load the remaining project cards of a paginated page on scroll
+        try {
+            lazyLoadProjectPages();
+        } catch (e) {
+            console.error('Error initializing project card pagination:', e);
+        }
+
+        // Site search over the prebuilt index
+        try {
+            initSiteSearch();
+        } catch (e) {
+            console.error('Error initializing site search:', e);
+        }
+
         // Initialize TTS (wrapped in try-catch to prevent blocking)
         try {
             initTTS();
@@ -535,7 +922,7 @@ function initializePage() {
         const projectLinks = document.querySelectorAll('.project-link');
 
         // Open modal when project link is clicked
-        projectLinks.forEach(link => {
+        const bindProjectLink = link => {
             link.addEventListener('click', function (e) {
                 e.preventDefault();
                 const projectCard = this.closest('.project-card');
@@ -695,6 +1082,11 @@ function initializePage() {
                 modal.classList.add('active');
                 document.body.style.overflow = 'hidden';
             });
+        };
+        projectLinks.forEach(bindProjectLink);
+        // Cards appended later by lazyLoadProjectPages()
+        document.addEventListener('projectcardsloaded', e => {
+            e.detail.cards.forEach(card => card.querySelectorAll('.project-link').forEach(bindProjectLink));
         });
 
         // Close modal